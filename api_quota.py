@@ -0,0 +1,150 @@
+# api_quota.py
+"""
+Per-key, per-op LegiScan call accounting against a monthly budget.
+
+Every request that goes out through legiscan_client is counted in the
+api_usage table of bills.db, keyed by UTC month, a hash of the API key (the
+key itself is never stored) and op.  Counts are buffered in memory and
+flushed every _FLUSH_EVERY calls, on read, and at interpreter exit, so the
+hot fetch path doesn't open a write transaction per call.  Periodic flushes
+never wait on the database lock (the corpus writer may be mid-transaction);
+counts that can't be written yet stay buffered and are included in reads.
+Cache hits never reach the client and are not counted.
+"""
+from __future__ import annotations
+
+import atexit
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Optional
+
+import legiscan_client
+
+logger = logging.getLogger(__name__)
+
+# LegiScan's public API tier allows 30,000 queries per month.
+DEFAULT_MONTHLY_BUDGET = 30000
+
+_FLUSH_EVERY = 50
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS api_usage (
+    month    TEXT    NOT NULL,
+    key_hash TEXT    NOT NULL,
+    op       TEXT    NOT NULL,
+    calls    INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (month, key_hash, op)
+);
+"""
+
+_shared: dict[str, "ApiQuota"] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_quota(db_path: str, monthly_budget: int = DEFAULT_MONTHLY_BUDGET) -> "ApiQuota":
+    """
+    One tracker per database per process, registered once with
+    legiscan_client so corpus and scanner calls are counted exactly once.
+    """
+    path = os.path.abspath(db_path)
+    with _shared_lock:
+        quota = _shared.get(path)
+        if quota is None:
+            quota = _shared[path] = ApiQuota(path, monthly_budget)
+            legiscan_client.add_call_listener(quota.record_params)
+            atexit.register(quota.flush)
+        else:
+            quota.monthly_budget = monthly_budget
+        return quota
+
+
+def key_hash(api_key: str) -> str:
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+
+
+def current_month() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m")
+
+
+class ApiQuota:
+    def __init__(self, db_path: str, monthly_budget: int = DEFAULT_MONTHLY_BUDGET):
+        self.db_path = db_path
+        self.monthly_budget = monthly_budget
+        self._lock = threading.Lock()
+        self._pending: Counter = Counter()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executescript(_DDL)
+        except Exception as e:
+            logger.error(f"Failed to initialize api_usage table: {e}")
+
+    # ── Recording ─────────────────────────────────────────────────────────────
+
+    def record(self, api_key: str, op: str, n: int = 1) -> None:
+        with self._lock:
+            self._pending[(current_month(), key_hash(api_key), op or "?")] += n
+            due = sum(self._pending.values()) >= _FLUSH_EVERY
+        if due:
+            self.flush(wait=False)
+
+    def record_params(self, params: dict) -> None:
+        """legiscan_client listener: count one request by its key and op."""
+        self.record(params.get("key", ""), params.get("op", ""))
+
+    def flush(self, wait: bool = True) -> None:
+        """Persist buffered counts; with wait=False give up at once if bills.db is locked."""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+        if not pending:
+            return
+        conn = None
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=5 if wait else 0)
+            with conn:
+                conn.executemany(
+                    "INSERT INTO api_usage (month, key_hash, op, calls) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(month, key_hash, op) DO UPDATE SET calls = calls + excluded.calls",
+                    [(m, k, op, n) for (m, k, op), n in pending.items()],
+                )
+        except Exception as e:
+            if wait:
+                logger.error(f"Failed to persist API usage: {e}")
+            with self._lock:
+                self._pending.update(pending)
+        finally:
+            if conn is not None:
+                conn.close()
+
+    # ── Reporting ─────────────────────────────────────────────────────────────
+
+    def usage_by_op(self, api_key: str, month: Optional[str] = None) -> dict[str, int]:
+        month, kh = month or current_month(), key_hash(api_key)
+        self.flush(wait=False)
+        usage: Counter = Counter()
+        conn = None
+        try:
+            conn = sqlite3.connect(self.db_path)
+            usage.update(dict(conn.execute(
+                "SELECT op, calls FROM api_usage WHERE month=? AND key_hash=?", (month, kh)
+            ).fetchall()))
+        except Exception as e:
+            logger.error(f"Failed to read API usage: {e}")
+        finally:
+            if conn is not None:
+                conn.close()
+        with self._lock:
+            for (m, k, op), n in self._pending.items():
+                if m == month and k == kh:
+                    usage[op] += n
+        return dict(usage.most_common())
+
+    def used(self, api_key: str, month: Optional[str] = None) -> int:
+        return sum(self.usage_by_op(api_key, month).values())
+
+    def remaining(self, api_key: str) -> int:
+        return max(0, self.monthly_budget - self.used(api_key))
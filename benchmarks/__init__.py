@@ -0,0 +1,13 @@
+"""
+Offline performance benchmarks for the corpus pipeline.
+
+Generates a LegiScan-shaped synthetic corpus (mock_legiscan.SyntheticCorpus)
+at any scale, times the hot paths against it and writes the results as
+JSON, so a slowdown shows up as a diff between two runs:
+
+    python -m benchmarks.run --bills 10000 --out base.json
+    python -m benchmarks.run --bills 10000 --compare base.json
+
+No API key or network is needed; refresh runs against an in-process
+mock_legiscan server.
+"""
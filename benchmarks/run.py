@@ -0,0 +1,385 @@
+# benchmarks/run.py
+"""
+End-to-end benchmark of the corpus hot paths on a synthetic session.
+
+Cases (run in this order, each on the DB the previous ones built):
+  ingest          _ingest_zip of the session's dataset ZIP       → bills/s
+  refresh         refresh_session with --changes changed bills
+                  against an in-process mock server              → bills/s, calls
+  search          search_bills / count_bills with a set of
+                  typical filters, a keyset page mid-corpus and
+                  a memoized repeat                              → ms per query
+  people_mapping  sync_people_mapping on a synthetic roster      → people/s
+  roll_calls      get_roll_calls_for_bill on sampled bills       → ms per bill
+  votes           get_votes_for_legislator on mapped legislators → ms per call
+
+Every case records wall time, the process's peak RSS after the case and,
+with --trace-memory, the peak Python heap during it (tracemalloc slows
+everything down, so timings from such runs aren't comparable).
+
+    python -m benchmarks.run --bills 100000 --out bench.json
+    python -m benchmarks.run --bills 100000 --compare bench.json --threshold 0.2
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+try:
+    import resource
+except ImportError:    # Windows
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import legiscan_client
+import mock_legiscan
+from corpus_manager import CorpusManager
+from benchmarks.synthetic import staff_frame, write_dataset_zip
+
+logger = logging.getLogger(__name__)
+
+CASES = ["ingest", "refresh", "search", "people_mapping", "roll_calls", "votes"]
+
+STATE = "CA"
+
+
+# ── Measurement ────────────────────────────────────────────────────────────────
+
+def _max_rss_mb(who: int) -> Optional[float]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(who).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(rss / (1024 ** 2 if sys.platform == "darwin" else 1024), 1)
+
+
+def _measure(fn: Callable[[], dict], trace_memory: bool) -> dict:
+    """Run one case; its own metrics plus seconds and memory high-water marks."""
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    result = fn()
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    if trace_memory:
+        result["peak_py_mb"] = round(tracemalloc.get_traced_memory()[1] / 1024 ** 2, 1)
+        tracemalloc.stop()
+    if resource is not None:
+        result["max_rss_mb"] = _max_rss_mb(resource.RUSAGE_SELF)
+        result["max_rss_children_mb"] = _max_rss_mb(resource.RUSAGE_CHILDREN)
+    return result
+
+
+def _latencies(fn: Callable, args: list) -> dict:
+    """Call fn(*a) for each a; per-call latency percentiles in ms."""
+    ms = []
+    for a in args:
+        t = time.perf_counter()
+        fn(*a)
+        ms.append((time.perf_counter() - t) * 1000)
+    ms.sort()
+    return {
+        "calls": len(ms),
+        "p50_ms": round(statistics.median(ms), 3) if ms else None,
+        "p95_ms": round(ms[int(len(ms) * 0.95) - 1 if len(ms) > 1 else 0], 3) if ms else None,
+        "max_ms": round(ms[-1], 3) if ms else None,
+    }
+
+
+# ── Cases ──────────────────────────────────────────────────────────────────────
+
+def bench_ingest(corpus: CorpusManager, synth: mock_legiscan.SyntheticCorpus, workdir: str, bulk_load: bool) -> dict:
+    zip_path = os.path.join(workdir, "dataset.zip")
+    t = time.perf_counter()
+    counts = write_dataset_zip(synth, STATE, zip_path)
+    generate_s = time.perf_counter() - t
+
+    session_id = synth.session_id(STATE)
+    conn = corpus._get_conn()
+    conn.execute(
+        "INSERT OR IGNORE INTO sessions (session_id, jurisdiction, session_name, is_active) VALUES (?, ?, ?, 1)",
+        (session_id, STATE, "2025-2026 Regular Session"),
+    )
+    conn.commit()
+
+    stats: dict = {"new": 0, "updated": 0, "unchanged": 0, "errors": 0}
+    t = time.perf_counter()
+    with corpus._bulk_load_mode() if bulk_load else contextlib.nullcontext():
+        corpus._ingest_zip(zip_path, session_id, STATE, None, stats, skip_unchanged=True)
+    ingest_s = time.perf_counter() - t
+    return {
+        **counts,
+        "zip_mb": round(os.path.getsize(zip_path) / 1024 ** 2, 1),
+        "generate_s": round(generate_s, 3),
+        "ingest_s": round(ingest_s, 3),
+        "bills_per_s": round(counts["bills"] / max(ingest_s, 1e-9), 1),
+        "new": stats["new"],
+        "errors": stats["errors"],
+        "bulk_load": bulk_load,
+    }
+
+
+def bench_refresh(corpus: CorpusManager, synth: mock_legiscan.SyntheticCorpus, latency_ms: float) -> dict:
+    server, url = mock_legiscan.start_in_thread(
+        mock=mock_legiscan.MockLegiScan(synth, latency_ms=latency_ms, seed=synth.seed)
+    )
+    previous = legiscan_client.BASE_URL
+    legiscan_client.set_base_url(url)
+    try:
+        t = time.perf_counter()
+        stats = corpus.refresh_session(synth.session_id(STATE), STATE)
+        refresh_s = time.perf_counter() - t
+    finally:
+        legiscan_client.set_base_url(previous)
+        server.shutdown()
+        server.server_close()
+    changed = stats["new"] + stats["updated"]
+    return {
+        "changed": changed,
+        "skipped": stats["skipped"],
+        "errors": stats["errors"],
+        "api_calls": stats["api_calls"],
+        "mock_latency_ms": latency_ms,
+        "fetch_workers": corpus.fetch_workers,
+        "refresh_s": round(refresh_s, 3),
+        "bills_per_s": round(changed / max(refresh_s, 1e-9), 1),
+    }
+
+
+def bench_search(corpus: CorpusManager, repeat: int) -> dict:
+    sponsors = corpus.get_sponsor_options()[:3]
+    committees = corpus.get_committee_options()[:1]
+    subjects = corpus.get_subject_options()[:1]
+    queries = {
+        "no_filter":    {},
+        "text":         {"query": "water"},
+        "jurisdiction": {"jurisdiction_filter": ["California"]},
+        "status":       {"status_filter": ["2"]},
+        "sponsor":      {"sponsor_filter": sponsors},
+        "committee":    {"committee_filter": committees},
+        "subject":      {"subject_filter": subjects},
+        "combined":     {"query": "water", "jurisdiction_filter": ["CA"], "subject_filter": subjects},
+    }
+    result = {}
+    for name, kwargs in queries.items():
+        rows = len(corpus.search_bills(**kwargs))
+        result[name] = {"rows": rows, **_latencies(lambda kw=kwargs: corpus.search_bills(**kw), [()] * repeat)}
+        result[f"{name}_count"] = _latencies(lambda kw=kwargs: corpus.count_bills(**kw), [()] * repeat)
+
+    # Keyset paging: the cursor for the middle page, then that page alone.
+    total = corpus.count_bills()
+    mid = corpus.search_bills(limit=max(1, total // 2), order_by="status_date")
+    cursor = corpus.next_cursor(mid, "status_date")
+    result["middle_page"] = {
+        "offset": len(mid),
+        **_latencies(lambda: corpus.search_bills(limit=50, order_by="status_date", after=cursor), [()] * repeat),
+    }
+
+    # The same text query again with the read memo on (a rerun with no sync in between).
+    size, corpus.read_cache_size = corpus.read_cache_size, 64
+    try:
+        corpus.search_bills(**queries["text"])
+        result["text_memoized"] = _latencies(lambda: corpus.search_bills(**queries["text"]), [()] * repeat)
+    finally:
+        corpus.read_cache_size = size
+    return result
+
+
+def bench_people_mapping(corpus: CorpusManager, synth: mock_legiscan.SyntheticCorpus) -> dict:
+    staff = staff_frame(synth, STATE)
+    t = time.perf_counter()
+    stats = corpus.sync_people_mapping(staff)
+    mapping_s = time.perf_counter() - t
+    return {
+        **stats,
+        "staff_rows": len(staff),
+        "mapping_s": round(mapping_s, 3),
+        "people_per_s": round(stats["total"] / max(mapping_s, 1e-9), 1),
+    }
+
+
+def bench_roll_calls(corpus: CorpusManager, synth: mock_legiscan.SyntheticCorpus, samples: int) -> dict:
+    rnd = random.Random(synth.seed)
+    ids = list(synth.bill_ids(synth.session_id(STATE)))
+    picks = [(rnd.choice(ids),) for _ in range(samples)]
+    return _latencies(corpus.get_roll_calls_for_bill, picks)
+
+
+def bench_votes(corpus: CorpusManager, samples: int) -> dict:
+    staff_ids = [
+        r[0] for r in corpus._get_conn().execute(
+            "SELECT DISTINCT staff_legislator_id FROM people_mapping "
+            "WHERE staff_legislator_id IS NOT NULL ORDER BY staff_legislator_id LIMIT ?",
+            (samples,),
+        )
+    ]
+    if not staff_ids:
+        return {"calls": 0, "note": "no mapped legislators (run people_mapping first)"}
+    rows = len(corpus.get_votes_for_legislator(staff_ids[0]))
+    return {"rows_first": rows, **_latencies(corpus.get_votes_for_legislator, [(s,) for s in staff_ids])}
+
+
+# ── Reporting ──────────────────────────────────────────────────────────────────
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=10,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+
+def _flatten(d: dict, prefix: str = "") -> dict:
+    out = {}
+    for k, v in d.items():
+        key = f"{prefix}{k}"
+        if isinstance(v, dict):
+            out.update(_flatten(v, key + "."))
+        elif isinstance(v, (int, float)) and not isinstance(v, bool):
+            out[key] = v
+    return out
+
+
+def _lower_is_better(metric: str) -> Optional[bool]:
+    name = metric.rsplit(".", 1)[-1]
+    if name.endswith("_per_s"):
+        return False
+    if name == "seconds" or name.endswith(("_s", "_ms", "_mb")):
+        return True
+    return None    # counts etc. — not a performance metric
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Metrics that got worse than baseline by more than threshold (a fraction)."""
+    regressions = []
+    cur, base = _flatten(current["results"]), _flatten(baseline.get("results", {}))
+    for metric, value in sorted(cur.items()):
+        lower = _lower_is_better(metric)
+        old = base.get(metric)
+        if lower is None or not old or metric.endswith("mock_latency_ms"):
+            continue
+        change = (value - old) / old
+        worse = change > threshold if lower else -change > threshold
+        flag = "REGRESSION" if worse else ""
+        print(f"  {metric:45s} {old:>12} → {value:>12}  {change:+7.1%} {flag}")
+        if worse:
+            regressions.append(metric)
+    return regressions
+
+
+# ── Main ───────────────────────────────────────────────────────────────────────
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark corpus hot paths on a synthetic session")
+    parser.add_argument("--bills", type=int, default=10000, help="Bills in the synthetic session (1k–1M)")
+    parser.add_argument("--rollcalls", type=int, default=2, help="Roll calls per bill")
+    parser.add_argument("--people", type=int, default=120, help="Legislators in the session")
+    parser.add_argument("--changes", type=int, default=200, help="Bills changed since the dataset (refresh workload)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Mock API latency per call during refresh")
+    parser.add_argument("--fetch-workers", type=int, default=8)
+    parser.add_argument("--parse-workers", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per search filter")
+    parser.add_argument("--samples", type=int, default=200, help="Lookups for roll_calls / votes")
+    parser.add_argument("--bulk-load", action="store_true", help="Ingest in bulk-load mode")
+    parser.add_argument("--cases", default=",".join(CASES), help="Comma-separated subset of: " + ", ".join(CASES))
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workdir", help="Directory for the DB and ZIP (default: a temp dir, removed afterwards)")
+    parser.add_argument("--trace-memory", action="store_true", help="Record peak Python heap per case (slow)")
+    parser.add_argument("--out", help="Write results JSON here (default: benchmark_<bills>_<timestamp>.json)")
+    parser.add_argument("--compare", metavar="JSON", help="Baseline results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative slowdown that counts as a regression")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(message)s")
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    synth = mock_legiscan.SyntheticCorpus(
+        states=(STATE,), bills_per_session=args.bills, rollcalls_per_bill=args.rollcalls,
+        people_per_state=args.people, churn=args.changes / max(args.bills, 1), seed=args.seed,
+    )
+    workdir = args.workdir or tempfile.mkdtemp(prefix="legiscan_bench_")
+    os.makedirs(workdir, exist_ok=True)
+    db_path = os.path.join(workdir, "bills.db")
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
+    corpus = CorpusManager(
+        db_path, "benchmark", rate_limit_s=0, parse_workers=args.parse_workers,
+        fetch_workers=args.fetch_workers,
+        dataset_cache_dir=os.path.join(workdir, "dataset_cache"),
+        response_cache_path=os.path.join(workdir, f"response_cache_{os.getpid()}.db"),
+        # Time the queries themselves; bench_search measures the memo separately.
+        read_cache_size=0,
+    )
+    runners: dict[str, Callable[[], dict]] = {
+        "ingest":         lambda: bench_ingest(corpus, synth, workdir, args.bulk_load),
+        "refresh":        lambda: bench_refresh(corpus, synth, args.latency_ms),
+        "search":         lambda: bench_search(corpus, args.repeat),
+        "people_mapping": lambda: bench_people_mapping(corpus, synth),
+        "roll_calls":     lambda: bench_roll_calls(corpus, synth, args.samples),
+        "votes":          lambda: bench_votes(corpus, args.samples),
+    }
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "sqlite": sqlite3.sqlite_version,
+            "params": {k: v for k, v in vars(args).items() if k not in ("out", "compare", "workdir")},
+        },
+        "results": {},
+    }
+    try:
+        for case in CASES:
+            if case not in cases:
+                continue
+            print(f"▶ {case}…", flush=True)
+            report["results"][case] = _measure(runners[case], args.trace_memory)
+            print(json.dumps(report["results"][case], indent=2))
+    finally:
+        corpus.quota.flush()
+        corpus.close()
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    out = args.out or f"benchmark_{args.bills}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {out}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"Compared with {args.compare} ({baseline.get('meta', {}).get('git_commit', '?')}):")
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/synthetic.py
+"""
+Synthetic inputs for the benchmarks, built on mock_legiscan.SyntheticCorpus:
+dataset ZIPs streamed straight to disk (so 1M-bill sessions don't have to
+fit in memory) and a staff roster for sync_people_mapping.
+"""
+from __future__ import annotations
+
+import json
+import zipfile
+
+import pandas as pd
+
+from mock_legiscan import SyntheticCorpus
+
+
+def write_dataset_zip(corpus: SyntheticCorpus, state: str, path: str) -> dict:
+    """
+    Write the getDataset ZIP of state's session to path, one member at a
+    time, in the layout LegiScan uses (<ST>/<session>/{bill,vote,people}/).
+    Bills carry their dataset-time change_hash.  Returns member counts.
+    """
+    session_id = corpus.session_id(state)
+    root = f"{state}/2025-2026_Regular_Session"
+    counts = {"bills": 0, "votes": 0, "people": 0}
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for pid in corpus.people_ids(state):
+            zf.writestr(f"{root}/people/{pid}.json", json.dumps({"person": corpus.person(pid)}))
+            counts["people"] += 1
+        for bid in corpus.bill_ids(session_id):
+            bill = corpus.bill(bid, current=False)
+            zf.writestr(f"{root}/bill/{bill['bill_number']}.json", json.dumps({"bill": bill}))
+            counts["bills"] += 1
+            for v in bill["votes"]:
+                rc = corpus.roll_call(v["roll_call_id"])
+                zf.writestr(f"{root}/vote/{rc['roll_call_id']}.json", json.dumps({"roll_call": rc}))
+                counts["votes"] += 1
+    return counts
+
+
+def staff_frame(corpus: SyntheticCorpus, state: str, match_fraction: float = 0.8) -> pd.DataFrame:
+    """
+    A staff_manager-style roster (legislator_id, first_name, last_name,
+    chamber) covering match_fraction of the state's legislators, plus as
+    many staffers who match nobody.
+    """
+    people = [corpus.person(pid) for pid in corpus.people_ids(state)]
+    n_match = int(len(people) * match_fraction)
+    rows = [
+        {
+            "legislator_id": f"L{p['people_id']}",
+            "first_name": p["first_name"],
+            "last_name": p["last_name"],
+            "chamber": "upper" if p["role"] == "Sen" else "lower",
+        }
+        for p in people[:n_match]
+    ]
+    rows += [
+        {"legislator_id": f"X{i}", "first_name": f"Staff{i}", "last_name": f"Nomatch{i}", "chamber": "lower"}
+        for i in range(n_match)
+    ]
+    return pd.DataFrame(rows)
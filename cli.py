@@ -1,22 +1,42 @@
 import argparse
+import json
 import logging
 import os
 import sys
 
-from config import DATA_DIR, API_KEY
-from corpus_manager import _CorpusManager, _CORPUS_AVAILABLE, US_STATES
+from config import DATA_DIR, API_KEY, API_MONTHLY_BUDGET
+from legiscanner import US_STATES
 from job_manager import JobManager
-from job_runner import run_bootstrap_job, run_refresh_job, run_rescan_job
+from job_runner import run_bootstrap_job, run_bootstrap_many_job, run_refresh_job, run_refresh_all_job, run_rescan_job, run_sync_job
+from legiscanner import load_keywords
+
+try:
+    from corpus_manager import CorpusManager as _CorpusManager
+    _CORPUS_AVAILABLE = True
+except ImportError:
+    _CORPUS_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
+def _print_plan(plans):
+    for plan in plans if isinstance(plans, list) else [plans]:
+        print(json.dumps(plan, indent=2))
+        if plan.get("path"):
+            print(f"Path: {plan['path']} — {plan['path_reason']}")
+        if plan.get("suggestion"):
+            print(f"Suggestion: {plan['suggestion']['task']} — {plan['suggestion']['reason']}")
+
 def main():
     parser = argparse.ArgumentParser(description="Headless Task Runner for Legiscan Updater")
-    parser.add_argument("--task", type=str, required=True, choices=["bootstrap", "refresh", "rescan"], help="The pipeline job to execute")
-    parser.add_argument("--session-id", type=int, help="Target session ID for bootstrap/refresh")
-    parser.add_argument("--jurisdiction", type=str, help="Target jurisdiction code for bootstrap/refresh (e.g. CA, US)")
+    parser.add_argument("--task", type=str, required=True, choices=["bootstrap", "refresh", "sync", "rescan"], help="The pipeline job to execute")
+    parser.add_argument("--session-id", type=int, help="Target session ID for bootstrap/refresh/sync")
+    parser.add_argument("--jurisdiction", type=str, help="Target jurisdiction code for bootstrap/refresh/sync (e.g. CA, US). Bootstrap also accepts a comma list or ALL")
     parser.add_argument("--states", type=str, help="Comma-separated state codes for rescan (e.g., CA,NY,US)")
+    parser.add_argument("--bulk-load", action="store_true", help="Bootstrap only: fast cold load (defer indexes/FK checks, relaxed fsync)")
+    parser.add_argument("--plan", action="store_true", help="Print the estimated API cost and budget check for the task, then exit")
+    parser.add_argument("--all-active", action="store_true", help="Refresh only: refresh every active cached session in one job")
+    parser.add_argument("--max-downloads", type=int, default=4, help="Bootstrap only: concurrent dataset downloads for multi-session runs")
     
     args = parser.parse_args()
     
@@ -26,22 +46,74 @@ def main():
         
     job_db_path = os.path.join(DATA_DIR, "jobs.db")
     job_manager = JobManager(job_db_path)
-    corpus = _CorpusManager(os.path.join(DATA_DIR, "bills.db"), API_KEY)
+    corpus = _CorpusManager(os.path.join(DATA_DIR, "bills.db"), API_KEY, api_monthly_budget=API_MONTHLY_BUDGET)
     
     try:
         if args.task == "bootstrap":
-            if not args.session_id or not args.jurisdiction:
-                logger.error("--session-id and --jurisdiction required for bootstrap")
+            if not args.jurisdiction:
+                logger.error("--jurisdiction required for bootstrap")
                 sys.exit(1)
-            logger.info(f"Running Bootstrap for {args.jurisdiction} ({args.session_id})")
-            run_bootstrap_job(corpus, args.session_id, args.jurisdiction, job_manager)
+            jurisdictions = [j.strip().upper() for j in args.jurisdiction.split(",") if j.strip()]
+            if "ALL" in jurisdictions:
+                jurisdictions = list(US_STATES.keys()) + ["US"]
+            if args.session_id and len(jurisdictions) == 1:
+                if args.plan:
+                    _print_plan(corpus.plan_bootstrap(args.session_id, jurisdictions[0]))
+                    return
+                logger.info(f"Running Bootstrap for {jurisdictions[0]} ({args.session_id})")
+                run_bootstrap_job(corpus, args.session_id, jurisdictions[0], job_manager, bulk_load=args.bulk_load)
+            else:
+                if args.session_id:
+                    logger.warning("--session-id ignored for multi-jurisdiction bootstrap; using newest session per jurisdiction")
+                if args.plan:
+                    # Newest cached session per jurisdiction, so planning spends nothing.
+                    targets, uncached = [], []
+                    for jur in jurisdictions:
+                        sessions = corpus.get_cached_sessions(jur)
+                        if sessions: targets.append((jur, sessions[0]["session_id"]))
+                        else: uncached.append(jur)
+                    _print_plan([corpus.plan_bootstrap(sid, jur) for jur, sid in targets])
+                    print("Session lookup: the run takes the newest dataset per jurisdiction from one "
+                          "getDatasetList call, shared by all targets (the estimates above count one each)")
+                    if uncached:
+                        print(f"No cached sessions for {', '.join(uncached)}; their bootstrap cost is not estimated")
+                    return
+                # Newest dataset per jurisdiction from one getDatasetList call,
+                # which bootstrap_many then reuses.
+                targets, datasets = corpus.newest_datasets(jurisdictions)
+                logger.info(f"Running Bootstrap for {len(targets)} sessions across {len(jurisdictions)} jurisdictions")
+                run_bootstrap_many_job(corpus, targets, job_manager, bulk_load=args.bulk_load, max_downloads=args.max_downloads, initiated_by="cli", datasets=datasets)
             
+        elif args.task == "refresh" and args.all_active:
+            if args.plan:
+                sessions = [s for s in corpus.get_cached_sessions() if s.get("is_active")]
+                _print_plan([
+                    corpus.plan_refresh(sid, s["jurisdiction"], masterlist=data)
+                    for s, (sid, data) in zip(sessions, corpus.prefetch_masterlists([s["session_id"] for s in sessions]))
+                ])
+                return
+            logger.info("Running Incremental Refresh for all active sessions")
+            run_refresh_all_job(corpus, job_manager, initiated_by="cli")
+
         elif args.task == "refresh":
             if not args.session_id or not args.jurisdiction:
                 logger.error("--session-id and --jurisdiction required for refresh")
                 sys.exit(1)
+            if args.plan:
+                _print_plan(corpus.plan_refresh(args.session_id, args.jurisdiction))
+                return
             logger.info(f"Running Incremental Refresh for {args.jurisdiction} ({args.session_id})")
             run_refresh_job(corpus, args.session_id, args.jurisdiction, job_manager)
+
+        elif args.task == "sync":
+            if not args.session_id or not args.jurisdiction:
+                logger.error("--session-id and --jurisdiction required for sync")
+                sys.exit(1)
+            if args.plan:
+                _print_plan(corpus.plan_sync(args.session_id, args.jurisdiction))
+                return
+            logger.info(f"Running Sync for {args.jurisdiction} ({args.session_id})")
+            run_sync_job(corpus, args.session_id, args.jurisdiction, job_manager, initiated_by="cli")
             
         elif args.task == "rescan":
             states = [s.strip() for s in args.states.split(",")] if args.states else ["California", "US"]
@@ -61,6 +133,9 @@ def main():
                 else: logger.warning(f"Unknown state arg: {s}")
                 
             resolved_states = list(set(resolved_states))
+            if args.plan:
+                _print_plan(corpus.plan_rescan(resolved_states, len(load_keywords())))
+                return
             logger.info(f"Running Keyword Rescan for states: {resolved_states}")
             run_rescan_job(corpus, resolved_states, DATA_DIR, job_manager, initiated_by="cli")
             
@@ -11,6 +11,10 @@ with open(cfg_path, 'r', encoding='utf-8') as f:
 REPO_DIR = os.environ.get("REPO_DIR", os.path.expandvars(cfg.get("repo_dir", "")))
 DATA_DIR = os.environ.get("DATA_DIR", os.path.expandvars(cfg.get("data_dir", "")))
 API_KEY  = os.environ.get("API_KEY", cfg.get("api_key", ""))
+# LegiScan API endpoint override (e.g. a local mock_legiscan.py server); empty = the real API
+LEGISCAN_BASE_URL = os.environ.get("LEGISCAN_BASE_URL", cfg.get("legiscan_base_url", ""))
+# Monthly LegiScan query cap the sync planner budgets against
+API_MONTHLY_BUDGET = int(os.environ.get("API_MONTHLY_BUDGET", cfg.get("api_monthly_budget", 30000)))
 
 # Ensure directories exist
 if REPO_DIR:
@@ -9,8 +9,11 @@ Layer A  (this module):
 
   Bootstrap strategy:
     1. getDatasetList  → obtain access_key for session  (1 API call)
+       (skip entirely if dataset_hash matches the last ingested one)
     2. getDataset      → download bulk ZIP with all bill JSONs  (1 API call)
+       (ZIPs are kept in DATA_DIR/dataset_cache, keyed by dataset_hash)
     3. Parse ZIP locally → upsert into bills table  (0 additional calls)
+       (process-pool JSON parsing feeding a single batched SQLite writer)
     Fallback: if getDataset unavailable, use getMasterListRaw + getBill per bill.
 
   Incremental refresh strategy:
@@ -18,6 +21,16 @@ Layer A  (this module):
     2. Compare hashes with local DB
     3. getBill only for new or changed bills  (N calls, typically <50/week)
 
+  sync_session picks whichever of the two is cheaper for a session: a large
+  masterlist diff is cheaper to take from a new dataset ZIP (then refreshed),
+  a small one from getBill.
+
+  Read methods the app calls on every rerun (search_bills, count_bills,
+  get_bills_by_ids, get_corpus_stats, get_roll_calls_for_bill, the filter
+  option lists) are memoized in a small LRU.  Every write commit bumps
+  data_generation in sync_meta and the memo is dropped when it moves, so
+  repeated reads between syncs cost one sync_meta lookup and are never stale.
+
 Layer B  (legiscanner.py):
   Existing keyword-based scan, unchanged.
   Bills discovered there are also recorded in keyword_matches table here.
@@ -29,10 +42,20 @@ Public API
     .get_cached_sessions(jurisdiction=None)     → list[dict]   (local only)
     .get_dataset_list(jurisdiction)             → list[dict]   (API call)
     .bootstrap_session(session_id, jur, …)      → stats dict
+    .bootstrap_many([(jur, session_id), …], …)  → stats dict
+    .rebuild_from_dataset_cache()               → stats dict   (local only)
     .refresh_session(session_id, jur, …)        → stats dict
+    .prefetch_masterlists([session_id, …])      → iterator     (API calls, overlapped)
+    .sync_session(session_id, jur, …)           → stats dict   (cheaper of the two)
     .record_keyword_match(bill_id, keyword)     → None
     .get_keyword_matches(bill_id)               → list[str]
     .search_bills(query, jur_filter, …)         → pd.DataFrame
+    .search_bills(…, order_by, after=cursor)    → pd.DataFrame (next keyset page)
+    .count_bills(BillFilter(…))                 → int
+    .sync_bill_notes(username, notes)           → bool         (notes JSON → SQL mirror)
+    .next_cursor(page_df, order_by)             → tuple | None
+    .get_bills_by_sponsor(people_ids)           → pd.DataFrame
+    .get_recent_actions(since, jur_filter)      → list[dict]
     .get_corpus_stats()                         → dict
     .get_all_session_jurisdictions()            → list[str]
     .close()
@@ -44,33 +67,103 @@ all existing _render_bill_expander() / filter / export code works unchanged.
 from __future__ import annotations
 
 import base64
+import contextlib
+import contextvars
+import copy
+import functools
+import hashlib
 import io
+import itertools
 import json
 import logging
+import math
+import operator
 import os
+import queue
+import re
+import socket
 import sqlite3
+import tempfile
+import threading
 import time
 import zipfile
-from datetime import datetime, timezone
-from typing import Callable, Optional
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, timezone
+from typing import IO, Callable, Iterable, Iterator, Optional, Union
 
-import requests
 import pandas as pd
 
+import legiscan_client
+from dataset_cache import DatasetCache
+from api_quota import DEFAULT_MONTHLY_BUDGET, shared_quota
+from response_cache import shared_cache
+
 logger = logging.getLogger(__name__)
 
 # ── Constants ──────────────────────────────────────────────────────────────────
 SCHEMA_VERSION = "1"
-BASE_URL        = "https://api.legiscan.com/"
+BASE_URL        = legiscan_client.BASE_URL
 
 CHAMBER_MAP = {"A": "Assembly", "S": "Senate", "H": "House"}
 
+# getDataset streaming: read the HTTP body in 1 MiB chunks and keep up to
+# 32 MiB of decoded ZIP in memory before the spool rolls over to disk.
+_DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+_ZIP_SPOOL_MAX_BYTES  = 32 * 1024 * 1024
+
+# ZIP ingest pipeline: members are parsed in batches (one SQLite transaction
+# per batch) and at most this many parsed batches wait for the writer.
+# Small datasets are parsed in-process; a worker pool isn't worth spawning.
+_INGEST_BATCH_FILES       = 100
+_INGEST_QUEUE_BATCHES     = 8
+_PARALLEL_PARSE_MIN_FILES = 500
+
+# Cost planning: a masterlist fetched by plan_refresh is reused by the refresh
+# that follows within this window, and refreshes estimated above this many
+# per-bill calls get a getDataset re-bootstrap (2 calls) suggested instead.
+_MASTERLIST_REUSE_S    = 600
+_DATASET_SUGGEST_ABOVE = 200
+
+# Stay under SQLite's default host-parameter limit (999 before 3.32).
+_SQLITE_MAX_VARS = 900
+
+# Columns written by the bulk bill upsert, in _flatten_bill_to_row key order.
+_BILL_COLUMNS = (
+    "bill_id", "session_id", "jurisdiction", "bill_number", "title",
+    "description", "status_date", "status_stage", "url", "committee",
+    "sponsor_names", "subjects", "history", "last_action",
+    "last_action_date", "referrals", "change_hash", "latest_doc_id",
+    "latest_doc_url", "last_fetched",
+)
+_bill_params = operator.itemgetter(*_BILL_COLUMNS)
+_UPSERT_BILLS_SQL = (
+    f"INSERT INTO bills ({', '.join(_BILL_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_BILL_COLUMNS))}) "
+    "ON CONFLICT(bill_id) DO UPDATE SET "
+    + ", ".join(
+        f"{c}=COALESCE(NULLIF(excluded.{c}, ''), bills.{c})" if c in ("latest_doc_id", "latest_doc_url")
+        else f"{c}=excluded.{c}"
+        for c in _BILL_COLUMNS[1:]
+    )
+)
+
 # Friendly names for supported jurisdictions
 JURISDICTION_LABELS = {
     "CA": "California",
     "US": "U.S. Congress",
 }
 
+# LegiScan state_id → jurisdiction code (getDatasetList entries carry only the id)
+LEGISCAN_STATE_CODES = dict(enumerate((
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL",
+    "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT",
+    "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI",
+    "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY", "DC", "US",
+), start=1))
+
 # ── Safe field-flattening helper (mirrors legiscanner._safe_join_list) ─────────
 def _safe_join_list(items, key: Optional[str] = None, sep: str = "; ") -> str:
     """Safely join a list that may contain strings OR dicts."""
@@ -91,17 +184,31 @@ def _flatten_bill_to_row(details: dict, jurisdiction: str, session_id: int) -> d
     committee_info = details.get("committee")
     committee = committee_info.get("name", "") if isinstance(committee_info, dict) else ""
 
+    bill_id = int(details.get("bill_id", 0))
+
     sponsors_raw = details.get("sponsors", [])
     sponsor_names = _safe_join_list(sponsors_raw, key="name", sep=", ")
+    sponsor_rows = [
+        (bill_id, n, sp.get("people_id") or None, sp.get("name", ""), sp.get("party", ""),
+         sp.get("sponsor_type_id"))
+        for n, sp in enumerate(sponsors_raw or []) if isinstance(sp, dict)
+    ]
+    subject_rows = [
+        (bill_id, sj.get("subject_id"), sj["subject_name"])
+        for sj in (details.get("subjects", []) or [])
+        if isinstance(sj, dict) and sj.get("subject_name")
+    ]
 
     history_raw = details.get("history", [])
     hist_list: list[str] = []
+    history_rows: list[tuple] = []
     for h in (history_raw if isinstance(history_raw, list) else []):
         if isinstance(h, dict):
             ch = CHAMBER_MAP.get(h.get("chamber", ""), h.get("chamber", ""))
             action = h.get("action", "").replace("\n", " ")
             date   = h.get("date", "")
             hist_list.append(f"{ch}: {action} ({date})")
+            history_rows.append((bill_id, len(history_rows), date, ch, action))
         else:
             hist_list.append(str(h))
 
@@ -126,7 +233,7 @@ def _flatten_bill_to_row(details: dict, jurisdiction: str, session_id: int) -> d
         latest_doc_url = latest.get("url", "")
 
     return {
-        "bill_id":          int(details.get("bill_id", 0)),
+        "bill_id":          bill_id,
         "session_id":       session_id,
         "jurisdiction":     jurisdiction,
         "bill_number":      details.get("bill_number", ""),
@@ -146,9 +253,139 @@ def _flatten_bill_to_row(details: dict, jurisdiction: str, session_id: int) -> d
         "latest_doc_id":    latest_doc_id,
         "latest_doc_url":   latest_doc_url,
         "last_fetched":     datetime.now(timezone.utc).isoformat(),
+        # Normalized child rows for bill_sponsors / bill_subjects / bill_history
+        "children": {
+            "sponsors": sponsor_rows,
+            "subjects": subject_rows,
+            "history":  history_rows,
+        },
     }
 
 
+# ── ZIP member parsing (runs in worker processes during bootstrap) ─────────────
+# {bill_id: change_hash} already in bills.db for the session being ingested;
+# installed once per worker process by _init_parse_worker.
+_known_hashes: dict[int, str] = {}
+
+
+def _init_parse_worker(known_hashes: dict[int, str]) -> None:
+    global _known_hashes
+    _known_hashes = known_hashes
+
+
+def _parse_zip_members(
+    kind: str,
+    members: list[bytes],
+    jurisdiction: str,
+    session_id: int,
+    known_hashes: Optional[dict[int, str]] = None,
+) -> tuple[list[dict], int]:
+    """
+    JSON-decode one batch of dataset ZIP members of the same ``kind``
+    ("person", "bill" or "vote") and flatten bills.
+
+    Module-level and free of DB state so it can run in a ProcessPoolExecutor.
+    Bills whose change_hash matches ``known_hashes`` (default: the worker's
+    preloaded map) are not flattened and come back as ``{"unchanged": id}``.
+    Returns ``(records, errors)``; members without an id are dropped, and
+    only undecodable bill files count as errors (matching the serial ingest).
+    """
+    known = _known_hashes if known_hashes is None else known_hashes
+    records: list[dict] = []
+    errors = 0
+    for raw in members:
+        try:
+            doc = json.loads(raw)
+        except Exception:
+            if kind == "bill":
+                errors += 1
+            continue
+
+        if kind == "person":
+            p = doc.get("person", doc)
+            if p.get("people_id"):
+                records.append({"person": p})
+        elif kind == "bill":
+            bill_data = doc.get("bill", doc)
+            bill_id = bill_data.get("bill_id")
+            if not bill_id:
+                continue
+            change_hash = bill_data.get("change_hash")
+            if change_hash and known.get(int(bill_id)) == change_hash:
+                records.append({"unchanged": int(bill_id)})
+                continue
+            records.append({
+                "row":      _flatten_bill_to_row(bill_data, jurisdiction, session_id),
+                "sponsors": [sp for sp in bill_data.get("sponsors", []) if sp.get("people_id")],
+                "votes":    bill_data.get("votes", []),
+            })
+        else:
+            r = doc.get("roll_call", doc)
+            if r.get("roll_call_id") and r.get("bill_id"):
+                records.append({"roll_call": r})
+    return records, errors
+
+
+# ── Streaming base64 field extraction (getDataset) ─────────────────────────────
+def _stream_b64_field(
+    chunks: Iterable[bytes], field: str, out: IO[bytes]
+) -> tuple[bytes, int]:
+    """
+    Decode the base64 string value of ``field`` from a streamed JSON body.
+
+    The decoded bytes are written to ``out`` as they arrive, so the encoded
+    and decoded payloads are never held in memory at once.  Returns
+    ``(envelope, n_bytes)`` where ``envelope`` is the JSON document with the
+    field's value blanked out (small enough to ``json.loads``) and
+    ``n_bytes`` is the number of decoded bytes written.
+    """
+    marker = re.compile(rb'"' + re.escape(field.encode()) + rb'"\s*:\s*"')
+    envelope = bytearray()
+    pending  = b""           # undecoded base64 carried over (< 4 chars)
+    in_value = False
+    done     = False
+    written  = 0
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if done:
+            envelope += chunk
+            continue
+        data = chunk
+        if not in_value:
+            envelope += data
+            m = marker.search(envelope)
+            if not m:
+                continue
+            data = bytes(envelope[m.end():])
+            del envelope[m.end():]
+            in_value = True
+
+        # JSON encoders may escape "/" as "\/"; base64 never contains '"'.
+        data = pending + data
+        end = data.find(b'"')
+        if end != -1:
+            envelope += data[end:]
+            data = data[:end]
+            done = True
+        elif data.endswith(b"\\"):
+            data, pending = data[:-1], b"\\"
+        else:
+            pending = b""
+        data = data.replace(b"\\/", b"/")
+
+        if not done:
+            cut = len(data) - len(data) % 4
+            data, pending = data[:cut], data[cut:] + pending
+        if data:
+            decoded = base64.b64decode(data)
+            out.write(decoded)
+            written += len(decoded)
+
+    return bytes(envelope), written
+
+
 # ── DDL ────────────────────────────────────────────────────────────────────────
 _DDL = """
 CREATE TABLE IF NOT EXISTS sync_meta (
@@ -192,6 +429,37 @@ CREATE TABLE IF NOT EXISTS bills (
     FOREIGN KEY (session_id) REFERENCES sessions(session_id)
 );
 
+-- Normalized children of bills, rewritten with their bill on every upsert.
+-- The flat sponsor_names / subjects / history columns are kept for display.
+CREATE TABLE IF NOT EXISTS bill_sponsors (
+    bill_id         INTEGER NOT NULL,
+    sponsor_order   INTEGER NOT NULL,
+    people_id       INTEGER,
+    name            TEXT,
+    party           TEXT,
+    sponsor_type_id INTEGER,
+    PRIMARY KEY (bill_id, sponsor_order),
+    FOREIGN KEY (bill_id) REFERENCES bills(bill_id)
+);
+
+CREATE TABLE IF NOT EXISTS bill_subjects (
+    bill_id      INTEGER NOT NULL,
+    subject_id   INTEGER,
+    subject_name TEXT    NOT NULL,
+    PRIMARY KEY (bill_id, subject_name),
+    FOREIGN KEY (bill_id) REFERENCES bills(bill_id)
+);
+
+CREATE TABLE IF NOT EXISTS bill_history (
+    bill_id  INTEGER NOT NULL,
+    seq      INTEGER NOT NULL,
+    date     TEXT,
+    chamber  TEXT,
+    action   TEXT,
+    PRIMARY KEY (bill_id, seq),
+    FOREIGN KEY (bill_id) REFERENCES bills(bill_id)
+);
+
 CREATE TABLE IF NOT EXISTS bill_texts (
     doc_id          INTEGER PRIMARY KEY,
     bill_id         INTEGER NOT NULL,
@@ -202,17 +470,45 @@ CREATE TABLE IF NOT EXISTS bill_texts (
     FOREIGN KEY (bill_id) REFERENCES bills(bill_id)
 );
 
-CREATE INDEX IF NOT EXISTS idx_bills_jurisdiction ON bills(jurisdiction);
-CREATE INDEX IF NOT EXISTS idx_bills_number       ON bills(bill_number);
-CREATE INDEX IF NOT EXISTS idx_bills_status       ON bills(status_stage);
-CREATE INDEX IF NOT EXISTS idx_bills_session      ON bills(session_id);
-
 CREATE TABLE IF NOT EXISTS keyword_matches (
     bill_id    INTEGER  NOT NULL,
     keyword    TEXT     NOT NULL,
     matched_at TEXT,
     PRIMARY KEY (bill_id, keyword)
 );
+CREATE INDEX IF NOT EXISTS idx_keyword_matches_keyword ON keyword_matches(keyword, bill_id);
+
+-- One row per matched bill with its keywords '; '-joined (the search_bills
+-- keyword column), maintained from keyword_matches by the triggers below.
+CREATE TABLE IF NOT EXISTS bill_keywords (
+    bill_id  INTEGER PRIMARY KEY,
+    keywords TEXT    NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS bill_keywords_ai AFTER INSERT ON keyword_matches BEGIN
+    INSERT INTO bill_keywords (bill_id, keywords) VALUES (new.bill_id, new.keyword)
+    ON CONFLICT(bill_id) DO UPDATE SET keywords = keywords || '; ' || excluded.keywords;
+END;
+CREATE TRIGGER IF NOT EXISTS bill_keywords_ad AFTER DELETE ON keyword_matches BEGIN
+    DELETE FROM bill_keywords WHERE bill_id = old.bill_id;
+    INSERT INTO bill_keywords (bill_id, keywords)
+    SELECT bill_id, GROUP_CONCAT(keyword, '; ') FROM (
+        SELECT bill_id, keyword FROM keyword_matches
+        WHERE bill_id = old.bill_id ORDER BY matched_at, keyword
+    ) GROUP BY bill_id;
+END;
+
+-- Mirror of each user's bill_notes.json (position / priority per bill) so
+-- search filters on them are index lookups; see sync_bill_notes().
+CREATE TABLE IF NOT EXISTS bill_notes (
+    username      TEXT    NOT NULL,
+    bill_id       INTEGER NOT NULL,
+    position      TEXT,
+    priority      TEXT,
+    last_reviewed TEXT,
+    PRIMARY KEY (username, bill_id)
+);
+CREATE INDEX IF NOT EXISTS idx_bill_notes_position ON bill_notes(username, position);
+CREATE INDEX IF NOT EXISTS idx_bill_notes_priority ON bill_notes(username, priority);
 
 CREATE TABLE IF NOT EXISTS roll_calls (
     roll_call_id INTEGER PRIMARY KEY,
@@ -262,6 +558,335 @@ CREATE TABLE IF NOT EXISTS people_mapping (
 );
 """
 
+# Secondary indexes on bills and its child tables; kept separate from _DDL so
+# bulk-load mode can drop them for the duration of a cold load and rebuild
+# them afterwards.
+_BILL_INDEX_DDL = """
+CREATE INDEX IF NOT EXISTS idx_bills_jurisdiction ON bills(jurisdiction);
+CREATE INDEX IF NOT EXISTS idx_bills_number       ON bills(bill_number);
+CREATE INDEX IF NOT EXISTS idx_bills_status       ON bills(status_stage);
+CREATE INDEX IF NOT EXISTS idx_bills_session      ON bills(session_id);
+CREATE INDEX IF NOT EXISTS idx_bills_committee    ON bills(committee);
+CREATE INDEX IF NOT EXISTS idx_bills_recent       ON bills(status_date DESC, bill_number, bill_id);
+CREATE INDEX IF NOT EXISTS idx_bills_last_action  ON bills(last_action_date DESC, bill_id);
+CREATE INDEX IF NOT EXISTS idx_sponsors_people    ON bill_sponsors(people_id);
+CREATE INDEX IF NOT EXISTS idx_sponsors_name      ON bill_sponsors(name);
+CREATE INDEX IF NOT EXISTS idx_subjects_name      ON bill_subjects(subject_name);
+CREATE INDEX IF NOT EXISTS idx_history_date       ON bill_history(date);
+"""
+_BILL_INDEX_NAMES = re.findall(r"CREATE INDEX IF NOT EXISTS (\w+)", _BILL_INDEX_DDL)
+
+# The bulk_load_started marker names its owner (host, pid) and is refreshed
+# every _BULK_HEARTBEAT_S.  Another CorpusManager treats the load as crashed
+# only when that pid is gone (same host, POSIX) or the heartbeat is older
+# than _BULK_STALE_S; the stale window covers index and FTS rebuilds, during
+# which the heartbeat can't get the write lock.
+_BULK_HEARTBEAT_S = 60
+_BULK_STALE_S     = 600
+
+# ── Full-text index over bills (FTS5, external content) ────────────────────────
+# Rows are kept in step by triggers; bulk-load mode drops the triggers and
+# rebuilds the index once at the end.  The rank weights favour bill_number and
+# title over the long description.
+_FTS_DDL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS bills_fts USING fts5(
+    bill_number, title, description, sponsor_names, subjects,
+    content='bills', content_rowid='bill_id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+"""
+_FTS_RANK = "bm25(10.0, 5.0, 1.0, 2.0, 2.0)"
+_FTS_TRIGGER_DDL = """
+CREATE TRIGGER IF NOT EXISTS bills_fts_ai AFTER INSERT ON bills BEGIN
+    INSERT INTO bills_fts (rowid, bill_number, title, description, sponsor_names, subjects)
+    VALUES (new.bill_id, new.bill_number, new.title, new.description, new.sponsor_names, new.subjects);
+END;
+CREATE TRIGGER IF NOT EXISTS bills_fts_ad AFTER DELETE ON bills BEGIN
+    INSERT INTO bills_fts (bills_fts, rowid, bill_number, title, description, sponsor_names, subjects)
+    VALUES ('delete', old.bill_id, old.bill_number, old.title, old.description, old.sponsor_names, old.subjects);
+END;
+CREATE TRIGGER IF NOT EXISTS bills_fts_au
+AFTER UPDATE OF bill_number, title, description, sponsor_names, subjects ON bills BEGIN
+    INSERT INTO bills_fts (bills_fts, rowid, bill_number, title, description, sponsor_names, subjects)
+    VALUES ('delete', old.bill_id, old.bill_number, old.title, old.description, old.sponsor_names, old.subjects);
+    INSERT INTO bills_fts (rowid, bill_number, title, description, sponsor_names, subjects)
+    VALUES (new.bill_id, new.bill_number, new.title, new.description, new.sponsor_names, new.subjects);
+END;
+"""
+_FTS_TRIGGER_NAMES = re.findall(r"CREATE TRIGGER IF NOT EXISTS (\w+)", _FTS_TRIGGER_DDL)
+_FTS_IN = "b.bill_id IN (SELECT rowid FROM bills_fts WHERE bills_fts MATCH ?)"
+
+# Input already written in FTS5 query syntax: phrases, prefixes, groups,
+# column filters or upper-case operators.
+_FTS_SYNTAX_RE = re.compile(r'["*()^]|\b(?:AND|OR|NOT|NEAR)\b|\b\w+\s*:')
+# A bill number as people type it: "AB123", "AB 12", "H.B. 12", "SB-5".  The
+# prefix is 1-4 letters, so "covid 19" or "budget 2024" stay plain words.
+_BILL_NUMBER_RE = re.compile(r"((?:[A-Za-z]\.?\s*){1,4}?)[\s\-]*(\d+)")
+
+
+def _fts_query(query: str, syntax: bool = True) -> Optional[str]:
+    """
+    Turn search-box input into an FTS5 MATCH expression.  Input using FTS5
+    syntax is passed through (unless syntax=False); plain words become
+    prefix terms that must all match ("wat rights" → "wat"* "rights"*), and
+    a bill number typed with spaces, dots or a hyphen ("AB 12", "H.B. 12",
+    "SB-5") is joined up to match how it is stored ("AB12", "HB12", "SB5").
+    A bill number also matches as an exact term, which bm25 scores on top
+    of the prefix, so AB12 ranks above AB124.
+    Returns None when nothing searchable is left.
+    """
+    q = query.strip()
+    if not q:
+        return None
+    if syntax and _FTS_SYNTAX_RE.search(q):
+        return q
+    m = _BILL_NUMBER_RE.fullmatch(q)
+    if m:
+        number = re.sub(r"[.\s]", "", m.group(1)) + m.group(2)
+        return f'"{number}" OR "{number}"*'
+    return " ".join(f'"{t}"*' for t in re.findall(r"\w+", q)) or None
+
+
+# ── API call accounting ────────────────────────────────────────────────────────
+# Each bootstrap / refresh / sync counts only the calls made on its behalf:
+# calls add to every scope open in the calling context, and _fetch_many runs
+# its requests in a copy of the submitting context.  Calls other threads make
+# meanwhile (prefetch_masterlists fetching ahead, another job) don't leak in.
+_API_CALL_SCOPES: contextvars.ContextVar[tuple[list[int], ...]] = contextvars.ContextVar(
+    "api_call_scopes", default=()
+)
+
+
+@contextlib.contextmanager
+def _api_call_scope() -> Iterator[list[int]]:
+    tally = [0]
+    token = _API_CALL_SCOPES.set(_API_CALL_SCOPES.get() + (tally,))
+    try:
+        yield tally
+    finally:
+        _API_CALL_SCOPES.reset(token)
+
+
+def _scope_api_calls() -> int:
+    """Calls made so far in the innermost open scope."""
+    scopes = _API_CALL_SCOPES.get()
+    return scopes[-1][0] if scopes else 0
+
+
+def _counts_api_calls(fn: Callable) -> Callable:
+    """Run a CorpusManager method in its own API call scope."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with _api_call_scope():
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+# ── Read memo ──────────────────────────────────────────────────────────────────
+# Data writes bump data_generation in sync_meta in the same transaction (see
+# CorpusManager._commit), and memoized reads are keyed on it, so a cached
+# result is reused only while no write — from this process or another — has
+# committed since it was computed.
+_BUMP_GENERATION_SQL = (
+    "INSERT INTO sync_meta (key, value) VALUES ('data_generation', '1') "
+    "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+)
+DEFAULT_READ_CACHE_SIZE = 256
+
+
+def _memoized(fn: Callable) -> Callable:
+    """
+    Serve repeated calls from CorpusManager's LRU until data_generation moves.
+    Reads made while the shared connection has a transaction open bypass the
+    memo: they can see writes that are later rolled back.
+    """
+    @functools.wraps(fn)
+    def wrapper(self: "CorpusManager", *args, **kwargs):
+        conn = self._get_conn()
+        if not self.read_cache_size or conn.in_transaction:
+            return fn(self, *args, **kwargs)
+        generation = self._data_generation()
+        key = (fn.__name__, repr(args), repr(sorted(kwargs.items())))
+        with self._read_cache_lock:
+            if generation != self._read_cache_generation:
+                self._read_cache.clear()
+                self._read_cache_generation = generation
+            elif key in self._read_cache:
+                self._read_cache.move_to_end(key)
+                return _copy_result(self._read_cache[key])
+        result = fn(self, *args, **kwargs)
+        with self._read_cache_lock:
+            if generation == self._read_cache_generation and not conn.in_transaction:
+                self._read_cache[key] = result
+                while len(self._read_cache) > self.read_cache_size:
+                    self._read_cache.popitem(last=False)
+        return _copy_result(result)
+    return wrapper
+
+
+def _copy_result(result):
+    # Callers sort and add columns in place; never hand out the cached object.
+    return result.copy() if isinstance(result, pd.DataFrame) else copy.deepcopy(result)
+
+
+# ── Search filters ─────────────────────────────────────────────────────────────
+
+@dataclass
+class BillFilter:
+    """
+    Everything search_bills() / count_bills() can filter on; every field
+    compiles to SQL.  None (or an empty list) means "don't filter", except
+    bill_id_filter, where an empty list matches nothing.  position_filter
+    and priority_filter match the notes that sync_bill_notes() mirrored for
+    notes_user.  date_from / date_to bound status_date ("YYYY-MM-DD",
+    inclusive).
+    """
+    query: str = ""
+    jurisdiction_filter: Optional[list[str]] = None
+    status_filter: Optional[list[str]] = None
+    keyword_filter: Optional[list[str]] = None
+    sponsor_filter: Optional[list[str]] = None
+    sponsor_people_ids: Optional[list[int]] = None
+    committee_filter: Optional[list[str]] = None
+    subject_filter: Optional[list[str]] = None
+    bill_id_filter: Optional[list[int]] = None
+    date_from: Optional[str] = None
+    date_to: Optional[str] = None
+    notes_user: Optional[str] = None
+    position_filter: Optional[list[str]] = None
+    priority_filter: Optional[list[str]] = None
+
+
+# ── Keyset paging for search_bills ─────────────────────────────────────────────
+# Each ordering is (SQL expression, result column, descending) and ends on
+# bill_id, so the last row's values identify a unique position to resume
+# after.  "rank" is only available with a full-text query.
+BILL_ORDERS: dict[str, tuple[tuple[str, str, bool], ...]] = {
+    "status_date":  (("b.status_date", "status_date", True), ("b.bill_number", "bill_number", False),
+                     ("b.bill_id", "bill_id", False)),
+    "last_action":  (("b.last_action_date", "last_action_date", True), ("b.bill_id", "bill_id", False)),
+    "bill_number":  (("b.bill_number", "bill_number", False), ("b.bill_id", "bill_id", False)),
+    "status_stage": (("b.status_stage", "status_stage", False), ("b.bill_id", "bill_id", False)),
+    "rank":         (("f.rank", "search_rank", False), ("b.bill_id", "bill_id", False)),
+}
+
+
+def _keyset_condition(order: tuple, cursor: tuple) -> tuple[str, list]:
+    """
+    WHERE clause selecting the rows that sort strictly after cursor under
+    order.  SQLite sorts NULL lowest, i.e. first ascending and last
+    descending, and the comparisons below follow that.
+    """
+    ors: list[str] = []
+    params: list = []
+    eq: list[str] = []
+    eq_params: list = []
+    for (expr, _, desc), value in zip(order, cursor):
+        if value is None:
+            after = None if desc else f"{expr} IS NOT NULL"
+            after_params: list = []
+        elif desc:
+            after, after_params = f"({expr} < ? OR {expr} IS NULL)", [value]
+        else:
+            after, after_params = f"{expr} > ?", [value]
+        if after:
+            ors.append("(" + " AND ".join(eq + [after]) + ")")
+            params.extend(eq_params + after_params)
+        if value is None:
+            eq.append(f"{expr} IS NULL")
+        else:
+            eq.append(f"{expr} = ?")
+            eq_params.append(value)
+    return ("(" + " OR ".join(ors) + ")" if ors else "0"), params
+
+
+# ── Batched roll-call / member-vote writer ─────────────────────────────────────
+_UPSERT_ROLLCALL_SQL = """
+    INSERT INTO roll_calls (
+        roll_call_id, bill_id, date, desc, yea, nay, nv, absent, total, passed,
+        chamber, chamber_id, url, state_link, last_fetched
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(roll_call_id) DO UPDATE SET
+        bill_id=excluded.bill_id, date=excluded.date, desc=excluded.desc, yea=excluded.yea,
+        nay=excluded.nay, nv=excluded.nv, absent=excluded.absent, total=excluded.total,
+        passed=excluded.passed, chamber=excluded.chamber, chamber_id=excluded.chamber_id,
+        url=excluded.url, state_link=excluded.state_link, last_fetched=excluded.last_fetched
+"""
+_UPSERT_MEMBER_VOTE_SQL = """
+    INSERT INTO legislator_votes (roll_call_id, people_id, vote_id, vote_text)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(roll_call_id, people_id) DO UPDATE SET
+        vote_id=excluded.vote_id, vote_text=excluded.vote_text
+"""
+
+
+class _VoteWriter:
+    """
+    Buffers roll calls and member votes and writes them with executemany.
+
+    People ids seen by this writer (plus any passed in ``known_people``) are
+    remembered, so the placeholder ``people`` row for a voter is inserted at
+    most once per writer instead of once per vote.  Roll calls whose bill is
+    not in ``bills`` are dropped at flush time (they would violate the FK).
+    Call flush() before committing.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, known_people: Optional[set[int]] = None):
+        self.conn = conn
+        self.known_people: set[int] = known_people if known_people is not None else set()
+        self._rollcalls: list[tuple] = []
+        self._people: list[tuple] = []
+        self._votes: list[tuple] = []
+
+    def add(self, r: dict, bill_id: int) -> None:
+        rc_id = r.get("roll_call_id")
+        if not rc_id: return
+        self._rollcalls.append((
+            rc_id, bill_id, r.get("date"), r.get("desc"), r.get("yea"), r.get("nay"),
+            r.get("nv"), r.get("absent"), r.get("total"), r.get("passed"),
+            r.get("chamber"), r.get("chamber_id"), r.get("url"), r.get("state_link"),
+            datetime.now(timezone.utc).isoformat(),
+        ))
+        for v in r.get("votes", []):
+            p_id = v.get("people_id")
+            if not p_id: continue
+            p_id = int(p_id)
+            if p_id not in self.known_people:
+                self.known_people.add(p_id)
+                self._people.append(
+                    (p_id, v.get("name") or f"Unknown Profile (ID {p_id})", v.get("party"))
+                )
+            self._votes.append((rc_id, p_id, v.get("vote_id"), v.get("vote_text")))
+
+    def flush(self) -> None:
+        if not self._rollcalls:
+            return
+        bill_ids = list({rc[1] for rc in self._rollcalls})
+        present: set = set()
+        for i in range(0, len(bill_ids), _SQLITE_MAX_VARS):
+            chunk = bill_ids[i:i + _SQLITE_MAX_VARS]
+            present.update(
+                r[0] for r in self.conn.execute(
+                    f"SELECT bill_id FROM bills WHERE bill_id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+            )
+        rollcalls = [rc for rc in self._rollcalls if rc[1] in present]
+        if len(rollcalls) != len(self._rollcalls):
+            kept = {rc[0] for rc in rollcalls}
+            self._votes = [v for v in self._votes if v[0] in kept]
+
+        self.conn.executemany(_UPSERT_ROLLCALL_SQL, rollcalls)
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO people (people_id, name, party) VALUES (?, ?, ?)",
+            self._people,
+        )
+        self.conn.executemany(_UPSERT_MEMBER_VOTE_SQL, self._votes)
+        self._rollcalls.clear()
+        self._people.clear()
+        self._votes.clear()
+
 
 # ── CorpusManager ──────────────────────────────────────────────────────────────
 class CorpusManager:
@@ -273,13 +898,49 @@ class CorpusManager:
         api_key: str,
         rate_limit_s: float = 0.25,
         download_timeout: int = 180,
+        parse_workers: Optional[int] = None,
+        dataset_cache_dir: Optional[str] = None,
+        dataset_cache_max_mb: int = 2048,
+        fetch_workers: int = 8,
+        response_cache_path: Optional[str] = None,
+        response_cache_max_mb: int = 512,
+        api_monthly_budget: int = DEFAULT_MONTHLY_BUDGET,
+        read_cache_size: int = DEFAULT_READ_CACHE_SIZE,
     ) -> None:
         self.db_path          = db_path
         self.api_key          = api_key
         self.rate_limit_s     = rate_limit_s
         self.download_timeout = download_timeout
+        # Leave one core for the feeding and SQLite writer threads.
+        self.parse_workers    = (
+            parse_workers if parse_workers is not None
+            else max(1, (os.cpu_count() or 2) - 1)
+        )
+        # Concurrent getBill requests during refresh / masterlist bootstrap.
+        self.fetch_workers    = max(1, fetch_workers)
         self._api_calls_run   = 0
+        self._api_calls_lock  = threading.Lock()
         self._conn: Optional[sqlite3.Connection] = None
+        # Downloaded dataset ZIPs live next to bills.db unless told otherwise.
+        self._dataset_cache = DatasetCache(
+            dataset_cache_dir
+            or os.path.join(os.path.dirname(os.path.abspath(db_path)), "dataset_cache"),
+            max_bytes=dataset_cache_max_mb * 1024 * 1024,
+        )
+        # getBill / getRollCall / getBillText payloads, shared with legiscanner.
+        self._response_cache = shared_cache(
+            response_cache_path
+            or os.path.join(os.path.dirname(os.path.abspath(db_path)), "response_cache.db"),
+            max_bytes=response_cache_max_mb * 1024 * 1024,
+        )
+        # Monthly per-key call accounting (api_usage table in bills.db).
+        self.quota = shared_quota(db_path, api_monthly_budget)
+        self._masterlist_memo: dict[int, tuple[float, dict]] = {}
+        # Memoized read results (search_bills, get_corpus_stats, …); 0 disables.
+        self.read_cache_size = read_cache_size
+        self._read_cache: OrderedDict = OrderedDict()
+        self._read_cache_lock = threading.Lock()
+        self._read_cache_generation: Optional[int] = None
         self._init_db()
 
     # ── Connection ────────────────────────────────────────────────────────────
@@ -295,6 +956,17 @@ class CorpusManager:
     def _init_db(self) -> None:
         conn = self._get_conn()
         conn.executescript(_DDL)
+        # A bulk load running in another process (or another CorpusManager)
+        # has dropped indexes and FTS triggers on purpose; leave them to it.
+        bulk_owner = self._live_bulk_load_owner()
+        if bulk_owner:
+            logger.info(
+                f"Bulk load in progress (pid {bulk_owner.get('pid')} on {bulk_owner.get('host')}); "
+                "leaving its indexes to it"
+            )
+        else:
+            conn.executescript(_BILL_INDEX_DDL)
+        self._fts = self._init_fts(conn, triggers=not bulk_owner)
         
         # Migration: add columns if they don't exist in bills table
         cur = conn.cursor()
@@ -310,24 +982,288 @@ class CorpusManager:
             ("schema_version", SCHEMA_VERSION),
         )
         conn.commit()
+
+        # Migration: bills ingested before the child tables existed would be
+        # skipped as unchanged by later ingests, so fill them once from the
+        # flat columns.
+        if not self._meta_get("bill_children_backfilled"):
+            self._backfill_bill_children(conn)
+
+        # Migration: keyword matches recorded before bill_keywords existed.
+        if not self._meta_get("bill_keywords_built"):
+            conn.execute(
+                "INSERT OR REPLACE INTO bill_keywords (bill_id, keywords) "
+                "SELECT bill_id, GROUP_CONCAT(keyword, '; ') FROM "
+                "(SELECT bill_id, keyword FROM keyword_matches ORDER BY bill_id, matched_at, keyword) "
+                "GROUP BY bill_id"
+            )
+            self._meta_set("bill_keywords_built", datetime.now(timezone.utc).isoformat())
+            self._commit(conn)
+
+        # A bulk load that never reached its cleanup (crash, killed rerun):
+        # indexes were recreated above; finish the FK sweep and stats now.
+        if not bulk_owner and self._meta_get("bulk_load_started"):
+            logger.warning("Previous bulk load was interrupted; restoring indexes and integrity")
+            self._finish_bulk_load(conn)
         logger.info(f"CorpusManager ready — db={self.db_path}")
 
+    def _init_fts(self, conn: sqlite3.Connection, triggers: bool = True) -> bool:
+        """
+        Create bills_fts and its sync triggers; build it once for bills that
+        predate it.  Returns False (search_bills then uses LIKE) when this
+        SQLite build has no FTS5.  triggers=False (a live bulk load owns
+        them) skips the triggers and the build.
+        """
+        try:
+            conn.executescript(_FTS_DDL)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite FTS5 unavailable ({e}); search_bills will use LIKE scans")
+            return False
+        if not triggers:
+            return True
+        conn.executescript(_FTS_TRIGGER_DDL)
+        conn.execute("INSERT INTO bills_fts (bills_fts, rank) VALUES ('rank', ?)", (_FTS_RANK,))
+        conn.commit()
+        if not self._meta_get("fts_built"):
+            self._rebuild_fts(conn)
+        return True
+
+    def _rebuild_fts(self, conn: sqlite3.Connection) -> None:
+        started = time.time()
+        conn.execute("INSERT INTO bills_fts (bills_fts) VALUES ('rebuild')")
+        self._meta_set("fts_built", datetime.now(timezone.utc).isoformat())
+        self._commit(conn)
+        logger.info(f"Full-text index rebuilt in {time.time() - started:.1f}s")
+
+    def _backfill_bill_children(self, conn: sqlite3.Connection) -> None:
+        """
+        Populate bill_sponsors / bill_subjects / bill_history for bills that
+        only have the flat columns.  Sponsors are matched to people_id by
+        exact name where the name is unambiguous; the next re-ingest of a
+        changed bill replaces these rows with the full API data.
+        """
+        started = time.time()
+        people: dict[str, Optional[int]] = {}
+        for pid, name in conn.execute("SELECT people_id, name FROM people"):
+            people[name] = None if name in people else pid
+        hist_re = re.compile(r"^(.*?): (.*) \(([^()]*)\)$")
+
+        n = 0
+        rows = conn.execute(
+            "SELECT bill_id, sponsor_names, subjects, history FROM bills "
+            "WHERE bill_id NOT IN (SELECT bill_id FROM bill_sponsors) "
+            "AND bill_id NOT IN (SELECT bill_id FROM bill_subjects) "
+            "AND bill_id NOT IN (SELECT bill_id FROM bill_history)"
+        ).fetchall()
+        sponsors: list[tuple] = []
+        subjects: list[tuple] = []
+        history: list[tuple] = []
+        for bill_id, sponsor_names, subjects_s, history_s in rows:
+            n += 1
+            for i, name in enumerate(x.strip() for x in (sponsor_names or "").split(", ") if x.strip()):
+                sponsors.append((bill_id, i, people.get(name), name, "", None))
+            for subj in {x.strip() for x in (subjects_s or "").split("; ") if x.strip()}:
+                subjects.append((bill_id, None, subj))
+            for i, entry in enumerate(x for x in (history_s or "").split("; ") if x):
+                m = hist_re.match(entry)
+                if m:
+                    history.append((bill_id, i, m.group(3), m.group(1), m.group(2)))
+                else:
+                    history.append((bill_id, i, "", "", entry))
+        conn.executemany("INSERT OR IGNORE INTO bill_sponsors VALUES (?, ?, ?, ?, ?, ?)", sponsors)
+        conn.executemany(
+            "INSERT OR IGNORE INTO bill_subjects (bill_id, subject_id, subject_name) VALUES (?, ?, ?)", subjects
+        )
+        conn.executemany("INSERT OR IGNORE INTO bill_history VALUES (?, ?, ?, ?, ?)", history)
+        self._meta_set("bill_children_backfilled", datetime.now(timezone.utc).isoformat())
+        self._commit(conn)
+        if n:
+            logger.info(f"Backfilled sponsor/subject/history tables for {n} bills in {time.time() - started:.1f}s")
+
+    # ── Bulk-load mode ────────────────────────────────────────────────────────
+
+    @contextlib.contextmanager
+    def _bulk_load_mode(self):
+        """
+        Relax durability for a cold load: synchronous=OFF, FK enforcement
+        off, the secondary bills indexes and the bills_fts triggers dropped.
+        On exit (normal or not) indexes and the full-text index are rebuilt,
+        FK violations are swept, ANALYZE runs and the WAL is checkpointed.
+        A sync_meta marker, kept fresh by a heartbeat thread, lets _init_db
+        finish the cleanup if the process dies mid-load.
+
+        The journal stays in WAL mode: switching modes needs exclusive
+        access, and WAL keeps an application crash from corrupting the DB.
+        """
+        conn = self._get_conn()
+        conn.commit()
+        started = datetime.now(timezone.utc).isoformat()
+        self._meta_set("bulk_load_started", self._bulk_load_marker(started))
+        conn.commit()
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._bulk_load_heartbeat, args=(started, stop_heartbeat),
+            name="bulk-load-heartbeat", daemon=True,
+        )
+        heartbeat.start()
+        prev_sync = conn.execute("PRAGMA synchronous").fetchone()[0]
+        conn.execute("PRAGMA foreign_keys=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        for name in _BILL_INDEX_NAMES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+        for name in _FTS_TRIGGER_NAMES if self._fts else ():
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        conn.commit()
+        logger.info("Bulk-load mode on: indexes and FTS triggers dropped, FK checks and fsync deferred")
+        try:
+            yield
+        finally:
+            conn.rollback()
+            conn.execute(f"PRAGMA synchronous={int(prev_sync)}")
+            try:
+                self._finish_bulk_load(conn)
+            finally:
+                stop_heartbeat.set()
+                heartbeat.join()
+
+    @staticmethod
+    def _bulk_load_marker(started: str) -> str:
+        return json.dumps({
+            "host": socket.gethostname(), "pid": os.getpid(), "started": started,
+            "heartbeat": time.time(),
+        })
+
+    def _bulk_load_heartbeat(self, started: str, stop: threading.Event) -> None:
+        # Own connection: the loader's may be mid-transaction on another thread.
+        while not stop.wait(_BULK_HEARTBEAT_S):
+            hb = None
+            try:
+                hb = sqlite3.connect(self.db_path, timeout=_BULK_HEARTBEAT_S / 2)
+                with hb:
+                    hb.execute(
+                        "UPDATE sync_meta SET value=? WHERE key='bulk_load_started'",
+                        (self._bulk_load_marker(started),),
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Bulk-load heartbeat skipped: {e}")
+            finally:
+                if hb is not None:
+                    hb.close()
+
+    def _live_bulk_load_owner(self) -> Optional[dict]:
+        """The bulk_load_started marker if its owner still looks alive, else None."""
+        raw = self._meta_get("bulk_load_started")
+        if not raw:
+            return None
+        try:
+            owner = json.loads(raw)
+            heartbeat = float(owner["heartbeat"])
+        except (ValueError, TypeError, KeyError):
+            return None     # pre-heartbeat marker: nothing to prove it's alive
+        if time.time() - heartbeat > _BULK_STALE_S:
+            return None
+        if owner.get("host") == socket.gethostname() and os.name == "posix":
+            try:
+                os.kill(int(owner.get("pid", 0)), 0)
+            except ProcessLookupError:
+                return None
+            except (PermissionError, ValueError):
+                pass
+        return owner
+
+    def _finish_bulk_load(self, conn: sqlite3.Connection) -> None:
+        started = time.time()
+        conn.executescript(_BILL_INDEX_DDL)
+        conn.execute("PRAGMA foreign_keys=ON")
+
+        # Rows that slipped past the deferred FK checks are removed, children first.
+        violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+        by_table: dict[str, list[int]] = {}
+        for table, rowid, _parent, _fkid in violations:
+            if rowid is not None:
+                by_table.setdefault(table, []).append(rowid)
+        for table in (
+            "legislator_votes", "people_mapping", "bill_texts", "bill_sponsors",
+            "bill_subjects", "bill_history", "roll_calls", "bills",
+        ):
+            rowids = by_table.pop(table, [])
+            for i in range(0, len(rowids), _SQLITE_MAX_VARS):
+                chunk = rowids[i:i + _SQLITE_MAX_VARS]
+                conn.execute(
+                    f"DELETE FROM {table} WHERE rowid IN ({','.join('?' * len(chunk))})", chunk
+                )
+        if violations:
+            logger.warning(f"Bulk load: removed {len(violations)} rows violating foreign keys")
+
+        if self._fts:
+            conn.executescript(_FTS_TRIGGER_DDL)
+            self._rebuild_fts(conn)
+
+        conn.execute("DELETE FROM sync_meta WHERE key='bulk_load_started'")
+        self._commit(conn)
+        conn.execute("ANALYZE")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        logger.info(f"Bulk-load finalized in {time.time() - started:.1f}s")
+
     # ── Low-level API helpers ─────────────────────────────────────────────────
 
     def _api_get(self, params: dict, timeout: Optional[int] = None) -> dict:
-        """Make one LegiScan API request (JSON response)."""
+        """
+        Make one LegiScan API request (JSON response).  Pacing and retries
+        of transient failures happen in legiscan_client; what still fails
+        comes back as {"status": "ERROR"}.
+        """
         p = dict(params)
         p["key"] = self.api_key
         try:
-            r = requests.get(BASE_URL, params=p, timeout=timeout or 30)
+            r = legiscan_client.get(p, timeout=timeout, rate_limit_s=self.rate_limit_s)
             r.raise_for_status()
-            self._api_calls_run += 1
-            time.sleep(self.rate_limit_s)
+            self._count_api_call()
             return r.json()
         except Exception as exc:
             logger.error(f"API error ({params.get('op', '?')}): {exc}")
             return {"status": "ERROR", "error": str(exc)}
 
+    def _count_api_call(self) -> None:
+        with self._api_calls_lock:
+            self._api_calls_run += 1
+            for tally in _API_CALL_SCOPES.get():
+                tally[0] += 1
+
+    @contextlib.contextmanager
+    def counting_api_calls(self) -> Iterator[list[int]]:
+        """
+        Count the API calls made by the enclosed block (including its
+        _fetch_many pool threads) in tally[0]; the count survives an
+        exception, unlike the api_calls in a returned stats dict.
+        """
+        with _api_call_scope() as tally:
+            yield tally
+
+    def _api_get_cached(self, params: dict, version: str = "") -> dict:
+        """
+        _api_get through the response cache, keyed by op + id + version
+        (change_hash for getBill, "" for immutable roll calls and texts).
+        Only OK responses are stored.
+        """
+        op, item_id = params["op"], params["id"]
+        cached = self._response_cache.get(op, item_id, version)
+        if cached is not None:
+            return cached
+        data = self._api_get(params)
+        if data.get("status") == "OK":
+            self._response_cache.put(op, item_id, version, data)
+        return data
+
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        """Commit a write to corpus data, moving data_generation with it."""
+        conn.execute(_BUMP_GENERATION_SQL)
+        conn.commit()
+
+    def _data_generation(self) -> int:
+        return int(self._meta_get("data_generation") or 0)
+
     def _meta_get(self, key: str) -> Optional[str]:
         row = self._get_conn().execute(
             "SELECT value FROM sync_meta WHERE key=?", (key,)
@@ -378,7 +1314,7 @@ class CorpusManager:
                     s.get("year_end", 0),
                 ),
             )
-        conn.commit()
+        self._commit(conn)
         return sessions_raw[:10]
 
     def get_cached_sessions(self, jurisdiction: Optional[str] = None) -> list[dict]:
@@ -397,123 +1333,449 @@ class CorpusManager:
 
     # ── Bootstrap (getDataset ZIP) ────────────────────────────────────────────
 
-    def get_dataset_list(self, jurisdiction: str) -> list[dict]:
+    def get_dataset_list(self, jurisdiction: Optional[str] = None) -> list[dict]:
         """
-        Fetch available datasets for a jurisdiction.
+        Fetch available datasets for a jurisdiction (all jurisdictions if None).
         Returns list with access_key needed for getDataset.
         Cost: 1 API call.
         """
-        data = self._api_get({"op": "getDatasetList", "state": jurisdiction})
+        params = {"op": "getDatasetList"}
+        if jurisdiction:
+            params["state"] = jurisdiction
+        data = self._api_get(params)
         if data.get("status") != "OK":
             logger.warning(f"getDatasetList failed for {jurisdiction}: {data}")
             return []
         return data.get("datasetlist", [])
 
+    def newest_datasets(self, jurisdictions: list[str]) -> tuple[list[tuple[str, int]], list[dict]]:
+        """
+        (jurisdiction, session_id) for the newest listed dataset of each
+        jurisdiction, plus the getDatasetList entries to pass on to
+        bootstrap_many(datasets=...).
+        Cost: 1 API call (instead of a getSessionList per jurisdiction).
+        """
+        datasets = self.get_dataset_list(jurisdictions[0] if len(jurisdictions) == 1 else None)
+        newest: dict[str, dict] = {}
+        for ds in datasets:
+            jur = LEGISCAN_STATE_CODES.get(ds.get("state_id"))
+            if jur not in jurisdictions:
+                continue
+            key = (ds.get("year_start", 0), ds.get("session_id", 0))
+            if jur not in newest or key > (newest[jur].get("year_start", 0), newest[jur].get("session_id", 0)):
+                newest[jur] = ds
+        targets = []
+        for jur in jurisdictions:
+            if jur in newest:
+                targets.append((jur, newest[jur]["session_id"]))
+            else:
+                logger.warning(f"No dataset listed for {jur}")
+        return targets, datasets
+
+    @_counts_api_calls
     def bootstrap_session(
         self,
         session_id: int,
         jurisdiction: str,
         progress_cb: Optional[Callable[[float, str], None]] = None,
+        force: bool = False,
+        offline: bool = False,
+        bulk_load: bool = False,
+        dataset: Optional[dict] = None,
     ) -> dict:
         """
         Bootstrap a session using the bulk dataset ZIP.
 
         Sequence:
-          1. getDatasetList → access_key         (1 call)
-          2. getDataset ZIP download             (1 call)
-          3. Parse all bill JSONs from ZIP       (0 calls)
+          1. getDatasetList → access_key + dataset_hash   (1 call)
+             If dataset_hash equals sessions.dataset_hash the local copy is
+             already current and bootstrap stops here (force=True re-ingests).
+          2. getDataset ZIP download                      (1 call, 0 if the
+             ZIP for that hash is in the local dataset cache)
+          3. Parse all bill JSONs from ZIP                (0 calls)
           Fallback if ZIP unavailable: getMasterListRaw + getBill per bill.
 
+        offline=True skips the API entirely and replays the newest cached
+        ZIP for the session (nothing happens if none is cached).
+
+        bulk_load=True runs the ZIP ingest in bulk-load mode (see
+        _bulk_load_mode) — meant for first-time loads into an empty DB.
+
+        dataset is the session's getDatasetList entry when the caller already
+        has it (sync_session); step 1 is then skipped.
+
         progress_cb(fraction: float, message: str) is called periodically.
-        Returns stats dict: {new, updated, skipped, errors, api_calls}.
+        Bills whose change_hash is unchanged are not rewritten unless force.
+        An interrupted ZIP ingest resumes from its last checkpoint.
+        Returns stats dict: {new, updated, unchanged, skipped, errors,
+        api_calls, dataset_unchanged, resumed_from}.
         """
         stats: dict[str, int] = {
-            "new": 0, "updated": 0, "skipped": 0, "errors": 0, "api_calls": 0
+            "new": 0, "updated": 0, "unchanged": 0, "skipped": 0, "errors": 0,
+            "api_calls": 0, "dataset_unchanged": 0, "resumed_from": 0,
         }
-        start_calls = self._api_calls_run
 
         logger.info(f"Bootstrap start: {jurisdiction} session_id={session_id}")
-        if progress_cb:
-            progress_cb(0.0, f"Fetching dataset list for {jurisdiction}…")
 
-        datasets = self.get_dataset_list(jurisdiction)
-        target_ds = next(
-            (d for d in datasets if d.get("session_id") == session_id), None
-        )
+        if offline:
+            target_ds = self._dataset_cache.latest_for_session(session_id)
+            if not target_ds:
+                logger.warning(f"No cached dataset for session_id={session_id}; nothing to replay.")
+                return stats
+        else:
+            if progress_cb:
+                progress_cb(0.0, f"Fetching dataset list for {jurisdiction}…")
+
+            datasets = [dataset] if dataset else self.get_dataset_list(jurisdiction)
+            target_ds = next(
+                (d for d in datasets if d.get("session_id") == session_id), None
+            )
 
-        if not target_ds:
-            logger.warning(
-                f"No dataset found for session_id={session_id} ({jurisdiction}); "
-                "falling back to getMasterListRaw bootstrap."
+            if not target_ds:
+                logger.warning(
+                    f"No dataset found for session_id={session_id} ({jurisdiction}); "
+                    "falling back to getMasterListRaw bootstrap."
+                )
+                stats.update(
+                    self._bootstrap_via_masterlist(session_id, jurisdiction, progress_cb)
+                )
+                stats["api_calls"] = _scope_api_calls()
+                return stats
+
+        dataset_hash = target_ds.get("dataset_hash", "")
+        self._ensure_session(target_ds, jurisdiction)
+
+        if dataset_hash and not force and self._dataset_is_current(session_id, dataset_hash):
+            stats["dataset_unchanged"] = 1
+            stats["skipped"] = self._get_conn().execute(
+                "SELECT COUNT(*) FROM bills WHERE session_id=?", (session_id,)
+            ).fetchone()[0]
+            stats["api_calls"] = _scope_api_calls()
+            logger.info(
+                f"Bootstrap skipped: dataset {dataset_hash} for {jurisdiction} "
+                f"session {session_id} is unchanged"
             )
+            if progress_cb:
+                progress_cb(1.0, "Dataset unchanged since last bootstrap — nothing to do")
+            return stats
+
+        zip_src = self._fetch_dataset_zip(target_ds, jurisdiction, progress_cb)
+        if zip_src is None:
+            logger.warning("getDataset ZIP unavailable; falling back to getMasterListRaw.")
             stats.update(
                 self._bootstrap_via_masterlist(session_id, jurisdiction, progress_cb)
             )
-            stats["api_calls"] = self._api_calls_run - start_calls
+            stats["api_calls"] = _scope_api_calls()
             return stats
 
-        access_key = target_ds.get("access_key", "")
+        with self._bulk_load_mode() if bulk_load else contextlib.nullcontext():
+            self._ingest_dataset(
+                zip_src, target_ds, jurisdiction, progress_cb, stats, force
+            )
+
+        stats["api_calls"] = _scope_api_calls()
+        logger.info(f"Bootstrap complete: {stats}")
+        return stats
+
+    def _fetch_dataset_zip(
+        self,
+        target_ds: dict,
+        jurisdiction: str,
+        progress_cb: Optional[Callable] = None,
+    ) -> Union[str, IO[bytes], None]:
+        """
+        Return the dataset ZIP for a getDatasetList entry: a path from the
+        local dataset cache, or a freshly downloaded spool (also stored in
+        the cache).  None if the download failed.  Safe to call from
+        several threads at once.
+        """
+        session_id   = target_ds["session_id"]
+        dataset_hash = target_ds.get("dataset_hash", "")
+        cached = self._dataset_cache.get(dataset_hash)
+        if cached:
+            logger.info(f"Bootstrap: using cached dataset ZIP {dataset_hash}")
+            return cached
+
         logger.info(
             f"Bootstrap: downloading dataset ZIP for {jurisdiction} session {session_id}"
         )
         if progress_cb:
             progress_cb(0.05, "Downloading dataset ZIP (this may take a moment)…")
 
-        zip_bytes = self._download_dataset_zip(session_id, access_key)
-        if zip_bytes is None:
-            logger.warning("getDataset ZIP unavailable; falling back to getMasterListRaw.")
-            stats.update(
-                self._bootstrap_via_masterlist(session_id, jurisdiction, progress_cb)
+        spool = self._download_dataset_zip(session_id, target_ds.get("access_key", ""))
+        if spool is None:
+            return None
+        stored = self._dataset_cache.put(dataset_hash, spool, {
+            "jurisdiction": jurisdiction,
+            "session_id":   session_id,
+            "session_name": target_ds.get("session_name", ""),
+            "year_start":   target_ds.get("year_start", 0),
+            "year_end":     target_ds.get("year_end", 0),
+            "dataset_date": target_ds.get("dataset_date", ""),
+        })
+        if stored:
+            spool.close()
+            return stored
+        spool.seek(0)
+        return spool
+
+    def _ingest_dataset(
+        self,
+        zip_src: Union[str, IO[bytes]],
+        target_ds: dict,
+        jurisdiction: str,
+        progress_cb: Optional[Callable],
+        stats: dict,
+        force: bool,
+    ) -> None:
+        """Ingest a fetched dataset ZIP and record its hash on success."""
+        session_id   = target_ds["session_id"]
+        dataset_hash = target_ds.get("dataset_hash", "")
+        if progress_cb:
+            progress_cb(0.1, "Parsing ZIP contents…")
+
+        try:
+            ingested = self._ingest_zip(
+                zip_src, session_id, jurisdiction, progress_cb, stats,
+                skip_unchanged=not force,
             )
-            stats["api_calls"] = self._api_calls_run - start_calls
-            return stats
+        finally:
+            if not isinstance(zip_src, str):
+                zip_src.close()
+        if not ingested:
+            self._dataset_cache.discard(dataset_hash)
+            dataset_hash = ""
+        self._record_bootstrap(session_id, jurisdiction, dataset_hash or None)
+
+    @_counts_api_calls
+    def bootstrap_many(
+        self,
+        targets: list[tuple[str, int]],
+        progress_cb: Optional[Callable[[float, str], None]] = None,
+        max_downloads: int = 4,
+        force: bool = False,
+        bulk_load: bool = False,
+        stats_cb: Optional[Callable[[dict], None]] = None,
+        datasets: Optional[list[dict]] = None,
+    ) -> dict:
+        """
+        Bootstrap several (jurisdiction, session_id) targets in one run.
+
+        One getDatasetList call covers every target (the unfiltered list when
+        more than one jurisdiction is involved), or none when the caller
+        already has it as datasets (see newest_datasets).  Unchanged datasets are
+        skipped as in bootstrap_session.  ZIPs are fetched concurrently
+        (max_downloads threads, paced by the process-wide limiter) while this
+        thread ingests them one at a time in target order, so there is only
+        ever one SQLite writer.  Targets without a dataset fall back to
+        getMasterListRaw afterwards.  bulk_load wraps all ZIP ingests in a
+        single bulk-load window.
+
+        progress_cb(fraction, message) reports progress over all targets;
+        stats_cb(totals) is called after each target with running totals.
+        """
+        totals: dict[str, int] = {
+            "sessions": 0, "new": 0, "updated": 0, "unchanged": 0, "skipped": 0,
+            "errors": 0, "api_calls": 0, "dataset_unchanged": 0, "fallback": 0,
+        }
+        if not targets:
+            return totals
+
+        def _add(st: dict) -> None:
+            totals["sessions"] += 1
+            for k in ("new", "updated", "unchanged", "skipped", "errors", "dataset_unchanged"):
+                totals[k] += st.get(k, 0)
+            totals["api_calls"] = _scope_api_calls()
+            if stats_cb:
+                stats_cb(dict(totals))
+
+        jurisdictions = {jur for jur, _ in targets}
+        if datasets is None:
+            if progress_cb:
+                progress_cb(0.0, f"Fetching dataset lists for {len(jurisdictions)} jurisdiction(s)…")
+            datasets = self.get_dataset_list(
+                next(iter(jurisdictions)) if len(jurisdictions) == 1 else None
+            )
+        by_session = {d.get("session_id"): d for d in datasets}
+
+        plan: list[tuple[str, int, dict]] = []
+        fallback: list[tuple[str, int]] = []
+        for jur, sid in targets:
+            ds = by_session.get(sid)
+            if not ds:
+                fallback.append((jur, sid))
+                continue
+            self._ensure_session(ds, jur)
+            ds_hash = ds.get("dataset_hash", "")
+            if ds_hash and not force and self._dataset_is_current(sid, ds_hash):
+                logger.info(f"Bootstrap skipped: {jur} session {sid} dataset unchanged")
+                _add({"dataset_unchanged": 1})
+                continue
+            plan.append((jur, sid, ds))
+
+        n_work = max(len(plan) + len(fallback), 1)
+        logger.info(
+            f"Bootstrap orchestrator: {len(plan)} dataset(s) to ingest, "
+            f"{len(fallback)} via masterlist, {totals['dataset_unchanged']} unchanged"
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, max_downloads), thread_name_prefix="dataset-download"
+        ) as pool:
+            # Downloads run at most max_downloads ahead of the ingest, and each
+            # ZIP stays pinned in the dataset cache until it has been ingested,
+            # so a later download's eviction can't delete it first.
+            def _submit(item: tuple[str, int, dict]) -> tuple[tuple[str, int, dict], Future]:
+                jur, _, ds = item
+                self._dataset_cache.pin(ds.get("dataset_hash", ""))
+                return item, pool.submit(contextvars.copy_context().run, self._fetch_dataset_zip, ds, jur)
+
+            pending = iter(plan)
+            window = deque(_submit(item) for item in itertools.islice(pending, max(1, max_downloads)))
+            with self._bulk_load_mode() if bulk_load and plan else contextlib.nullcontext():
+                for i in range(len(plan)):
+                    (jur, sid, ds), fut = window.popleft()
+                    nxt = next(pending, None)
+                    if nxt is not None:
+                        window.append(_submit(nxt))
+
+                    def _sub(f: float, msg: str, i=i, jur=jur) -> None:
+                        if progress_cb:
+                            progress_cb((i + f) / n_work, f"[{jur} {i + 1}/{n_work}] {msg}")
 
+                    st: dict[str, int] = {"new": 0, "updated": 0, "unchanged": 0, "errors": 0}
+                    try:
+                        zip_src = fut.result()
+                        if zip_src is None:
+                            fallback.append((jur, sid))
+                            continue
+                        self._ingest_dataset(zip_src, ds, jur, _sub, st, force)
+                    except Exception as exc:
+                        logger.error(f"Bootstrap of {jur} session {sid} failed: {exc}", exc_info=True)
+                        st["errors"] += 1
+                    finally:
+                        self._dataset_cache.unpin(ds.get("dataset_hash", ""))
+                    _add(st)
+
+        for j, (jur, sid) in enumerate(fallback):
+            done = len(plan) + j
+            if progress_cb:
+                progress_cb(done / n_work, f"[{jur} {done + 1}/{n_work}] Fetching bills via masterlist…")
+            try:
+                st = self._bootstrap_via_masterlist(sid, jur, None)
+                totals["fallback"] += 1
+                _add(st)
+            except Exception as exc:
+                logger.error(f"Masterlist bootstrap of {jur} session {sid} failed: {exc}", exc_info=True)
+                _add({"errors": 1})
+
+        totals["api_calls"] = _scope_api_calls()
         if progress_cb:
-            progress_cb(0.1, "Parsing ZIP contents…")
+            progress_cb(1.0, f"Done — {totals['sessions']} session(s), {totals['new']} new, {totals['updated']} updated")
+        logger.info(f"Bootstrap orchestrator complete: {totals}")
+        return totals
 
-        self._ingest_zip(zip_bytes, session_id, jurisdiction, progress_cb, stats)
-        self._record_bootstrap(session_id, jurisdiction)
+    def rebuild_from_dataset_cache(
+        self, progress_cb: Optional[Callable[[float, str], None]] = None
+    ) -> dict:
+        """
+        Re-ingest the newest cached dataset ZIP of every session in the local
+        dataset cache.  Rebuilds an empty/deleted bills.db with zero API calls.
+        """
+        totals: dict[str, int] = {"sessions": 0, "new": 0, "updated": 0, "errors": 0}
+        entries = self._dataset_cache.list_entries()
+        for i, entry in enumerate(entries):
+            if progress_cb:
+                progress_cb(
+                    i / max(len(entries), 1),
+                    f"Replaying {entry.get('jurisdiction')} {entry.get('session_name', '')}…",
+                )
+            st = self.bootstrap_session(
+                entry["session_id"], entry.get("jurisdiction", ""), force=True, offline=True
+            )
+            totals["sessions"] += 1
+            for k in ("new", "updated", "errors"):
+                totals[k] += st.get(k, 0)
+        if progress_cb:
+            progress_cb(1.0, f"Rebuilt {totals['sessions']} session(s) from cache")
+        return totals
 
-        stats["api_calls"] = self._api_calls_run - start_calls
-        logger.info(f"Bootstrap complete: {stats}")
-        return stats
+    def _ensure_session(self, ds: dict, jurisdiction: str) -> None:
+        """Make sure the sessions row bills reference exists (e.g. on a rebuilt DB)."""
+        conn = self._get_conn()
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO sessions
+                (session_id, jurisdiction, session_name, year_start, year_end, is_active)
+            VALUES (?, ?, ?, ?, ?, 1)
+            """,
+            (
+                ds["session_id"], jurisdiction, ds.get("session_name", ""),
+                ds.get("year_start", 0), ds.get("year_end", 0),
+            ),
+        )
+        self._commit(conn)
+
+    def _dataset_is_current(self, session_id: int, dataset_hash: str) -> bool:
+        """True if dataset_hash was the last one ingested and the session has bills."""
+        row = self._get_conn().execute(
+            """
+            SELECT s.dataset_hash,
+                   EXISTS (SELECT 1 FROM bills b WHERE b.session_id = s.session_id)
+            FROM sessions s WHERE s.session_id=?
+            """,
+            (session_id,),
+        ).fetchone()
+        return bool(row and row[0] == dataset_hash and row[1])
 
     def _download_dataset_zip(
         self, session_id: int, access_key: str
-    ) -> Optional[bytes]:
-        """Download and decode the dataset ZIP. Returns raw bytes or None."""
+    ) -> Optional[IO[bytes]]:
+        """
+        Stream and decode the dataset ZIP.
+
+        The getDataset body is parsed incrementally and its base64 payload is
+        decoded chunk-by-chunk into a spooled temp file, so peak memory stays
+        flat regardless of dataset size.  Returns the file rewound to the
+        start (caller closes it) or None.
+        """
         p = {
             "op":         "getDataset",
             "id":         session_id,
             "access_key": access_key,
             "key":        self.api_key,
         }
+        spool = tempfile.SpooledTemporaryFile(
+            max_size=_ZIP_SPOOL_MAX_BYTES, prefix="legiscan_dataset_", suffix=".zip"
+        )
         try:
-            r = requests.get(
-                BASE_URL, params=p, timeout=self.download_timeout, stream=True
-            )
-            r.raise_for_status()
-            self._api_calls_run += 1
-            time.sleep(self.rate_limit_s)
-            data = r.json()
+            with legiscan_client.get(
+                p, timeout=(10, self.download_timeout), stream=True, rate_limit_s=self.rate_limit_s
+            ) as r:
+                r.raise_for_status()
+                envelope, n_bytes = _stream_b64_field(
+                    r.iter_content(chunk_size=_DOWNLOAD_CHUNK_BYTES), "zip", spool
+                )
+            self._count_api_call()
+            data = json.loads(envelope)
         except Exception as exc:
             logger.error(f"getDataset download error: {exc}")
+            spool.close()
             return None
 
         if data.get("status") != "OK":
             logger.warning(f"getDataset not OK: {data.get('status')}")
+            spool.close()
             return None
 
-        zip_b64: str = data.get("dataset", {}).get("zip", "")
-        if not zip_b64:
+        if not n_bytes:
             logger.warning("getDataset response had no 'zip' field.")
+            spool.close()
             return None
 
-        try:
-            return base64.b64decode(zip_b64)
-        except Exception as exc:
-            logger.error(f"Base64 decode failed: {exc}")
-            return None
+        logger.info(f"getDataset: decoded {n_bytes / 1e6:.1f} MB ZIP")
+        spool.seek(0)
+        return spool
 
     def _upsert_person(self, conn: sqlite3.Connection, p: dict) -> None:
         conn.execute(
@@ -533,73 +1795,53 @@ class CorpusManager:
         )
 
     def _upsert_rollcall(self, conn: sqlite3.Connection, r: dict, bill_id: int) -> None:
-        rc_id = r.get("roll_call_id")
-        if not rc_id: return
-        conn.execute(
-            """
-            INSERT INTO roll_calls (
-                roll_call_id, bill_id, date, desc, yea, nay, nv, absent, total, passed,
-                chamber, chamber_id, url, state_link, last_fetched
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(roll_call_id) DO UPDATE SET
-                bill_id=excluded.bill_id, date=excluded.date, desc=excluded.desc, yea=excluded.yea,
-                nay=excluded.nay, nv=excluded.nv, absent=excluded.absent, total=excluded.total,
-                passed=excluded.passed, chamber=excluded.chamber, chamber_id=excluded.chamber_id,
-                url=excluded.url, state_link=excluded.state_link, last_fetched=excluded.last_fetched
-            """,
-            (
-                rc_id, bill_id, r.get("date"), r.get("desc"), r.get("yea"), r.get("nay"),
-                r.get("nv"), r.get("absent"), r.get("total"), r.get("passed"),
-                r.get("chamber"), r.get("chamber_id"), r.get("url"), r.get("state_link"),
-                datetime.now(timezone.utc).isoformat()
-            )
-        )
-        
-        votes = r.get("votes", [])
-        for v in votes:
-            p_id = v.get("people_id")
-            if not p_id: continue
-            
-            p_name = v.get("name")
-            if not p_name:
-                p_name = f"Unknown Profile (ID {p_id})"
-                
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO people (people_id, name, party)
-                VALUES (?, ?, ?)
-                """,
-                (p_id, p_name, v.get("party"))
-            )
-                
-            conn.execute(
-                """
-                INSERT INTO legislator_votes (roll_call_id, people_id, vote_id, vote_text)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(roll_call_id, people_id) DO UPDATE SET
-                    vote_id=excluded.vote_id, vote_text=excluded.vote_text
-                """,
-                (rc_id, int(p_id), v.get("vote_id"), v.get("vote_text"))
-            )
+        writer = _VoteWriter(conn)
+        writer.add(r, bill_id)
+        writer.flush()
 
     def _ingest_zip(
         self,
-        zip_bytes: bytes,
+        zip_src: Union[str, bytes, IO[bytes]],
         session_id: int,
         jurisdiction: str,
         progress_cb: Optional[Callable],
         stats: dict,
-    ) -> None:
-        """Walk all JSON files in the dataset ZIP and upsert bills."""
-        conn = self._get_conn()
+        skip_unchanged: bool = True,
+    ) -> bool:
+        """
+        Walk all JSON files in the dataset ZIP and upsert bills.
+
+        zip_src may be a path, a seekable binary file object, or raw bytes.
+        With skip_unchanged, bills whose change_hash matches the stored row
+        are not flattened or rewritten (nor are their sponsors and roll
+        calls); they are counted in stats["unchanged"].
+        Returns False if the archive could not be read.
+
+        Every batch commit also stores a checkpoint (ZIP fingerprint + index
+        of the last committed member) in sync_meta.  Ingesting the same ZIP
+        again after a crash resumes after that member; stats["resumed_from"]
+        is the member index it resumed at (0 for a fresh run).
+
+        Pipeline: this thread reads members in batches and hands them to a
+        process pool for json decoding + _flatten_bill_to_row; parsed batches
+        are collected in submission order and pushed onto a bounded queue
+        that a single writer thread drains, one transaction per batch.
+        People are written first, then bills, then roll calls, so foreign
+        keys always resolve.
+        """
+        if isinstance(zip_src, (bytes, bytearray)):
+            zip_src = io.BytesIO(zip_src)
         try:
-            with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
+            with zipfile.ZipFile(zip_src) as zf:
                 all_names = zf.namelist()
                 # Prefer paths that clearly contain data by ensuring they have leading slashes
                 # to match directories like "/bill/" even if they are at the root "bill/".
                 bill_files = [n for n in all_names if n.endswith(".json") and "/bill/" in f"/{n.lower()}"]
                 vote_files = [n for n in all_names if n.endswith(".json") and "/vote/" in f"/{n.lower()}"]
-                person_files = [n for n in all_names if n.endswith(".json") and "/person/" in f"/{n.lower()}"]
+                person_files = [
+                    n for n in all_names if n.endswith(".json")
+                    and ("/person/" in f"/{n.lower()}" or "/people/" in f"/{n.lower()}")
+                ]
                 
                 if not bill_files:
                     bill_files = [n for n in all_names if n.endswith(".json") and "masterlist" not in n.lower()]
@@ -607,80 +1849,245 @@ class CorpusManager:
                 total = len(bill_files) + len(vote_files) + len(person_files)
                 logger.info(f"ZIP has {len(bill_files)} bills, {len(vote_files)} votes, {len(person_files)} people")
 
-                processed = 0
-                for name in person_files:
-                    processed += 1
-                    try:
-                        with zf.open(name) as fh:
-                            raw = json.load(fh)
-                            p = raw.get("person", raw)
-                            if p.get("people_id"):
-                                self._upsert_person(conn, p)
-                    except Exception as exc: pass
-                
-                for i, name in enumerate(bill_files):
-                    processed += 1
+                # (kind, member names, member index just past this batch)
+                batches: list[tuple[str, list[str], int]] = []
+                end = 0
+                for kind, names in (("person", person_files), ("bill", bill_files), ("vote", vote_files)):
+                    for i in range(0, len(names), _INGEST_BATCH_FILES):
+                        chunk = names[i:i + _INGEST_BATCH_FILES]
+                        end += len(chunk)
+                        batches.append((kind, chunk, end))
+
+                # Cheap content fingerprint from the central directory.
+                fp = hashlib.sha1()
+                for info in zf.infolist():
+                    fp.update(f"{info.filename}:{info.CRC}:{info.file_size};".encode())
+                zip_hash = fp.hexdigest()
+                checkpoint_key = f"ingest_checkpoint_{session_id}"
+                start_index = 0
+                saved = self._meta_get(checkpoint_key)
+                if saved:
                     try:
-                        with zf.open(name) as fh:
-                            raw = json.load(fh)
-                    except Exception as exc:
-                        logger.debug(f"Skip {name}: {exc}")
-                        stats["errors"] += 1
-                        continue
-
-                    bill_data = raw.get("bill", raw)
-                    bill_id = bill_data.get("bill_id")
-                    if not bill_id:
-                        continue
-                        
-                    for sponsor in bill_data.get("sponsors", []):
-                        if sponsor.get("people_id"):
-                            self._upsert_person(conn, sponsor)
-
-                    row = _flatten_bill_to_row(bill_data, jurisdiction, session_id)
-                    self._upsert_bill(conn, row, stats)
-                    
-                    for r in bill_data.get("votes", []):
-                        self._upsert_rollcall(conn, r, bill_id)
-
-                    if processed % 100 == 0:
-                        conn.commit()
-                        if progress_cb:
-                            progress_cb(0.1 + 0.85 * (processed / max(total, 1)), f"Ingested {processed}/{total} files…")
+                        ckpt = json.loads(saved)
+                        if ckpt.get("zip_hash") == zip_hash:
+                            start_index = int(ckpt.get("member_index", 0))
+                    except (ValueError, TypeError):
+                        pass
+                stats["resumed_from"] = start_index
+                if start_index:
+                    logger.info(f"Resuming ZIP ingest at member {start_index}/{total}")
+                    if progress_cb:
+                        progress_cb(
+                            0.1 + 0.85 * (start_index / max(total, 1)),
+                            f"Resuming at file {start_index}/{total}…",
+                        )
 
-                for name in vote_files:
-                    processed += 1
-                    try:
-                        with zf.open(name) as fh:
-                            raw = json.load(fh)
-                            r = raw.get("roll_call", raw)
-                            rc_bid = r.get("bill_id")
-                            if r.get("roll_call_id") and rc_bid:
-                                self._upsert_rollcall(conn, r, rc_bid)
-                    except Exception as exc: pass
-                    
-                    if processed % 100 == 0:
-                        conn.commit()
-                        if progress_cb:
-                            progress_cb(0.1 + 0.85 * (processed / max(total, 1)), f"Ingested {processed}/{total} files…")
+                known_hashes: dict[int, str] = {}
+                if skip_unchanged:
+                    known_hashes = {
+                        r[0]: r[1]
+                        for r in self._get_conn().execute(
+                            "SELECT bill_id, change_hash FROM bills WHERE session_id=?",
+                            (session_id,),
+                        )
+                        if r[1]
+                    }
+                stats.setdefault("unchanged", 0)
 
+                self._run_ingest_pipeline(
+                    zf, batches, total, session_id, jurisdiction, known_hashes,
+                    progress_cb, stats, start_index, checkpoint_key, zip_hash,
+                )
+                conn = self._get_conn()
+                conn.execute("DELETE FROM sync_meta WHERE key=?", (checkpoint_key,))
                 conn.commit()
+
                 if progress_cb:
-                    progress_cb(1.0, f"Done — {stats['new']} new, {stats['updated']} updated")
+                    progress_cb(
+                        1.0,
+                        f"Done — {stats['new']} new, {stats['updated']} updated, "
+                        f"{stats['unchanged']} unchanged",
+                    )
                 logger.info(f"ZIP ingest complete: {stats}")
+                return True
 
         except zipfile.BadZipFile as exc:
             logger.error(f"Bad ZIP: {exc}")
             stats["errors"] += 1
+            return False
 
-    # ── Bootstrap fallback (getMasterListRaw + getBill per bill) ──────────────
-
-    def _bootstrap_via_masterlist(
+    def _run_ingest_pipeline(
         self,
+        zf: zipfile.ZipFile,
+        batches: list[tuple[str, list[str], int]],
+        total: int,
         session_id: int,
         jurisdiction: str,
+        known_hashes: dict[int, str],
         progress_cb: Optional[Callable],
-    ) -> dict:
+        stats: dict,
+        start_index: int,
+        checkpoint_key: str,
+        zip_hash: str,
+    ) -> None:
+        """
+        Feed ZIP batches through the parse pool into the single SQLite writer.
+        Batches ending at or before start_index were committed by an earlier
+        run and are skipped.
+        """
+        conn = self._get_conn()
+        written = queue.Queue(maxsize=_INGEST_QUEUE_BATCHES)
+        done_files = [start_index]
+        writer_exc: list[BaseException] = []
+        # Writer-thread state for the whole ingest.
+        unchanged_ids: set[int] = set()
+        votes = _VoteWriter(conn, {r[0] for r in conn.execute("SELECT people_id FROM people")})
+        # The ZIP's vote/ files carry every roll call in full, so the summary
+        # copies embedded in each bill file would only be overwritten.
+        embedded_votes = not any(kind == "vote" for kind, _, _ in batches)
+
+        def _writer() -> None:
+            while True:
+                item = written.get()
+                if item is None:
+                    return
+                if writer_exc:
+                    continue                      # keep draining so the feeder never blocks
+                kind, records, errors, n_files, end_index = item
+                try:
+                    self._write_parsed_batch(
+                        conn, kind, records, stats, unchanged_ids, votes, embedded_votes
+                    )
+                    votes.flush()
+                    self._meta_set(
+                        checkpoint_key,
+                        json.dumps({"zip_hash": zip_hash, "member_index": end_index}),
+                    )
+                    stats["errors"] += errors
+                    self._commit(conn)
+                    done_files[0] += n_files
+                except BaseException as exc:
+                    writer_exc.append(exc)
+                    conn.rollback()
+
+        pool: Optional[ProcessPoolExecutor] = None
+        if self.parse_workers > 1 and total >= _PARALLEL_PARSE_MIN_FILES:
+            try:
+                pool = ProcessPoolExecutor(
+                    max_workers=self.parse_workers,
+                    initializer=_init_parse_worker,
+                    initargs=(known_hashes,),
+                )
+            except (OSError, NotImplementedError) as exc:
+                logger.warning(f"Parse pool unavailable ({exc}); parsing in-process")
+
+        def _parse_inline(kind: str, members: list[bytes]) -> Future:
+            fut: Future = Future()
+            fut.set_result(
+                _parse_zip_members(kind, members, jurisdiction, session_id, known_hashes)
+            )
+            return fut
+
+        def _submit(kind: str, members: list[bytes]) -> Future:
+            nonlocal pool
+            if pool is not None:
+                try:
+                    return pool.submit(_parse_zip_members, kind, members, jurisdiction, session_id)
+                except (BrokenProcessPool, RuntimeError, OSError) as exc:
+                    logger.warning(f"Parse pool failed ({exc}); parsing in-process")
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = None
+            return _parse_inline(kind, members)
+
+        def _hand_off(fut: Future, kind: str, members: list[bytes], end_index: int) -> None:
+            try:
+                records, errors = fut.result()
+            except BrokenProcessPool:
+                records, errors = _parse_inline(kind, members).result()
+            written.put((kind, records, errors, len(members), end_index))
+            if progress_cb:
+                progress_cb(
+                    0.1 + 0.85 * (done_files[0] / max(total, 1)),
+                    f"Ingested {done_files[0]}/{total} files…",
+                )
+
+        writer = threading.Thread(target=_writer, name="corpus-ingest-writer", daemon=True)
+        writer.start()
+        in_flight: deque = deque()
+        max_in_flight = max(2, 2 * self.parse_workers) if pool else 1
+        try:
+            for kind, names, end_index in batches:
+                if writer_exc:
+                    break
+                if end_index <= start_index:
+                    continue
+                members = [zf.read(n) for n in names]
+                in_flight.append((_submit(kind, members), kind, members, end_index))
+                while len(in_flight) >= max_in_flight:
+                    _hand_off(*in_flight.popleft())
+            while in_flight and not writer_exc:
+                _hand_off(*in_flight.popleft())
+        finally:
+            written.put(None)
+            writer.join()
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        if writer_exc:
+            raise writer_exc[0]
+
+    def _write_parsed_batch(
+        self,
+        conn: sqlite3.Connection,
+        kind: str,
+        records: list[dict],
+        stats: dict,
+        unchanged_ids: set[int],
+        votes: _VoteWriter,
+        embedded_votes: bool,
+    ) -> None:
+        """
+        Write one parsed batch (see _parse_zip_members) inside the current
+        transaction; roll calls are buffered in ``votes`` for the caller to
+        flush.  Unchanged bills are collected into unchanged_ids so the roll
+        calls from the ZIP's vote files for them are skipped too.
+        """
+        if kind == "bill":
+            changed = [rec for rec in records if "unchanged" not in rec]
+            for rec in records:
+                if "unchanged" in rec:
+                    unchanged_ids.add(rec["unchanged"])
+            stats["unchanged"] += len(records) - len(changed)
+            for rec in changed:
+                for sponsor in rec["sponsors"]:
+                    self._upsert_person(conn, sponsor)
+            self._upsert_bills(conn, [rec["row"] for rec in changed], stats)
+            if embedded_votes:
+                for rec in changed:
+                    for r in rec["votes"]:
+                        votes.add(r, rec["row"]["bill_id"])
+            return
+        for rec in records:
+            if kind == "person":
+                try:
+                    self._upsert_person(conn, rec["person"])
+                except Exception: pass
+            else:
+                r = rec["roll_call"]
+                try:
+                    if int(r["bill_id"]) in unchanged_ids:
+                        continue
+                    votes.add(r, int(r["bill_id"]))
+                except Exception: pass
+
+    # ── Bootstrap fallback (getMasterListRaw + getBill per bill) ──────────────
+
+    def _bootstrap_via_masterlist(
+        self,
+        session_id: int,
+        jurisdiction: str,
+        progress_cb: Optional[Callable],
+    ) -> dict:
         """
         Fallback bootstrap when getDataset is unavailable.
         Fetches getMasterListRaw, then getBill for each uncached bill.
@@ -715,9 +2122,8 @@ class CorpusManager:
             f"Need to fetch {len(to_fetch)} bills ({len(cached_ids)} already cached)"
         )
 
-        for i, meta in enumerate(to_fetch):
-            bid = meta["bill_id"]
-            detail_data = self._api_get({"op": "getBill", "id": bid})
+        fetched: list[tuple[dict, dict]] = []
+        for i, (meta, detail_data) in enumerate(self._fetch_bill_details(to_fetch)):
             if detail_data.get("status") != "OK":
                 stats["errors"] += 1
                 continue
@@ -733,11 +2139,10 @@ class CorpusManager:
 
             bill_detail["change_hash"] = meta.get("change_hash", "")
             row = _flatten_bill_to_row(bill_detail, jurisdiction, session_id)
-            self._upsert_bill(conn, row, stats)
-            self._process_bill_votes(conn, bill_detail)
+            fetched.append((row, bill_detail))
 
             if (i + 1) % 50 == 0:
-                conn.commit()
+                self._write_fetched_bills(conn, fetched, stats)
                 logger.info(
                     f"Bootstrap progress: {i + 1}/{len(to_fetch)} fetched"
                     f" (total API calls: {self._api_calls_run})"
@@ -748,23 +2153,27 @@ class CorpusManager:
                         f"Fetched {i + 1}/{len(to_fetch)} bills…",
                     )
 
-        conn.commit()
+        self._write_fetched_bills(conn, fetched, stats)
         stats["skipped"] = len(cached_ids)
         self._record_bootstrap(session_id, jurisdiction)
         return stats
 
-    def _record_bootstrap(self, session_id: int, jurisdiction: str) -> None:
+    def _record_bootstrap(
+        self, session_id: int, jurisdiction: str, dataset_hash: Optional[str] = None
+    ) -> None:
         now = datetime.now(timezone.utc).isoformat()
         conn = self._get_conn()
         conn.execute(
-            "UPDATE sessions SET last_bootstrap=? WHERE session_id=?",
-            (now, session_id),
+            "UPDATE sessions SET last_bootstrap=?, dataset_hash=COALESCE(?, dataset_hash) "
+            "WHERE session_id=?",
+            (now, dataset_hash, session_id),
         )
         self._meta_set(f"last_bootstrap_{jurisdiction}", now)
-        conn.commit()
+        self._commit(conn)
 
     # ── Incremental refresh (getMasterListRaw diff) ───────────────────────────
 
+    @_counts_api_calls
     def refresh_session(
         self,
         session_id: int,
@@ -782,7 +2191,6 @@ class CorpusManager:
         stats: dict[str, int] = {
             "new": 0, "updated": 0, "skipped": 0, "errors": 0, "api_calls": 0
         }
-        start_calls = self._api_calls_run
         conn = self._get_conn()
 
         logger.info(
@@ -791,28 +2199,94 @@ class CorpusManager:
         if progress_cb:
             progress_cb(0.0, "Fetching master bill list…")
 
-        data = self._api_get({"op": "getMasterListRaw", "id": session_id})
+        data = self._get_masterlist(session_id)
         if data.get("status") != "OK":
             logger.error(f"getMasterListRaw failed: {data}")
-            stats["api_calls"] = self._api_calls_run - start_calls
+            stats["api_calls"] = _scope_api_calls()
             return stats
 
-        master = data.get("masterlist", {})
+        to_fetch, stats["skipped"] = self._bills_to_refresh(session_id, data)
+        total_fetch = len(to_fetch)
+        logger.info(
+            f"Refresh: {stats['skipped']} unchanged, {total_fetch} to fetch"
+        )
+
+        fetched: list[tuple[dict, dict]] = []
+        for i, (meta, detail_data) in enumerate(self._fetch_bill_details(to_fetch)):
+            if detail_data.get("status") != "OK":
+                logger.warning(f"getBill failed bill_id={meta['bill_id']}: {detail_data}")
+                stats["errors"] += 1
+                continue
+
+            bill_detail = detail_data.get("bill", {})
+            if not bill_detail:
+                stats["errors"] += 1
+                continue
+
+            bill_detail["change_hash"] = meta.get("change_hash", "")
+            row = _flatten_bill_to_row(bill_detail, jurisdiction, session_id)
+            fetched.append((row, bill_detail))
+
+            if (i + 1) % 25 == 0:
+                self._write_fetched_bills(conn, fetched, stats)
+                if progress_cb:
+                    progress_cb(
+                        (i + 1) / max(total_fetch, 1),
+                        f"Updated {i + 1}/{total_fetch} changed bills…",
+                    )
+
+        self._write_fetched_bills(conn, fetched, stats)
+
+        now = datetime.now(timezone.utc).isoformat()
+        conn.execute(
+            "UPDATE sessions SET last_masterlist=? WHERE session_id=?",
+            (now, session_id),
+        )
+        self._meta_set(f"last_incremental_{jurisdiction}", now)
+        self._commit(conn)
+
+        stats["api_calls"] = _scope_api_calls()
+        logger.info(f"Incremental refresh complete: {stats} (response cache: {self._response_cache.stats()})")
+        return stats
+
+    def _get_masterlist(self, session_id: int) -> dict:
+        """
+        getMasterListRaw, reusing a response fetched by plan_refresh in the
+        last _MASTERLIST_REUSE_S seconds (consumed on use).
+        """
+        memo = self._masterlist_memo.pop(session_id, None)
+        if memo and time.time() - memo[0] < _MASTERLIST_REUSE_S:
+            return memo[1]
+        return self._api_get({"op": "getMasterListRaw", "id": session_id})
+
+    def prefetch_masterlists(self, session_ids: list[int]) -> Iterator[tuple[int, dict]]:
+        """
+        Yield (session_id, getMasterListRaw response) in order, with the
+        calls for later sessions already in flight while the caller
+        refreshes earlier ones.  Pass each response to plan_refresh (or
+        leave it to refresh_session) so it isn't fetched twice.
+        """
+        calls = [({"op": "getMasterListRaw", "id": sid}, "") for sid in session_ids]
+        return zip(session_ids, self._fetch_many(calls, cached=False))
+
+    def _bills_to_refresh(self, session_id: int, masterlist: dict) -> tuple[list[dict], int]:
+        """Masterlist entries that are new or whose change_hash moved; plus the unchanged count."""
         bills_meta = [
-            v for v in master.values()
+            v for v in masterlist.get("masterlist", {}).values()
             if isinstance(v, dict) and "bill_id" in v
         ]
 
         # Load all cached hashes in one query
         cached_hashes: dict[int, str] = {
             r[0]: r[1]
-            for r in conn.execute(
+            for r in self._get_conn().execute(
                 "SELECT bill_id, change_hash FROM bills WHERE session_id=?",
                 (session_id,),
             ).fetchall()
         }
 
         to_fetch: list[dict] = []
+        unchanged = 0
         for meta in bills_meta:
             bid      = meta.get("bill_id")
             new_hash = meta.get("change_hash", "")
@@ -823,51 +2297,331 @@ class CorpusManager:
             elif new_hash and cached_hashes[bid] != new_hash:
                 to_fetch.append(meta)              # hash changed → updated
             else:
-                stats["skipped"] += 1              # unchanged
+                unchanged += 1                     # unchanged
+        return to_fetch, unchanged
 
-        total_fetch = len(to_fetch)
-        logger.info(
-            f"Refresh: {stats['skipped']} unchanged, {total_fetch} to fetch"
+    def _fetch_bill_details(self, metas: list[dict]) -> Iterator[tuple[dict, dict]]:
+        """Yield (meta, getBill response) for each masterlist entry, in order."""
+        calls = [({"op": "getBill", "id": m["bill_id"]}, m.get("change_hash", "")) for m in metas]
+        return zip(metas, self._fetch_many(calls))
+
+    def _fetch_many(self, calls: list[tuple[dict, str]], cached: bool = True) -> Iterator[dict]:
+        """
+        Yield _api_get_cached responses for (params, version) pairs, in order
+        (plain _api_get responses with cached=False).
+
+        Requests run on fetch_workers threads, paced by the process-wide
+        token bucket; only a bounded window of responses is in flight, so a
+        burst of thousands of calls is not buffered in memory.  The caller
+        consumes results (and writes SQLite) on its own thread.
+        """
+        def _get(call: tuple[dict, str]) -> dict:
+            return self._api_get_cached(*call) if cached else self._api_get(call[0])
+
+        if self.fetch_workers <= 1 or len(calls) < 2:
+            for call in calls:
+                yield _get(call)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=self.fetch_workers, thread_name_prefix="legiscan-fetch"
+        ) as pool:
+            pending = iter(calls)
+            window: deque[Future] = deque(
+                pool.submit(contextvars.copy_context().run, _get, c)
+                for c in itertools.islice(pending, self.fetch_workers * 4)
+            )
+            while window:
+                fut = window.popleft()
+                nxt = next(pending, None)
+                if nxt is not None:
+                    window.append(pool.submit(contextvars.copy_context().run, _get, nxt))
+                yield fut.result()
+
+    # ── Cost planning ─────────────────────────────────────────────────────────
+
+    def _plan(self, task: str, breakdown: dict[str, int], **extra) -> dict:
+        """Wrap a per-op call estimate with the key's remaining monthly budget."""
+        used = self.quota.used(self.api_key)
+        remaining = max(0, self.quota.monthly_budget - used)
+        total = sum(breakdown.values())
+        plan = {
+            "task": task,
+            "estimated_calls": total,
+            "breakdown": breakdown,
+            "budget": self.quota.monthly_budget,
+            "used_this_month": used,
+            "remaining": remaining,
+            "allowed": total <= remaining,
+            "reason": "",
+            **extra,
+        }
+        if not plan["allowed"]:
+            plan["reason"] = (
+                f"{task} needs ~{total} API calls but only {remaining} of "
+                f"{self.quota.monthly_budget} remain this month"
+            )
+        return plan
+
+    def plan_refresh(self, session_id: int, jurisdiction: str, masterlist: Optional[dict] = None) -> dict:
+        """
+        Estimate what refresh_session would cost.  Spends one getMasterListRaw
+        call (unless the response is passed in as masterlist), which a
+        refresh started within _MASTERLIST_REUSE_S reuses.
+        refresh only fetches roll calls it has no member votes for, so
+        getRollCall is estimated for new bills alone, at the session's roll
+        calls per stored bill; votes recorded on already-stored bills since
+        the last sync are not counted.
+        When the per-bill calls exceed _DATASET_SUGGEST_ABOVE the plan
+        carries a "suggestion" to re-bootstrap from the dataset instead.
+        """
+        data = masterlist or self._api_get({"op": "getMasterListRaw", "id": session_id})
+        if data.get("status") != "OK":
+            plan = self._plan(
+                "refresh", {"getMasterListRaw": 1},
+                session_id=session_id, jurisdiction=jurisdiction, api_calls_spent=1,
+            )
+            plan.update(allowed=False, reason=f"getMasterListRaw failed: {data.get('error', data.get('status'))}")
+            return plan
+        self._masterlist_memo[session_id] = (time.time(), data)
+
+        to_fetch, unchanged = self._bills_to_refresh(session_id, data)
+        conn = self._get_conn()
+        stored = {r[0] for r in conn.execute("SELECT bill_id FROM bills WHERE session_id=?", (session_id,))}
+        new_bills = sum(1 for m in to_fetch if m["bill_id"] not in stored)
+        rc_per_bill = conn.execute(
+            "SELECT CAST(COUNT(rc.roll_call_id) AS REAL) / MAX(COUNT(DISTINCT b.bill_id), 1) "
+            "FROM bills b LEFT JOIN roll_calls rc ON rc.bill_id = b.bill_id WHERE b.session_id=?",
+            (session_id,),
+        ).fetchone()[0] or 0.0
+        breakdown = {
+            "getMasterListRaw": 1,
+            "getBill": len(to_fetch),
+            "getRollCall": round(new_bills * rc_per_bill),
+        }
+        plan = self._plan(
+            "refresh", breakdown,
+            session_id=session_id, jurisdiction=jurisdiction,
+            to_fetch=len(to_fetch), new_bills=new_bills, unchanged=unchanged, api_calls_spent=1,
         )
+        per_bill = breakdown["getBill"] + breakdown["getRollCall"]
+        if per_bill > _DATASET_SUGGEST_ABOVE:
+            plan["suggestion"] = {
+                "task": "bootstrap",
+                "estimated_calls": 2,
+                "reason": (
+                    f"refresh would need {breakdown['getBill']} getBill + "
+                    f"~{breakdown['getRollCall']} getRollCall calls; a single getDataset "
+                    f"re-bootstrap costs 2 (datasets are rebuilt weekly, so may lag)"
+                ),
+            }
+        return plan
 
-        for i, meta in enumerate(to_fetch):
-            bid = meta["bill_id"]
-            detail_data = self._api_get({"op": "getBill", "id": bid})
-            if detail_data.get("status") != "OK":
-                logger.warning(f"getBill failed bill_id={bid}: {detail_data}")
-                stats["errors"] += 1
-                continue
+    def plan_bootstrap(self, session_id: int, jurisdiction: str) -> dict:
+        """
+        Estimate bootstrap_session's cost without spending a call: one
+        getDatasetList, plus one getDataset unless the session's newest
+        cached ZIP is already ingested.  The masterlist fallback (sessions
+        without a dataset) can't be sized up front and is not included.
+        """
+        row = self._get_conn().execute(
+            "SELECT dataset_hash FROM sessions WHERE session_id=?", (session_id,)
+        ).fetchone()
+        cached = self._dataset_cache.latest_for_session(session_id)
+        ingested = bool(row and row[0] and cached and cached["dataset_hash"] == row[0])
+        return self._plan(
+            "bootstrap",
+            {"getDatasetList": 1, "getDataset": 0 if ingested else 1},
+            session_id=session_id, jurisdiction=jurisdiction,
+        )
 
-            bill_detail = detail_data.get("bill", {})
-            if not bill_detail:
-                stats["errors"] += 1
-                continue
+    def plan_rescan(self, states: list[str], n_keywords: int) -> dict:
+        """
+        Estimate a keyword rescan: one getSearchRaw per state x keyword.
+        getBill calls for new/changed matches come on top and are not known
+        until the searches return.
+        """
+        return self._plan(
+            "rescan", {"getSearchRaw": len(states) * n_keywords},
+            states=len(states), keywords=n_keywords,
+        )
 
-            bill_detail["change_hash"] = meta.get("change_hash", "")
-            row = _flatten_bill_to_row(bill_detail, jurisdiction, session_id)
-            self._upsert_bill(conn, row, stats)
-            self._process_bill_votes(conn, bill_detail)
+    def get_api_usage(self) -> dict[str, int]:
+        """This month's LegiScan calls for this key, per op (local only)."""
+        return self.quota.usage_by_op(self.api_key)
 
-            if (i + 1) % 25 == 0:
-                conn.commit()
-                if progress_cb:
-                    progress_cb(
-                        (i + 1) / max(total_fetch, 1),
-                        f"Updated {i + 1}/{total_fetch} changed bills…",
-                    )
+    # ── Cheapest-path sync ────────────────────────────────────────────────────
 
-        conn.commit()
+    def plan_sync(self, session_id: int, jurisdiction: str) -> dict:
+        """
+        Choose between the two ways of bringing a session up to date and
+        estimate the cost of each:
+
+          refresh  getBill per new/changed masterlist entry, plus getRollCall
+          dataset  getDataset (0 if the ZIP is cached) for the newest dataset,
+                   then a refresh of whatever changed after its dataset_date
+
+        Spends getMasterListRaw (reused by the refresh that follows) and,
+        unless the masterlist diff is empty, getDatasetList.  The dataset path
+        is only considered when its dataset_hash hasn't been ingested yet and
+        it is newer than the session's last refresh; it must be strictly
+        cheaper, since a refresh never lags behind LegiScan.
+
+        Returns a _plan dict with "path" ("refresh" or "dataset"),
+        "path_reason", "alternative" and, for the dataset path, "dataset"
+        (the getDatasetList entry).
+        """
+        refresh = self.plan_refresh(session_id, jurisdiction)
+        if "to_fetch" not in refresh:
+            refresh.update(task="sync", path="refresh", path_reason=refresh["reason"], alternative=None)
+            return refresh
+
+        per_bill = refresh["breakdown"]["getBill"] + refresh["breakdown"]["getRollCall"]
+        spent = {"getMasterListRaw": 1}
+
+        def _choose(path: str, why: str, breakdown: dict, alternative: Optional[dict] = None, **extra) -> dict:
+            return self._plan(
+                "sync", {**spent, **breakdown},
+                session_id=session_id, jurisdiction=jurisdiction,
+                to_fetch=refresh["to_fetch"], unchanged=refresh["unchanged"],
+                api_calls_spent=sum(spent.values()),
+                path=path, path_reason=why, alternative=alternative, **extra,
+            )
 
-        now = datetime.now(timezone.utc).isoformat()
-        conn.execute(
-            "UPDATE sessions SET last_masterlist=? WHERE session_id=?",
-            (now, session_id),
+        refresh_breakdown = {k: v for k, v in refresh["breakdown"].items() if k != "getMasterListRaw"}
+        if per_bill == 0:
+            return _choose("refresh", "masterlist matches local change hashes; nothing to fetch", refresh_breakdown)
+
+        spent["getDatasetList"] = 1
+        ds = next(
+            (d for d in self.get_dataset_list(jurisdiction) if d.get("session_id") == session_id), None
         )
-        self._meta_set(f"last_incremental_{jurisdiction}", now)
-        conn.commit()
+        refresh_alt = {"path": "refresh", "estimated_calls": per_bill}
+        if not ds:
+            return _choose("refresh", "no dataset is published for this session", refresh_breakdown)
+        dataset_hash = ds.get("dataset_hash", "")
+        dataset_date = ds.get("dataset_date", "") or ""
+        if dataset_hash and self._dataset_is_current(session_id, dataset_hash):
+            return _choose(
+                "refresh", f"dataset {dataset_hash} ({dataset_date}) is already ingested", refresh_breakdown
+            )
+        row = self._get_conn().execute(
+            "SELECT last_masterlist, last_bootstrap, year_start FROM sessions WHERE session_id=?",
+            (session_id,),
+        ).fetchone()
+        last_refresh = (row[0] or "") if row else ""
+        if last_refresh and dataset_date and last_refresh[:10] >= dataset_date[:10]:
+            return _choose(
+                "refresh",
+                f"dataset dated {dataset_date} is not newer than the last refresh ({last_refresh[:10]})",
+                refresh_breakdown,
+            )
+
+        # Entries that changed after the dataset was built still need getBill
+        # afterwards.  getMasterListRaw entries usually carry no dates; those
+        # are assumed to have changed evenly over time since the last sync
+        # (or the session start), so the share after dataset_date follows.
+        memo = self._masterlist_memo.get(session_id)
+        to_fetch, _ = self._bills_to_refresh(session_id, memo[1]) if memo else ([], 0)
+        dated = [m.get("last_action_date") or m.get("status_date") for m in to_fetch]
+        dated = [d for d in dated if d]
+        after = sum(1 for d in dated if not dataset_date or d > dataset_date)
+        undated = refresh["to_fetch"] - len(dated)
+        assumption = ""
+        if undated > 0:
+            share, basis = self._share_after_dataset(dataset_date, row)
+            after += math.ceil(undated * share)
+            assumption = (
+                f"; {undated} undated masterlist changes assumed {share:.0%} after the "
+                f"dataset ({basis})"
+            )
+        rc_per_bill = refresh["breakdown"]["getRollCall"] / max(refresh["breakdown"]["getBill"], 1)
+        cached = self._dataset_cache.latest_for_session(session_id)
+        dataset_breakdown = {
+            "getDataset": 0 if cached and cached["dataset_hash"] == dataset_hash else 1,
+            "getBill": after,
+            "getRollCall": round(after * rc_per_bill),
+        }
+        dataset_cost = sum(dataset_breakdown.values())
+        if dataset_cost < per_bill:
+            return _choose(
+                "dataset",
+                f"dataset {dataset_hash} ({dataset_date}) costs ~{dataset_cost} calls vs "
+                f"~{per_bill} for a getBill refresh of {refresh['to_fetch']} bills{assumption}",
+                dataset_breakdown, alternative=refresh_alt, dataset=ds,
+            )
+        return _choose(
+            "refresh",
+            f"getBill refresh of {refresh['to_fetch']} bills costs ~{per_bill} calls vs "
+            f"~{dataset_cost} via dataset {dataset_hash} ({dataset_date}){assumption}",
+            refresh_breakdown, alternative={"path": "dataset", "estimated_calls": dataset_cost},
+        )
+
+    @staticmethod
+    def _share_after_dataset(dataset_date: str, session_row) -> tuple[float, str]:
+        """
+        Estimated fraction of undated masterlist changes made after
+        dataset_date, assuming changes spread evenly since the session's last
+        sync (or its start), plus a description of that basis.  1.0 when
+        there is nothing to measure against.
+        """
+        today = datetime.now(timezone.utc).date()
+        try:
+            ds_day = date.fromisoformat(dataset_date[:10])
+        except ValueError:
+            return 1.0, "dataset has no date"
+        last_sync = session_row and (session_row[0] or session_row[1])
+        if last_sync:
+            since = date.fromisoformat(last_sync[:10])
+            basis = f"changes spread evenly since the last sync {last_sync[:10]}"
+        elif session_row and session_row[2]:
+            since = date(int(session_row[2]), 1, 1)
+            basis = f"changes spread evenly since the session began in {session_row[2]}"
+        else:
+            return 1.0, "no sync history to measure against"
+        span = max((today - since).days, 1)
+        return min(1.0, max(0.0, (today - ds_day).days / span)), basis
+
+    @_counts_api_calls
+    def sync_session(
+        self,
+        session_id: int,
+        jurisdiction: str,
+        progress_cb: Optional[Callable[[float, str], None]] = None,
+        plan: Optional[dict] = None,
+    ) -> dict:
+        """
+        Bring a session up to date by the cheaper of refresh_session and a
+        dataset re-bootstrap, as chosen by plan_sync (pass a plan already
+        computed to avoid re-planning).  The dataset path is followed by a
+        refresh, which picks up bills changed since the dataset was built.
+
+        Returns the stats of the path taken plus "path" and "path_reason";
+        api_calls includes the planning calls when the plan is made here.
+        """
+        plan = plan or self.plan_sync(session_id, jurisdiction)
+        logger.info(f"Sync {jurisdiction} session {session_id}: {plan['path']} — {plan['path_reason']}")
+
+        if plan["path"] == "dataset":
+            def _boot_cb(f: float, msg: str) -> None:
+                if progress_cb:
+                    progress_cb(0.8 * f, msg)
 
-        stats["api_calls"] = self._api_calls_run - start_calls
-        logger.info(f"Incremental refresh complete: {stats}")
+            def _refresh_cb(f: float, msg: str) -> None:
+                if progress_cb:
+                    progress_cb(0.8 + 0.2 * f, msg)
+
+            stats = self.bootstrap_session(session_id, jurisdiction, _boot_cb, dataset=plan["dataset"])
+            after = self.refresh_session(session_id, jurisdiction, _refresh_cb)
+            for k in ("new", "updated", "errors"):
+                stats[k] = stats.get(k, 0) + after.get(k, 0)
+            stats["refreshed_after_dataset"] = after.get("new", 0) + after.get("updated", 0)
+        else:
+            stats = self.refresh_session(session_id, jurisdiction, progress_cb)
+
+        stats["path"] = plan["path"]
+        stats["path_reason"] = plan["path_reason"]
+        stats["api_calls"] = _scope_api_calls()
         return stats
 
     # ── Upsert helper ─────────────────────────────────────────────────────────
@@ -876,67 +2630,115 @@ class CorpusManager:
         self, conn: sqlite3.Connection, row: dict, stats: dict
     ) -> None:
         """Insert or update one bill row; increment stats counters."""
-        exists = conn.execute(
-            "SELECT 1 FROM bills WHERE bill_id=?", (row["bill_id"],)
-        ).fetchone()
+        self._upsert_bills(conn, [row], stats)
 
-        if exists:
-            conn.execute(
-                """
-                UPDATE bills SET
-                    session_id=?, jurisdiction=?, bill_number=?, title=?,
-                    description=?, status_date=?, status_stage=?, url=?,
-                    committee=?, sponsor_names=?, subjects=?, history=?,
-                    last_action=?, last_action_date=?, referrals=?,
-                    change_hash=?, last_fetched=?
-                WHERE bill_id=?
-                """,
-                (
-                    row["session_id"], row["jurisdiction"], row["bill_number"],
-                    row["title"], row["description"], row["status_date"],
-                    row["status_stage"], row["url"], row["committee"],
-                    row["sponsor_names"], row["subjects"], row["history"],
-                    row["last_action"], row["last_action_date"], row["referrals"],
-                    row["change_hash"], row["last_fetched"], row["bill_id"],
-                ),
+    def _upsert_bills(
+        self, conn: sqlite3.Connection, rows: list[dict], stats: dict
+    ) -> None:
+        """
+        Set-based upsert of flattened bill rows; increment stats counters.
+
+        One pre-query finds which bill_ids already exist (for the new vs
+        updated split), then all rows go through a single executemany of
+        INSERT … ON CONFLICT DO UPDATE.  latest_doc_id and latest_doc_url
+        are kept when the incoming row has none, so text lookups stay cached
+        and the stored id keeps its URL.
+        """
+        if not rows:
+            return
+        ids = [row["bill_id"] for row in rows]
+        seen: set[int] = set()
+        for i in range(0, len(ids), _SQLITE_MAX_VARS):
+            chunk = ids[i:i + _SQLITE_MAX_VARS]
+            seen.update(
+                r[0] for r in conn.execute(
+                    f"SELECT bill_id FROM bills WHERE bill_id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
             )
-            stats["updated"] += 1
-        else:
-            conn.execute(
-                """
-                INSERT INTO bills (
-                    bill_id, session_id, jurisdiction, bill_number, title,
-                    description, status_date, status_stage, url, committee,
-                    sponsor_names, subjects, history, last_action,
-                    last_action_date, referrals, change_hash, last_fetched
-                ) VALUES (?,?,?,?,?, ?,?,?,?,?, ?,?,?,?,?, ?,?,?)
-                """,
-                (
-                    row["bill_id"], row["session_id"], row["jurisdiction"],
-                    row["bill_number"], row["title"], row["description"],
-                    row["status_date"], row["status_stage"], row["url"],
-                    row["committee"], row["sponsor_names"], row["subjects"],
-                    row["history"], row["last_action"], row["last_action_date"],
-                    row["referrals"], row["change_hash"], row["last_fetched"],
-                ),
+        for bid in ids:
+            if bid in seen:
+                stats["updated"] += 1
+            else:
+                stats["new"] += 1
+                seen.add(bid)
+
+        conn.executemany(_UPSERT_BILLS_SQL, map(_bill_params, rows))
+        self._replace_bill_children(conn, rows)
+
+    def _replace_bill_children(self, conn: sqlite3.Connection, rows: list[dict]) -> None:
+        """Rewrite bill_sponsors / bill_subjects / bill_history for the given rows."""
+        rows = [row for row in rows if "children" in row]
+        if not rows:
+            return
+        ids = [row["bill_id"] for row in rows]
+        for i in range(0, len(ids), _SQLITE_MAX_VARS):
+            chunk = ids[i:i + _SQLITE_MAX_VARS]
+            marks = ",".join("?" * len(chunk))
+            for table in ("bill_sponsors", "bill_subjects", "bill_history"):
+                conn.execute(f"DELETE FROM {table} WHERE bill_id IN ({marks})", chunk)
+        conn.executemany(
+            "INSERT OR IGNORE INTO bill_sponsors "
+            "(bill_id, sponsor_order, people_id, name, party, sponsor_type_id) VALUES (?, ?, ?, ?, ?, ?)",
+            (t for row in rows for t in row["children"]["sponsors"]),
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO bill_subjects (bill_id, subject_id, subject_name) VALUES (?, ?, ?)",
+            (t for row in rows for t in row["children"]["subjects"]),
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO bill_history (bill_id, seq, date, chamber, action) VALUES (?, ?, ?, ?, ?)",
+            (t for row in rows for t in row["children"]["history"]),
+        )
+
+    def _write_fetched_bills(
+        self, conn: sqlite3.Connection, fetched: list[tuple[dict, dict]], stats: dict
+    ) -> None:
+        """Bulk-upsert a window of (row, getBill detail) pairs, then their votes, and commit."""
+        self._upsert_bills(conn, [row for row, _ in fetched], stats)
+        self._process_bill_votes(conn, [detail for _, detail in fetched])
+        self._commit(conn)
+        fetched.clear()
+
+    def _process_bill_votes(self, conn: sqlite3.Connection, bill_details: list[dict]) -> None:
+        """
+        Store the summary roll calls from a window of getBill responses, then
+        fetch full member votes for those that have none yet: one set-based
+        query finds the missing roll calls, getRollCall runs concurrently
+        through the rate-limited client, and everything is written with
+        _VoteWriter's executemany batches.
+        """
+        votes = _VoteWriter(conn)
+        rc_bill: dict[int, int] = {}
+        for detail in bill_details:
+            bill_id = detail.get("bill_id")
+            if not bill_id: continue
+            for r in detail.get("votes", []):
+                rc_id = r.get("roll_call_id")
+                if not rc_id: continue
+                votes.add(r, bill_id)
+                rc_bill[rc_id] = bill_id
+        votes.flush()
+        if not rc_bill:
+            return
+
+        ids = list(rc_bill)
+        have: set[int] = set()
+        for i in range(0, len(ids), _SQLITE_MAX_VARS):
+            chunk = ids[i:i + _SQLITE_MAX_VARS]
+            have.update(
+                r[0] for r in conn.execute(
+                    f"SELECT DISTINCT roll_call_id FROM legislator_votes "
+                    f"WHERE roll_call_id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
             )
-            stats["new"] += 1
-
-    def _process_bill_votes(self, conn: sqlite3.Connection, bill_detail: dict) -> None:
-        """Process summary votes array from getBill API, fetching full individual votes if needed."""
-        bill_id = bill_detail.get("bill_id")
-        if not bill_id: return
-        for r in bill_detail.get("votes", []):
-            rc_id = r.get("roll_call_id")
-            if not rc_id: continue
-            self._upsert_rollcall(conn, r, bill_id)
-            
-            # Check if we have individual member votes dynamically
-            v_count = conn.execute("SELECT COUNT(*) FROM legislator_votes WHERE roll_call_id=?", (rc_id,)).fetchone()[0]
-            if v_count == 0:
-                rc_data = self._api_get({"op": "getRollCall", "id": rc_id})
-                if rc_data.get("status") == "OK" and rc_data.get("roll_call"):
-                    self._upsert_rollcall(conn, rc_data["roll_call"], bill_id)
+        missing = [rc_id for rc_id in ids if rc_id not in have]
+        calls = [({"op": "getRollCall", "id": rc_id}, "") for rc_id in missing]
+        for rc_id, rc_data in zip(missing, self._fetch_many(calls)):
+            if rc_data.get("status") == "OK" and rc_data.get("roll_call"):
+                votes.add(rc_data["roll_call"], rc_bill[rc_id])
+        votes.flush()
 
     # ── Keyword match overlay ─────────────────────────────────────────────────
 
@@ -950,7 +2752,7 @@ class CorpusManager:
             """,
             (bill_id, keyword, datetime.now(timezone.utc).isoformat()),
         )
-        conn.commit()
+        self._commit(conn)
 
     def get_keyword_matches(self, bill_id: int) -> list[str]:
         """Return list of keywords that matched this bill."""
@@ -959,8 +2761,45 @@ class CorpusManager:
         ).fetchall()
         return [r[0] for r in rows]
 
+    # ── User bill notes (mirror for search filters) ───────────────────────────
+
+    def sync_bill_notes(self, username: str, notes: dict) -> bool:
+        """
+        Mirror username's bill notes ({bill_id: {"position", "priority",
+        "last_reviewed", …}}, as kept in bill_notes.json) into the bill_notes
+        table so BillFilter position/priority filters run in SQL.  The JSON
+        file stays the source of truth; unchanged notes (by digest) are not
+        rewritten.  Returns True if the table was updated.
+        """
+        rows = [
+            (username, int(bid), n.get("position") or None, n.get("priority") or None,
+             n.get("last_reviewed") or None)
+            for bid, n in notes.items()
+            if str(bid).isdigit() and isinstance(n, dict)
+        ]
+        digest = hashlib.sha1(json.dumps(sorted(rows)).encode("utf-8")).hexdigest()
+        meta_key = f"bill_notes_digest:{username}"
+        if self._meta_get(meta_key) == digest:
+            return False
+        conn = self._get_conn()
+        try:
+            with conn:
+                conn.execute("DELETE FROM bill_notes WHERE username=?", (username,))
+                conn.executemany(
+                    "INSERT INTO bill_notes (username, bill_id, position, priority, last_reviewed) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._meta_set(meta_key, digest)
+                conn.execute(_BUMP_GENERATION_SQL)
+        except Exception as e:
+            logger.error(f"Failed to sync bill notes for {username}: {e}")
+            return False
+        return True
+
     # ── Search interface (returns DataFrame matching legacy CSV schema) ────────
 
+    @_memoized
     def search_bills(
         self,
         query: str = "",
@@ -968,6 +2807,14 @@ class CorpusManager:
         status_filter: Optional[list[str]] = None,
         keyword_filter: Optional[list[str]] = None,
         limit: int = 500,
+        sponsor_filter: Optional[list[str]] = None,
+        sponsor_people_ids: Optional[list[int]] = None,
+        committee_filter: Optional[list[str]] = None,
+        subject_filter: Optional[list[str]] = None,
+        bill_id_filter: Optional[list[int]] = None,
+        order_by: Optional[str] = None,
+        after: Optional[tuple] = None,
+        filters: Optional[BillFilter] = None,
     ) -> pd.DataFrame:
         """
         Search the master corpus.
@@ -979,45 +2826,59 @@ class CorpusManager:
         last_action_date, referrals, keyword, session) so that all existing
         _render_bill_expander(), filter, and export code works unchanged.
 
+        query searches bill_number, title, description, sponsor_names and
+        subjects through the bills_fts index, best matches (bm25) first.
+        Plain words match as prefixes and must all appear; FTS5 syntax
+        ("quoted phrase", OR, NOT, word*, title:word) is honoured, and input
+        that doesn't parse is searched as plain words.  Without FTS5 the
+        query is a substring (LIKE) scan ordered by status_date.
+
         jurisdiction_filter entries may be friendly names ("California") or
-        jurisdiction codes ("CA").
+        jurisdiction codes ("CA").  Sponsor (by name or people_id) and subject
+        filters are index lookups on bill_sponsors / bill_subjects.  filters
+        (a BillFilter) replaces all the individual filter arguments.
+
+        Paging is by keyset: order_by names an entry of BILL_ORDERS (default
+        "rank" for a full-text query, else "status_date") and after is the
+        next_cursor() of the previous page, so page N costs the same as page
+        1.  count_bills() takes the same filters for the total.
         """
-        conn = self._get_conn()
-        conditions: list[str] = []
-        params: list = []
-
-        if query:
-            q = f"%{query.lower()}%"
-            conditions.append(
-                "(LOWER(b.bill_number) LIKE ? OR LOWER(b.title) LIKE ? "
-                "OR LOWER(b.description) LIKE ? OR LOWER(b.sponsor_names) LIKE ?)"
-            )
-            params.extend([q, q, q, q])
-
-        if jurisdiction_filter:
-            # Accept both friendly names and raw codes
-            label_to_code = {v: k for k, v in JURISDICTION_LABELS.items()}
-            codes = [
-                label_to_code.get(j, j) for j in jurisdiction_filter
-            ]
-            placeholders = ",".join("?" * len(codes))
-            conditions.append(f"b.jurisdiction IN ({placeholders})")
-            params.extend(codes)
-
-        if status_filter:
-            placeholders = ",".join("?" * len(status_filter))
-            conditions.append(f"b.status_stage IN ({placeholders})")
-            params.extend(status_filter)
-
-        if keyword_filter:
-            placeholders = ",".join("?" * len(keyword_filter))
-            conditions.append(
-                f"EXISTS (SELECT 1 FROM keyword_matches km "
-                f"WHERE km.bill_id = b.bill_id AND km.keyword IN ({placeholders}))"
-            )
-            params.extend(keyword_filter)
+        match, conditions, params = self._compile_filter(filters or BillFilter(
+            query=query,
+            jurisdiction_filter=jurisdiction_filter,
+            status_filter=status_filter,
+            keyword_filter=keyword_filter,
+            sponsor_filter=sponsor_filter,
+            sponsor_people_ids=sponsor_people_ids,
+            committee_filter=committee_filter,
+            subject_filter=subject_filter,
+            bill_id_filter=bill_id_filter,
+        ))
+        order_by = order_by or ("rank" if match else "status_date")
+        if order_by not in BILL_ORDERS or (order_by == "rank" and not match):
+            order_by = "status_date"
+        order = BILL_ORDERS[order_by]
+        if match and order_by != "rank":
+            # Evaluated once up front whatever plan SQLite picks for the rest.
+            conditions.insert(0, _FTS_IN)
+            params.insert(0, match)
+        if after is not None:
+            cond, cond_params = _keyset_condition(order, after)
+            conditions.append(cond)
+            params.extend(cond_params)
 
         where = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+        fts_join, rank_col = "", ""
+        if order_by == "rank":
+            # With no other filters the index can apply the limit itself.
+            top = "ORDER BY rank LIMIT ?" if not conditions and order_by == "rank" else ""
+            fts_join = (
+                "JOIN (SELECT rowid AS bill_id, rank FROM bills_fts "
+                f"WHERE bills_fts MATCH ? {top}) f ON f.bill_id = b.bill_id"
+            )
+            rank_col = "f.rank                                     AS search_rank,"
+            params[:0] = [match, limit] if top else [match]
+        order_sql = ", ".join(f"{expr} {'DESC' if desc else 'ASC'}" for expr, _, desc in order)
 
         sql = f"""
             SELECT
@@ -1054,27 +2915,25 @@ class CorpusManager:
                 b.latest_doc_id,
                 b.latest_doc_url,
                 b.last_fetched,
+                {rank_col}
 
                 -- ── Keyword overlay (comma-joined for display) ──
-                COALESCE(
-                    (SELECT GROUP_CONCAT(km.keyword, '; ')
-                     FROM keyword_matches km
-                     WHERE km.bill_id = b.bill_id),
-                    ''
-                )                                          AS keyword,
+                COALESCE(bk.keywords, '')                  AS keyword,
 
                 s.session_name                             AS session
 
             FROM bills b
+            {fts_join}
+            LEFT JOIN bill_keywords bk ON bk.bill_id = b.bill_id
             LEFT JOIN sessions s ON b.session_id = s.session_id
             {where}
-            ORDER BY b.status_date DESC, b.bill_number
+            ORDER BY {order_sql}
             LIMIT ?
         """
         params.append(limit)
 
         try:
-            rows = conn.execute(sql, params).fetchall()
+            rows = self._get_conn().execute(sql, params).fetchall()
         except Exception as exc:
             logger.error(f"search_bills SQL error: {exc}")
             return pd.DataFrame()
@@ -1083,8 +2942,145 @@ class CorpusManager:
             return pd.DataFrame()
         return pd.DataFrame([dict(r) for r in rows])
 
+    @_memoized
+    def count_bills(self, filters: Optional[BillFilter] = None, **filter_kwargs) -> int:
+        """
+        Number of bills search_bills() would page through for filters (or
+        for BillFilter(**filter_kwargs), i.e. search_bills' filter arguments).
+        """
+        match, conditions, params = self._compile_filter(filters or BillFilter(**filter_kwargs))
+        if match:
+            conditions.insert(0, _FTS_IN)
+            params.insert(0, match)
+        where = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+        try:
+            return self._get_conn().execute(f"SELECT COUNT(*) FROM bills b {where}", params).fetchone()[0]
+        except Exception as exc:
+            logger.error(f"count_bills SQL error: {exc}")
+            return 0
+
+    @staticmethod
+    def next_cursor(page: pd.DataFrame, order_by: str) -> Optional[tuple]:
+        """Cursor for the page after page (a search_bills() result), or None if it was empty."""
+        if page.empty:
+            return None
+        last = page.iloc[-1]
+        return tuple(
+            None if pd.isna(last[col]) else last[col].item() if hasattr(last[col], "item") else last[col]
+            for _, col, _ in BILL_ORDERS[order_by]
+        )
+
+    def _compile_filter(self, spec: BillFilter) -> tuple[Optional[str], list[str], list]:
+        """
+        WHERE conditions (over bills b) and their params for spec, plus the
+        FTS5 MATCH expression for spec.query (None when there is no query or
+        it is handled by the LIKE fallback).
+        """
+        conditions: list[str] = []
+        params: list = []
+
+        match = _fts_query(spec.query) if spec.query and self._fts else None
+        if match and not self._fts_valid(match):
+            match = _fts_query(spec.query, syntax=False)
+
+        if spec.query and not match:
+            q = f"%{spec.query.lower()}%"
+            conditions.append(
+                "(LOWER(b.bill_number) LIKE ? OR LOWER(b.title) LIKE ? "
+                "OR LOWER(b.description) LIKE ? OR LOWER(b.sponsor_names) LIKE ?)"
+            )
+            params.extend([q, q, q, q])
+
+        if spec.jurisdiction_filter:
+            # Accept both friendly names and raw codes
+            label_to_code = {v: k for k, v in JURISDICTION_LABELS.items()}
+            codes = [
+                label_to_code.get(j, j) for j in spec.jurisdiction_filter
+            ]
+            placeholders = ",".join("?" * len(codes))
+            conditions.append(f"b.jurisdiction IN ({placeholders})")
+            params.extend(codes)
+
+        if spec.status_filter:
+            placeholders = ",".join("?" * len(spec.status_filter))
+            conditions.append(f"b.status_stage IN ({placeholders})")
+            params.extend(spec.status_filter)
+
+        if spec.keyword_filter:
+            placeholders = ",".join("?" * len(spec.keyword_filter))
+            conditions.append(
+                f"b.bill_id IN (SELECT km.bill_id FROM keyword_matches km "
+                f"WHERE km.keyword IN ({placeholders}))"
+            )
+            params.extend(spec.keyword_filter)
+
+        if spec.sponsor_filter:
+            placeholders = ",".join("?" * len(spec.sponsor_filter))
+            conditions.append(
+                f"b.bill_id IN (SELECT bs.bill_id FROM bill_sponsors bs "
+                f"WHERE bs.name IN ({placeholders}))"
+            )
+            params.extend(spec.sponsor_filter)
+
+        if spec.sponsor_people_ids:
+            placeholders = ",".join("?" * len(spec.sponsor_people_ids))
+            conditions.append(
+                f"b.bill_id IN (SELECT bs.bill_id FROM bill_sponsors bs "
+                f"WHERE bs.people_id IN ({placeholders}))"
+            )
+            params.extend(int(p) for p in spec.sponsor_people_ids)
+
+        if spec.committee_filter:
+            placeholders = ",".join("?" * len(spec.committee_filter))
+            conditions.append(f"b.committee IN ({placeholders})")
+            params.extend(spec.committee_filter)
+
+        if spec.subject_filter:
+            placeholders = ",".join("?" * len(spec.subject_filter))
+            conditions.append(
+                f"b.bill_id IN (SELECT bj.bill_id FROM bill_subjects bj "
+                f"WHERE bj.subject_name IN ({placeholders}))"
+            )
+            params.extend(spec.subject_filter)
+
+        if spec.bill_id_filter is not None:
+            # json_each keeps any number of ids to a single bound parameter.
+            conditions.append("b.bill_id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps([int(b) for b in spec.bill_id_filter]))
+
+        if spec.date_from:
+            conditions.append("b.status_date >= ?")
+            params.append(str(spec.date_from))
+        if spec.date_to:
+            conditions.append("b.status_date <= ?")
+            params.append(str(spec.date_to))
+
+        if spec.notes_user and (spec.position_filter or spec.priority_filter):
+            note_conds = ["n.username = ?"]
+            params_n: list = [spec.notes_user]
+            for col, values in (("position", spec.position_filter), ("priority", spec.priority_filter)):
+                if values:
+                    note_conds.append(f"n.{col} IN ({','.join('?' * len(values))})")
+                    params_n.extend(values)
+            conditions.append(
+                f"b.bill_id IN (SELECT n.bill_id FROM bill_notes n WHERE {' AND '.join(note_conds)})"
+            )
+            params.extend(params_n)
+
+        return match, conditions, params
+
+    def _fts_valid(self, match: str) -> bool:
+        try:
+            self._get_conn().execute(
+                "SELECT 1 FROM bills_fts WHERE bills_fts MATCH ? LIMIT 1", (match,)
+            ).fetchall()
+            return True
+        except sqlite3.OperationalError:
+            return False
+
     # ── Bulk bill lookup by bill_id ───────────────────────────────────────────
 
+    @_memoized
     def get_bills_by_ids(self, bill_ids: list) -> "pd.DataFrame":
         """
         Return a DataFrame of bills whose bill_id is in the provided list.
@@ -1105,12 +3101,10 @@ class CorpusManager:
                 b.sponsor_names AS sponsor_names, b.sponsor_names AS sponsors,
                 b.subjects, b.history, b.last_action, b.last_action_date, b.referrals,
                 b.change_hash, b.latest_doc_id, b.latest_doc_url, b.last_fetched,
-                COALESCE(
-                    (SELECT GROUP_CONCAT(km.keyword, '; ')
-                     FROM keyword_matches km WHERE km.bill_id = b.bill_id), ''
-                ) AS keyword,
+                COALESCE(bk.keywords, '') AS keyword,
                 s.session_name AS session
             FROM bills b
+            LEFT JOIN bill_keywords bk ON bk.bill_id = b.bill_id
             LEFT JOIN sessions s ON b.session_id = s.session_id
             WHERE b.bill_id IN ({placeholders})
             ORDER BY b.status_date DESC
@@ -1126,10 +3120,99 @@ class CorpusManager:
             return pd.DataFrame()
         return pd.DataFrame([dict(r) for r in rows])
 
+    # ── Sponsor / subject / action lookups ────────────────────────────────────
+
+    @_memoized
+    def get_sponsor_options(self) -> list[str]:
+        """Distinct individual sponsor names (for filter widgets)."""
+        rows = self._get_conn().execute(
+            "SELECT DISTINCT name FROM bill_sponsors WHERE name != '' ORDER BY name"
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    @_memoized
+    def get_committee_options(self) -> list[str]:
+        """Distinct current committees (for filter widgets)."""
+        rows = self._get_conn().execute(
+            "SELECT DISTINCT committee FROM bills WHERE committee != '' ORDER BY committee"
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    @_memoized
+    def get_subject_options(self) -> list[str]:
+        """Distinct LegiScan subjects (for filter widgets)."""
+        rows = self._get_conn().execute(
+            "SELECT DISTINCT subject_name FROM bill_subjects ORDER BY subject_name"
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    def get_sponsor_people_ids(
+        self, staff_legislator_id: str = "", last_name: str = "", first_name: str = ""
+    ) -> list[int]:
+        """
+        Resolve a legislator to LegiScan people_ids: via people_mapping when
+        staff_legislator_id is mapped, else by exact last name (optionally
+        narrowed by first name).
+        """
+        conn = self._get_conn()
+        if staff_legislator_id:
+            rows = conn.execute(
+                "SELECT people_id FROM people_mapping WHERE staff_legislator_id=?",
+                (staff_legislator_id,),
+            ).fetchall()
+            if rows:
+                return [r[0] for r in rows]
+        if not last_name:
+            return []
+        sql = "SELECT people_id FROM people WHERE LOWER(last_name)=?"
+        params: list = [last_name.lower()]
+        if first_name:
+            sql += " AND LOWER(first_name) LIKE ?"
+            params.append(f"{first_name.lower()}%")
+        return [r[0] for r in conn.execute(sql, params).fetchall()]
+
+    def get_bills_by_sponsor(self, people_ids: list[int], limit: int = 200) -> pd.DataFrame:
+        """Bills sponsored by any of people_ids (search_bills column schema)."""
+        if not people_ids:
+            return pd.DataFrame()
+        return self.search_bills(sponsor_people_ids=people_ids, limit=limit)
+
+    def get_recent_actions(
+        self,
+        since: str,
+        jurisdiction_filter: Optional[list[str]] = None,
+        limit: int = 200,
+    ) -> list[dict]:
+        """History actions dated on/after since (YYYY-MM-DD), newest first."""
+        params: list = [since]
+        jur = ""
+        if jurisdiction_filter:
+            label_to_code = {v: k for k, v in JURISDICTION_LABELS.items()}
+            codes = [label_to_code.get(j, j) for j in jurisdiction_filter]
+            jur = f"AND b.jurisdiction IN ({','.join('?' * len(codes))})"
+            params.extend(codes)
+        params.append(limit)
+        rows = self._get_conn().execute(
+            f"""
+            SELECT h.date, h.chamber, h.action, b.bill_id, b.bill_number, b.title, b.jurisdiction
+            FROM bill_history h
+            JOIN bills b ON b.bill_id = h.bill_id
+            WHERE h.date >= ? {jur}
+            ORDER BY h.date DESC, b.bill_number, h.seq DESC
+            LIMIT ?
+            """,
+            params,
+        ).fetchall()
+        return [dict(r) for r in rows]
+
     # ── Stats ─────────────────────────────────────────────────────────────────
 
     def get_corpus_stats(self) -> dict:
         """Return summary statistics about the local corpus (no API calls)."""
+        return {**self._corpus_counts(), "response_cache": self._response_cache.stats()}
+
+    @_memoized
+    def _corpus_counts(self) -> dict:
         conn = self._get_conn()
 
         def _count(sql, *args):
@@ -1164,6 +3247,7 @@ class CorpusManager:
 
     # ── Roll Call & People API ────────────────────────────────────────────────
 
+    @_memoized
     def get_roll_calls_for_bill(self, bill_id: int) -> list[dict]:
         """Fetch all roll call metrics for a given bill."""
         conn = self._get_conn()
@@ -1330,7 +3414,7 @@ class CorpusManager:
                     (pid,)
                 )
                 
-        conn.commit()
+        self._commit(conn)
         return {"matched": matched, "unmatched": unmatched, "total": len(people_rows)}
 
     def get_people_mapping_stats(self) -> dict:
@@ -1367,8 +3451,14 @@ class CorpusManager:
     def get_bill(self, bill_id: int) -> Optional[dict]:
         """Fetch detailed bill JSON from LegiScan API by bill_id."""
         logger.info(f"API: get_bill(bill_id={bill_id})")
+        # Always live: the local change_hash may already be behind upstream.
+        # The fresh payload is cached under its own change_hash, so the next
+        # refresh of this version doesn't fetch it again.
         res = self._api_get({"op": "getBill", "id": bill_id})
         if res.get("status") == "OK" and "bill" in res:
+            change_hash = res["bill"].get("change_hash")
+            if change_hash:
+                self._response_cache.put("getBill", bill_id, change_hash, res)
             return res["bill"]
         return None
 
@@ -1411,7 +3501,7 @@ class CorpusManager:
                             "UPDATE bills SET latest_doc_id=?, latest_doc_url=? WHERE bill_id=?",
                             (doc_id, latest.get("url", ""), bill_id)
                         )
-                        conn.commit()
+                        self._commit(conn)
 
         if not doc_id:
             return None
@@ -1430,7 +3520,7 @@ class CorpusManager:
 
         # 4. Fetch from API
         logger.info(f"API: get_bill_text(doc_id={doc_id})")
-        res = self._api_get({"op": "getBillText", "id": doc_id})
+        res = self._api_get_cached({"op": "getBillText", "id": doc_id})
         if res.get("status") == "OK" and "text" in res:
             text_data = res["text"]
             mime = text_data.get("mime", "")
@@ -1452,7 +3542,7 @@ class CorpusManager:
                    VALUES (?, ?, ?, ?, ?, ?)""",
                 (doc_id, bill_id, mime, html_content, pdf_url, datetime.now(timezone.utc).isoformat())
             )
-            conn.commit()
+            self._commit(conn)
             
             return {"html": html_content, "pdf_url": pdf_url, "mime": mime}
 
@@ -0,0 +1,181 @@
+# dataset_cache.py
+"""
+Local content-addressed store for LegiScan getDataset ZIPs.
+
+Each ZIP is saved as <dataset_hash>.zip under the cache directory (by
+default DATA_DIR/dataset_cache, next to bills.db).  manifest.json records
+which jurisdiction/session each hash belongs to, plus the session metadata
+from getDatasetList, so bills.db can be rebuilt from disk with zero API
+calls.  When the store grows past max_bytes the least-recently-used ZIPs
+are evicted.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+from typing import IO, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+
+class DatasetCache:
+    def __init__(self, cache_dir: str, max_bytes: int = 2 * 1024 ** 3):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        self._manifest_path = os.path.join(cache_dir, MANIFEST_NAME)
+        # Concurrent downloads store ZIPs from several threads at once.
+        self._lock = threading.RLock()
+        # Hashes a caller still has to read; _evict leaves them alone.
+        self._pinned: set[str] = set()
+
+    # ── Manifest ──────────────────────────────────────────────────────────────
+
+    def _load_manifest(self) -> dict:
+        if not os.path.exists(self._manifest_path):
+            return {}
+        try:
+            with open(self._manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to read dataset cache manifest: {e}")
+            return {}
+
+    def _save_manifest(self, manifest: dict) -> None:
+        tmp = self._manifest_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp, self._manifest_path)
+        except Exception as e:
+            logger.error(f"Failed to write dataset cache manifest: {e}")
+
+    def _path_for(self, dataset_hash: str) -> str:
+        return os.path.join(self.cache_dir, f"{dataset_hash}.zip")
+
+    # ── Lookup / store ────────────────────────────────────────────────────────
+
+    def get(self, dataset_hash: str) -> Optional[str]:
+        """Return the cached ZIP path for dataset_hash (marking it used), or None."""
+        if not dataset_hash:
+            return None
+        path = self._path_for(dataset_hash)
+        with self._lock:
+            manifest = self._load_manifest()
+            if dataset_hash not in manifest or not os.path.exists(path):
+                return None
+            manifest[dataset_hash]["last_used"] = datetime.now(timezone.utc).isoformat()
+            self._save_manifest(manifest)
+        return path
+
+    def put(self, dataset_hash: str, fileobj: IO[bytes], meta: dict) -> Optional[str]:
+        """
+        Copy a downloaded ZIP into the store and evict old entries if needed.
+        meta should carry jurisdiction, session_id and the getDatasetList
+        session fields.  Returns the stored path, or None on failure.
+        """
+        if not dataset_hash:
+            return None
+        path = self._path_for(dataset_hash)
+        tmp = path + ".part"
+        try:
+            fileobj.seek(0)
+            with open(tmp, "wb") as out:
+                shutil.copyfileobj(fileobj, out, 1024 * 1024)
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.error(f"Failed to cache dataset {dataset_hash}: {e}")
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return None
+
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            manifest = self._load_manifest()
+            manifest[dataset_hash] = {
+                **meta,
+                "size": os.path.getsize(path),
+                "stored_at": now,
+                "last_used": now,
+            }
+            self._evict(manifest, keep=dataset_hash)
+            self._save_manifest(manifest)
+        return path
+
+    def pin(self, dataset_hash: str) -> None:
+        """Protect dataset_hash from eviction until unpin(), e.g. while it waits to be ingested."""
+        if dataset_hash:
+            with self._lock:
+                self._pinned.add(dataset_hash)
+
+    def unpin(self, dataset_hash: str) -> None:
+        """Release a pin and evict whatever the pin kept over max_bytes."""
+        if not dataset_hash:
+            return
+        with self._lock:
+            self._pinned.discard(dataset_hash)
+            manifest = self._load_manifest()
+            if self._evict(manifest, keep=dataset_hash):
+                self._save_manifest(manifest)
+
+    def discard(self, dataset_hash: str) -> None:
+        """Drop an entry (e.g. a ZIP that turned out to be corrupt)."""
+        with self._lock:
+            manifest = self._load_manifest()
+            manifest.pop(dataset_hash, None)
+            path = self._path_for(dataset_hash)
+            if os.path.exists(path):
+                os.remove(path)
+            self._save_manifest(manifest)
+
+    def latest_for_session(self, session_id: int) -> Optional[dict]:
+        """Newest cached entry for a session (with 'dataset_hash' and 'path'), or None."""
+        entries = [
+            {**e, "dataset_hash": h, "path": self._path_for(h)}
+            for h, e in self._load_manifest().items()
+            if e.get("session_id") == session_id and os.path.exists(self._path_for(h))
+        ]
+        if not entries:
+            return None
+        return max(entries, key=lambda e: e.get("stored_at", ""))
+
+    def list_entries(self) -> list[dict]:
+        """Newest cached entry per session, for rebuilding a corpus from disk."""
+        newest: dict[int, dict] = {}
+        for h, e in self._load_manifest().items():
+            sid = e.get("session_id")
+            if sid is None or not os.path.exists(self._path_for(h)):
+                continue
+            if sid not in newest or e.get("stored_at", "") > newest[sid].get("stored_at", ""):
+                newest[sid] = {**e, "dataset_hash": h, "path": self._path_for(h)}
+        return list(newest.values())
+
+    # ── Eviction ──────────────────────────────────────────────────────────────
+
+    def _evict(self, manifest: dict, keep: str) -> bool:
+        """Drop least-recently-used entries until under max_bytes; True if any went."""
+        evicted = False
+        total = sum(e.get("size", 0) for e in manifest.values())
+        for h in sorted(manifest, key=lambda k: manifest[k].get("last_used", "")):
+            if total <= self.max_bytes:
+                break
+            if h == keep or h in self._pinned:
+                continue
+            total -= manifest[h].get("size", 0)
+            path = self._path_for(h)
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except Exception as e:
+                logger.error(f"Failed to evict cached dataset {h}: {e}")
+                continue
+            logger.info(f"Evicted cached dataset {h} ({manifest[h].get('session_id')})")
+            del manifest[h]
+            evicted = True
+        return evicted
@@ -30,22 +30,30 @@ class JobManager:
                         updated_items INTEGER DEFAULT 0,
                         api_calls INTEGER DEFAULT 0,
                         error_summary TEXT,
-                        initiated_by TEXT
+                        initiated_by TEXT,
+                        details TEXT,
+                        parent_job_id TEXT
                     )
                 """)
+                cols = [c[1] for c in conn.execute("PRAGMA table_info(system_jobs)").fetchall()]
+                if "details" not in cols:
+                    conn.execute("ALTER TABLE system_jobs ADD COLUMN details TEXT")
+                if "parent_job_id" not in cols:
+                    conn.execute("ALTER TABLE system_jobs ADD COLUMN parent_job_id TEXT")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_parent ON system_jobs(parent_job_id)")
                 conn.commit()
         except Exception as e:
             logger.error(f"Failed to initialize jobs DB: {e}")
 
-    def start_job(self, job_type: str, jurisdiction: str = "", session_scope: str = "", initiated_by: str = "system") -> str:
+    def start_job(self, job_type: str, jurisdiction: str = "", session_scope: str = "", initiated_by: str = "system", parent_job_id: str = None) -> str:
         job_id = str(uuid.uuid4())
         now = datetime.datetime.utcnow().isoformat()
         try:
             with sqlite3.connect(self.db_path) as conn:
                 conn.execute("""
-                    INSERT INTO system_jobs (job_id, job_type, status, start_time, jurisdiction, session_scope, initiated_by)
-                    VALUES (?, ?, 'RUNNING', ?, ?, ?, ?)
-                """, (job_id, job_type, now, jurisdiction, session_scope, initiated_by))
+                    INSERT INTO system_jobs (job_id, job_type, status, start_time, jurisdiction, session_scope, initiated_by, parent_job_id)
+                    VALUES (?, ?, 'RUNNING', ?, ?, ?, ?, ?)
+                """, (job_id, job_type, now, jurisdiction, session_scope, initiated_by, parent_job_id))
                 conn.commit()
         except Exception as e:
             logger.error(f"Failed to start job {job_id}: {e}")
@@ -63,7 +71,7 @@ class JobManager:
         except Exception as e:
             logger.error(f"Failed to update job {job_id}: {e}")
 
-    def finish_job(self, job_id: str, status: str, new_items: int = 0, updated_items: int = 0, records_processed: int = 0, api_calls: int = 0, error_summary: str = ""):
+    def finish_job(self, job_id: str, status: str, new_items: int = 0, updated_items: int = 0, records_processed: int = 0, api_calls: int = 0, error_summary: str = "", details: str = ""):
         now = datetime.datetime.utcnow()
         try:
             with sqlite3.connect(self.db_path) as conn:
@@ -79,25 +87,40 @@ class JobManager:
                 
                 conn.execute("""
                     UPDATE system_jobs 
-                    SET status = ?, end_time = ?, duration_sec = ?, new_items = ?, updated_items = ?, records_processed = ?, api_calls = COALESCE(api_calls, 0) + ?, error_summary = ?
+                    SET status = ?, end_time = ?, duration_sec = ?, new_items = ?, updated_items = ?, records_processed = ?, api_calls = COALESCE(api_calls, 0) + ?, error_summary = ?, details = ?
                     WHERE job_id = ?
-                """, (status, now.isoformat(), duration_sec, new_items, updated_items, records_processed, api_calls, error_summary, job_id))
+                """, (status, now.isoformat(), duration_sec, new_items, updated_items, records_processed, api_calls, error_summary, details, job_id))
                 conn.commit()
         except Exception as e:
             logger.error(f"Failed to finish job {job_id}: {e}")
 
-    def get_recent_jobs(self, limit: int = 15) -> list:
+    def get_recent_jobs(self, limit: int = 15, include_children: bool = False) -> list:
         try:
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
-                rows = conn.execute("""
+                rows = conn.execute(f"""
                     SELECT * FROM system_jobs 
+                    {"" if include_children else "WHERE parent_job_id IS NULL"}
                     ORDER BY start_time DESC LIMIT ?
                 """, (limit,)).fetchall()
                 return [dict(r) for r in rows]
         except Exception as e:
             logger.error(f"Failed to fetch recent jobs: {e}")
             return []
+
+    def get_child_jobs(self, parent_job_id: str) -> list:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                rows = conn.execute("""
+                    SELECT * FROM system_jobs
+                    WHERE parent_job_id = ?
+                    ORDER BY start_time
+                """, (parent_job_id,)).fetchall()
+                return [dict(r) for r in rows]
+        except Exception as e:
+            logger.error(f"Failed to fetch child jobs of {parent_job_id}: {e}")
+            return []
             
     def get_running_jobs(self) -> list:
         try:
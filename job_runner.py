@@ -1,22 +1,90 @@
 import logging
 from typing import Optional, Callable
 from job_manager import JobManager
-from legiscanner import run_scan
+from legiscanner import run_scan, load_keywords
 
 logger = logging.getLogger(__name__)
 
-def run_bootstrap_job(corpus, session_id: int, jurisdiction: str, job_manager: JobManager, progress_cb: Optional[Callable] = None) -> dict:
+def _defer_if_over_budget(job_manager: JobManager, job_id: str, plan: dict) -> bool:
+    """Close the job as DEFERRED when the planner says it would exceed the API budget."""
+    if plan.get("allowed", True):
+        return False
+    logger.warning(f"{plan['task'].capitalize()} deferred: {plan['reason']}")
+    details = plan["reason"]
+    if plan.get("suggestion"):
+        details += f" | Suggest {plan['suggestion']['task']}: {plan['suggestion']['reason']}"
+    job_manager.finish_job(job_id, status="DEFERRED", api_calls=plan.get("api_calls_spent", 0), details=details)
+    return True
+
+def run_bootstrap_job(corpus, session_id: int, jurisdiction: str, job_manager: JobManager, progress_cb: Optional[Callable] = None, bulk_load: bool = False) -> dict:
     job_id = job_manager.start_job("bootstrap_corpus", jurisdiction, str(session_id))
     try:
         if progress_cb: progress_cb(0.0, "Starting bootstrap...")
-        stats = corpus.bootstrap_session(session_id, jurisdiction, progress_cb)
+        plan = corpus.plan_bootstrap(session_id, jurisdiction)
+        if _defer_if_over_budget(job_manager, job_id, plan):
+            return {"deferred": 1, "plan": plan}
+        stats = corpus.bootstrap_session(session_id, jurisdiction, progress_cb, bulk_load=bulk_load)
         
+        if stats.get("dataset_unchanged"):
+            details = "Dataset unchanged; skipped"
+        elif stats.get("resumed_from"):
+            details = f"Resumed from ZIP member {stats['resumed_from']}"
+        else:
+            details = "Fresh ingest"
         job_manager.finish_job(
             job_id,
             status="SUCCESS",
             new_items=stats.get("new", 0),
             updated_items=stats.get("updated", 0),
-            api_calls=stats.get("api_calls", 0)
+            api_calls=stats.get("api_calls", 0),
+            details=details
+        )
+        return stats
+    except Exception as e:
+        logger.error(f"Bootstrap job failed: {e}", exc_info=True)
+        job_manager.finish_job(job_id, status="FAILED", error_summary=str(e))
+        raise
+
+def run_bootstrap_many_job(corpus, targets: list, job_manager: JobManager, progress_cb: Optional[Callable] = None, bulk_load: bool = False, max_downloads: int = 4, initiated_by="system", datasets: Optional[list] = None) -> dict:
+    """
+    Bootstrap several (jurisdiction, session_id) targets as one job with aggregate progress.
+    datasets is the getDatasetList response the targets were picked from, if any.
+    """
+    jur_str = ",".join(sorted({jur for jur, _ in targets}))
+    sid_str = ",".join(str(sid) for _, sid in targets)
+    job_id = job_manager.start_job("bootstrap_corpus", jur_str, sid_str, initiated_by=initiated_by)
+
+    def _on_stats(totals: dict):
+        job_manager.update_job_progress(job_id, totals.get("sessions", 0), totals.get("api_calls", 0))
+
+    try:
+        if progress_cb: progress_cb(0.0, f"Starting bootstrap of {len(targets)} sessions...")
+        plans = [corpus.plan_bootstrap(sid, jur) for jur, sid in targets]
+        total = sum(p["estimated_calls"] for p in plans)
+        remaining = plans[0]["remaining"] if plans else 0
+        if plans and total > remaining:
+            plan = {"task": "bootstrap", "allowed": False, "reason": f"bootstrap of {len(targets)} sessions needs ~{total} API calls but only {remaining} remain this month"}
+            _defer_if_over_budget(job_manager, job_id, plan)
+            return {"deferred": 1, "plan": plan}
+        stats = corpus.bootstrap_many(
+            targets, progress_cb, max_downloads=max_downloads, bulk_load=bulk_load, stats_cb=_on_stats,
+            datasets=datasets,
+        )
+
+        details = (
+            f"{stats.get('sessions', 0)}/{len(targets)} sessions; "
+            f"{stats.get('dataset_unchanged', 0)} unchanged, {stats.get('fallback', 0)} via masterlist"
+        )
+        # api_calls were already recorded by the progress updates; finish_job adds to them.
+        _on_stats(stats)
+        job_manager.finish_job(
+            job_id,
+            status="SUCCESS",
+            new_items=stats.get("new", 0),
+            updated_items=stats.get("updated", 0),
+            records_processed=stats.get("sessions", 0),
+            error_summary=f"{stats['errors']} errors" if stats.get("errors") else "",
+            details=details
         )
         return stats
     except Exception as e:
@@ -28,14 +96,21 @@ def run_refresh_job(corpus, session_id: int, jurisdiction: str, job_manager: Job
     job_id = job_manager.start_job("incremental_refresh", jurisdiction, str(session_id))
     try:
         if progress_cb: progress_cb(0.0, "Starting incremental refresh...")
+        plan = corpus.plan_refresh(session_id, jurisdiction)
+        if _defer_if_over_budget(job_manager, job_id, plan):
+            return {"deferred": 1, "plan": plan}
         stats = corpus.refresh_session(session_id, jurisdiction, progress_cb)
         
+        details = f"Planned ~{plan['estimated_calls']} calls"
+        if plan.get("suggestion"):
+            details += f"; {plan['suggestion']['reason']}"
         job_manager.finish_job(
             job_id,
             status="SUCCESS",
             new_items=stats.get("new", 0),
             updated_items=stats.get("updated", 0),
-            api_calls=stats.get("api_calls", 0)
+            api_calls=stats.get("api_calls", 0) + plan.get("api_calls_spent", 0),
+            details=details
         )
         return stats
     except Exception as e:
@@ -43,11 +118,116 @@ def run_refresh_job(corpus, session_id: int, jurisdiction: str, job_manager: Job
         job_manager.finish_job(job_id, status="FAILED", error_summary=str(e))
         raise
 
+def run_refresh_all_job(corpus, job_manager: JobManager, progress_cb: Optional[Callable] = None, initiated_by="system") -> dict:
+    """
+    Refresh every is_active cached session in one parent job, with one child
+    job row per session.  Masterlists for later sessions are fetched while
+    earlier sessions refresh; a session that fails or would exceed the API
+    budget doesn't stop the others.
+    """
+    sessions = [s for s in corpus.get_cached_sessions() if s.get("is_active")]
+    jur_str = ",".join(sorted({s["jurisdiction"] for s in sessions}))
+    job_id = job_manager.start_job("incremental_refresh", jur_str, "ALL_ACTIVE", initiated_by=initiated_by)
+    totals = {"sessions": len(sessions), "refreshed": 0, "deferred": 0, "failed": 0, "new": 0, "updated": 0, "errors": 0, "api_calls": 0}
+    try:
+        if progress_cb: progress_cb(0.0, f"Starting refresh of {len(sessions)} active sessions...")
+        masterlists = corpus.prefetch_masterlists([s["session_id"] for s in sessions])
+        for i, (s, (sid, data)) in enumerate(zip(sessions, masterlists)):
+            jur = s["jurisdiction"]
+            child_id = job_manager.start_job("incremental_refresh", jur, str(sid), initiated_by=initiated_by, parent_job_id=job_id)
+            # Counts this session's calls only; the masterlists prefetched for
+            # later sessions meanwhile are charged to their own jobs.
+            with corpus.counting_api_calls() as spent:
+                try:
+                    if data.get("status") != "OK":
+                        raise RuntimeError(f"getMasterListRaw failed: {data.get('error', data.get('status'))}")
+                    plan = corpus.plan_refresh(sid, jur, masterlist=data)
+                    if _defer_if_over_budget(job_manager, child_id, plan):
+                        totals["deferred"] += 1
+                        totals["api_calls"] += plan.get("api_calls_spent", 0)
+                        continue
+                    sub_cb = (lambda f, m, i=i: progress_cb((i + f) / len(sessions), f"{jur} {sid}: {m}")) if progress_cb else None
+                    stats = corpus.refresh_session(sid, jur, sub_cb)
+                    api_calls = stats.get("api_calls", 0) + plan.get("api_calls_spent", 0)
+                    job_manager.finish_job(
+                        child_id,
+                        status="SUCCESS",
+                        new_items=stats.get("new", 0),
+                        updated_items=stats.get("updated", 0),
+                        api_calls=api_calls,
+                        error_summary=f"{stats['errors']} errors" if stats.get("errors") else "",
+                        details=f"Planned ~{plan['estimated_calls']} calls"
+                    )
+                    totals["refreshed"] += 1
+                    totals["api_calls"] += api_calls
+                    for k in ("new", "updated", "errors"):
+                        totals[k] += stats.get(k, 0)
+                except Exception as e:
+                    logger.error(f"Refresh of {jur} session {sid} failed: {e}", exc_info=True)
+                    # The session's prefetched getMasterListRaw plus whatever
+                    # refresh_session spent before raising.
+                    api_calls = 1 + spent[0]
+                    job_manager.finish_job(child_id, status="FAILED", api_calls=api_calls, error_summary=str(e))
+                    totals["failed"] += 1
+                    totals["api_calls"] += api_calls
+            job_manager.update_job_progress(job_id, i + 1)
+
+        # API calls are recorded on the per-session child jobs only, so usage
+        # summed over system_jobs doesn't count them twice.
+        job_manager.finish_job(
+            job_id,
+            status="FAILED" if sessions and totals["failed"] == len(sessions) else "SUCCESS",
+            new_items=totals["new"],
+            updated_items=totals["updated"],
+            records_processed=len(sessions),
+            error_summary=f"{totals['failed']} sessions failed" if totals["failed"] else "",
+            details=(
+                f"{totals['refreshed']}/{len(sessions)} sessions refreshed; {totals['deferred']} deferred, "
+                f"{totals['failed']} failed; {totals['api_calls']} API calls across sessions"
+            )
+        )
+        return totals
+    except Exception as e:
+        logger.error(f"Refresh-all job failed: {e}", exc_info=True)
+        job_manager.finish_job(job_id, status="FAILED", error_summary=str(e))
+        raise
+
+def run_sync_job(corpus, session_id: int, jurisdiction: str, job_manager: JobManager, progress_cb: Optional[Callable] = None, initiated_by="system") -> dict:
+    """Sync a session by whichever of refresh / dataset re-bootstrap the planner finds cheaper."""
+    job_id = job_manager.start_job("sync_session", jurisdiction, str(session_id), initiated_by=initiated_by)
+    try:
+        if progress_cb: progress_cb(0.0, "Planning sync...")
+        plan = corpus.plan_sync(session_id, jurisdiction)
+        if _defer_if_over_budget(job_manager, job_id, plan):
+            return {"deferred": 1, "plan": plan}
+        stats = corpus.sync_session(session_id, jurisdiction, progress_cb, plan=plan)
+
+        details = f"Path: {plan['path']} — {plan['path_reason']}; planned ~{plan['estimated_calls']} calls"
+        if plan.get("alternative"):
+            details += f" (vs ~{plan['alternative']['estimated_calls']} via {plan['alternative']['path']})"
+        job_manager.finish_job(
+            job_id,
+            status="SUCCESS",
+            new_items=stats.get("new", 0),
+            updated_items=stats.get("updated", 0),
+            api_calls=stats.get("api_calls", 0) + plan.get("api_calls_spent", 0),
+            error_summary=f"{stats['errors']} errors" if stats.get("errors") else "",
+            details=details
+        )
+        return stats
+    except Exception as e:
+        logger.error(f"Sync job failed: {e}", exc_info=True)
+        job_manager.finish_job(job_id, status="FAILED", error_summary=str(e))
+        raise
+
 def run_rescan_job(corpus, states: list, data_dir: str, job_manager: JobManager, progress_cb: Optional[Callable] = None, initiated_by="system") -> dict:
     jur_str = ",".join(states)
     job_id = job_manager.start_job("keyword_rescan", jur_str, "ALL", initiated_by=initiated_by)
     try:
         if progress_cb: progress_cb(0.0, "Starting keyword rescan...")
+        plan = corpus.plan_rescan(states, len(load_keywords()))
+        if _defer_if_over_budget(job_manager, job_id, plan):
+            return {"deferred": 1, "plan": plan}
         # run_scan from legiscanner
         stats = run_scan(states=states, data_dir=data_dir, corpus_manager=corpus)
         
@@ -0,0 +1,228 @@
+# legiscan_client.py
+"""
+Shared HTTP client for the LegiScan API.
+
+Both corpus_manager and legiscanner send their requests through one pooled
+requests.Session per process, so the thousands of getBill calls in a full
+refresh or scan reuse warm keep-alive connections instead of paying a new
+TCP+TLS handshake each time.  Responses are negotiated gzip, and every op
+gets a (connect, read) timeout sized for its payload.
+
+Requests are paced by one process-wide token bucket rather than a sleep
+after every call, so time spent waiting on the network counts toward the
+interval.  HTTP 429 and 5xx responses and connection errors/timeouts are
+retried with jittered exponential backoff; a 429 (or Retry-After) pauses
+every caller and slows the bucket down until calls succeed again.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import random
+import threading
+import time
+from typing import Callable, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://api.legiscan.com/"
+# LEGISCAN_BASE_URL points every caller at another server (e.g. mock_legiscan).
+BASE_URL = os.environ.get("LEGISCAN_BASE_URL") or DEFAULT_BASE_URL
+
+# Keep-alive connections kept per host; covers the concurrent getBill and
+# dataset-download thread pools.
+POOL_SIZE = 16
+
+# (connect, read) seconds.  Read timeouts are per socket read, not total.
+DEFAULT_TIMEOUT = (10, 30)
+OP_TIMEOUTS: dict[str, tuple[int, int]] = {
+    "getDataset":       (10, 180),
+    "getDatasetList":   (10, 60),
+    "getMasterListRaw": (10, 60),
+    "getSearchRaw":     (10, 60),
+    "getBillText":      (10, 60),
+}
+
+# Default minimum spacing between calls; CorpusManager passes its own rate_limit_s.
+DEFAULT_RATE_LIMIT_S = 0.2
+# Calls allowed back-to-back before the sustained rate (1 / interval) applies.
+BURST = 8
+
+# Retries after the first attempt for 429/5xx and connection errors/timeouts.
+MAX_RETRIES = 3
+BACKOFF_BASE_S = 1.0
+BACKOFF_MAX_S = 30.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Upper bound on the slowdown applied to the interval after 429s.
+MAX_SLOWDOWN = 8.0
+
+Timeout = Union[float, tuple[float, float]]
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# Called with the request params before every request (e.g. quota accounting).
+_call_listeners: list[Callable[[dict], None]] = []
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE)
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                s.headers.update({
+                    "Accept-Encoding": "gzip, deflate",
+                    "Connection": "keep-alive",
+                })
+                _session = s
+    return _session
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every thread in the process.  Tokens refill at
+    one per interval x slowdown seconds up to BURST; a caller that finds the
+    bucket empty reserves the next token and sleeps only until it is due.
+    A 429 doubles the slowdown and pauses the bucket; each success eases
+    the slowdown back toward 1.
+    """
+
+    def __init__(self, burst: int = BURST) -> None:
+        self.burst = burst
+        self.slowdown = 1.0
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+        self._paused_until = 0.0
+
+    def wait(self, interval: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._paused_until - now)
+            interval *= self.slowdown
+            if interval > 0:
+                self._tokens = min(self.burst, self._tokens + (now - self._stamp) / interval)
+                self._stamp = now
+                self._tokens -= 1
+                delay = max(delay, -self._tokens * interval)
+        if delay > 0:
+            time.sleep(delay)
+
+    def throttled(self, pause_s: float) -> None:
+        """The server said slow down: pause everyone for pause_s and halve the rate."""
+        with self._lock:
+            self.slowdown = min(MAX_SLOWDOWN, self.slowdown * 2)
+            self._paused_until = max(self._paused_until, time.monotonic() + pause_s)
+            self._tokens = min(self._tokens, 0.0)
+
+    def succeeded(self) -> None:
+        if self.slowdown > 1.0:
+            with self._lock:
+                self.slowdown = max(1.0, self.slowdown * 0.95)
+
+
+_limiter = RateLimiter()
+
+
+def get_limiter() -> RateLimiter:
+    return _limiter
+
+
+def backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retry number attempt (0-based): Retry-After if given, else full jitter."""
+    if retry_after:
+        try:
+            return min(BACKOFF_MAX_S, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_MAX_S, BACKOFF_BASE_S * 2 ** attempt))
+
+
+def set_base_url(url: Optional[str]) -> None:
+    """Send subsequent requests to url (None/empty restores the real API)."""
+    global BASE_URL
+    BASE_URL = url or DEFAULT_BASE_URL
+    if BASE_URL != DEFAULT_BASE_URL:
+        logger.info(f"LegiScan API base URL: {BASE_URL}")
+
+
+def add_call_listener(fn: Callable[[dict], None]) -> None:
+    if fn not in _call_listeners:
+        _call_listeners.append(fn)
+
+
+def timeout_for(op: str) -> tuple[int, int]:
+    return OP_TIMEOUTS.get(op, DEFAULT_TIMEOUT)
+
+
+def get(
+    params: dict,
+    timeout: Optional[Timeout] = None,
+    stream: bool = False,
+    rate_limit_s: Optional[float] = None,
+) -> requests.Response:
+    """
+    GET one LegiScan op, paced by the shared limiter and retried on
+    transient failures.  params must include "op" and "key"; timeout
+    defaults to the op's entry in OP_TIMEOUTS and rate_limit_s to
+    DEFAULT_RATE_LIMIT_S.  With stream=True the caller must close the
+    response (use it as a context manager).
+
+    After MAX_RETRIES the last 429/5xx response is returned (the caller's
+    raise_for_status reports it) or the last connection error is raised.
+    """
+    op = params.get("op", "")
+    interval = DEFAULT_RATE_LIMIT_S if rate_limit_s is None else rate_limit_s
+    attempt = 0
+    while True:
+        _limiter.wait(interval)
+        for fn in _call_listeners:
+            try:
+                fn(params)
+            except Exception as e:
+                logger.error(f"LegiScan call listener failed: {e}")
+        try:
+            r = get_session().get(
+                BASE_URL,
+                params=params,
+                timeout=timeout or timeout_for(op),
+                stream=stream,
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == MAX_RETRIES:
+                raise
+            delay = backoff_delay(attempt)
+            logger.warning(f"{op} failed ({e}); retry {attempt + 1}/{MAX_RETRIES} in {delay:.1f}s")
+            time.sleep(delay)
+            attempt += 1
+            continue
+
+        if r.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            if r.status_code < 400:
+                _limiter.succeeded()
+            return r
+        delay = backoff_delay(attempt, r.headers.get("Retry-After"))
+        r.close()
+        logger.warning(f"{op} returned HTTP {r.status_code}; retry {attempt + 1}/{MAX_RETRIES} in {delay:.1f}s")
+        if r.status_code == 429:
+            _limiter.throttled(delay)
+        else:
+            time.sleep(delay)
+        attempt += 1
+
+
+def close() -> None:
+    """Drop pooled connections (e.g. before forking worker processes)."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
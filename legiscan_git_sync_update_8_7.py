@@ -9,14 +9,14 @@ import importlib
 import sys
 
 from job_manager import JobManager
-from job_runner import run_bootstrap_job, run_refresh_job, run_rescan_job
+from job_runner import run_bootstrap_job, run_refresh_job, run_rescan_job, run_sync_job
 from staff_manager import StaffManager, resolve_legislator, normalize_name_components
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-from config               import DATA_DIR, API_KEY
+from config               import DATA_DIR, API_KEY, API_MONTHLY_BUDGET
 import auth as _auth
 from sync_github_repo     import ensure_repo, sync_with_remote as _sync_with_remote
 import threading
@@ -29,7 +29,7 @@ from legiscanner          import run_scan, CSV_FILE, KEYWORDS_FILE
 # ── Corpus manager (Layer A — master bill corpus) ─────────────────────────────
 # Guarded import: if corpus_manager.py is absent the app falls back gracefully.
 try:
-    from corpus_manager import CorpusManager as _CorpusManager
+    from corpus_manager import BillFilter, CorpusManager as _CorpusManager
     _CORPUS_AVAILABLE = True
 except ImportError:
     _CORPUS_AVAILABLE = False
@@ -345,6 +345,13 @@ def search_df(df: pd.DataFrame, query: str) -> pd.DataFrame:
 # ─── Sort helper ──────────────────────────────────────────────────────────────
 _SORT_OPTIONS = ["Most Recent Action", "Status Date (Newest)", "Bill Number A→Z", "Status Stage"]
 _TRACKED_SORT_OPTIONS = ["Most Recent Action", "Status Date (Newest)", "Bill Number A→Z", "Status Stage", "Priority (High First)", "Last Reviewed (Newest)"]
+# All Bills sorts in SQLite so it can page by keyset (corpus_manager.BILL_ORDERS).
+_CORPUS_ORDERS = {
+    "Most Recent Action":   "last_action",
+    "Status Date (Newest)": "status_date",
+    "Bill Number A→Z":      "bill_number",
+    "Status Stage":         "status_stage",
+}
 
 def apply_sort(df: pd.DataFrame, sort_key: str) -> pd.DataFrame:
     if df.empty:
@@ -757,7 +764,7 @@ def get_corpus_manager(api_key: str = ""):
     """CorpusManager keyed on api_key so a per-user key gets its own instance."""
     if not _CORPUS_AVAILABLE: return None
     effective_key = api_key or API_KEY
-    try: return _CorpusManager(os.path.join(DATA_DIR, "bills.db"), effective_key)
+    try: return _CorpusManager(os.path.join(DATA_DIR, "bills.db"), effective_key, api_monthly_budget=API_MONTHLY_BUDGET)
     except Exception as _ce:
         logger.warning(f"CorpusManager init failed (non-fatal): {_ce}")
         return None
@@ -803,6 +810,7 @@ global_search = st.sidebar.text_input(
     "🔍 Global Search",
     value=st.session_state.get("global_search", ""),
     placeholder="bill number, title, sponsor...",
+    help='Words match by prefix and must all appear. Use "quotes" for a phrase, OR / NOT between words.',
     key="global_search_input"
 )
 st.session_state.global_search = global_search
@@ -904,10 +912,18 @@ if not df.empty:
         if s not in _all_status_opts:
             _all_status_opts.append(s)
     _all_status_opts = sorted(_all_status_opts)
-    if "sponsors" in df.columns:
-        _all_sponsors = sorted(df["sponsors"].dropna().unique())
-    if "committees" in df.columns:
-        _all_committees = sorted(df["committees"].dropna().unique())
+    if not corpus:
+        if "sponsors" in df.columns:
+            _all_sponsors = sorted({n.strip() for v in df["sponsors"].dropna().astype(str) for n in v.split(",") if n.strip()})
+        if "committees" in df.columns:
+            _all_committees = sorted(df["committees"].dropna().unique())
+if corpus:
+    # Individual sponsor names / committees straight from the indexed corpus tables
+    try:
+        _all_sponsors = corpus.get_sponsor_options()
+        _all_committees = corpus.get_committee_options()
+    except Exception:
+        pass
 
 if st.session_state.status_options is None or len(st.session_state.status_options) < len(_all_status_opts):
     st.session_state.status_options = list(_all_status_opts)
@@ -1029,6 +1045,14 @@ with st.sidebar.expander("⚙️ Admin & Database Tools"):
         if corpus:
             c_stats = corpus.get_corpus_stats()
             st.write(f"Corpus Size: {c_stats['total_bills']:,} bills")
+            _rc = c_stats.get("response_cache") or {}
+            if _rc:
+                st.caption(f"API response cache: {_rc['entries']:,} entries ({_rc['bytes'] / 1e6:.1f} MB) · {_rc['hits']} hits / {_rc['misses']} misses this session")
+            try:
+                _usage = corpus.get_api_usage()
+                st.caption(f"API calls this month: {sum(_usage.values()):,} / {corpus.quota.monthly_budget:,}"
+                           + (" · " + ", ".join(f"{op} {n:,}" for op, n in list(_usage.items())[:4]) if _usage else ""))
+            except Exception: pass
             try:
                 m_stats = corpus.get_people_mapping_stats()
                 st.write(f"**LegiScan Person Matches:** {m_stats['matched']} matched / {m_stats['unmatched']} unmatched (Total: {m_stats['total']})")
@@ -1171,6 +1195,14 @@ with st.sidebar.expander("⚙️ Admin & Database Tools"):
             _sel_label   = st.selectbox("Session", options=list(_session_opts.keys()) if _session_opts else ["(none)"], key="corpus_session_select")
             _sel_session = _session_opts.get(_sel_label)
 
+            st.markdown("**Smart Sync** (picks refresh or dataset, whichever costs fewer API calls)")
+            _lock_sync = bool(_running_jobs_for_lock and any(_j['job_type'] == 'sync_session' for _j in _running_jobs_for_lock))
+            if st.button("⚡ Sync Session", key="corpus_sync", disabled=not _sel_session or _lock_sync):
+                _sb = st.progress(0, text="Syncing...")
+                run_sync_job(corpus, _sel_session["session_id"], _sel_session["jurisdiction"], job_manager, lambda f, m: _sb.progress(min(f, 1.0), text=m), initiated_by="ui")
+                _sb.progress(1.0, text="Done")
+                st.rerun()
+
             st.markdown("**Incremental Refresh** (cheap, periodic)")
             _lock_refresh = bool(_running_jobs_for_lock and any(_j['job_type'] == 'incremental_refresh' for _j in _running_jobs_for_lock))
             if st.button("🔄 Refresh Session Updates", key="corpus_refresh", disabled=not _sel_session or _lock_refresh):
@@ -1194,9 +1226,11 @@ with st.sidebar.expander("⚙️ Admin & Database Tools"):
             recent = job_manager.get_recent_jobs(5)
             if recent:
                 for j in recent:
-                    icon = "✅" if j['status'] == 'SUCCESS' else ("❌" if j['status'] == 'FAILED' else "🔄")
+                    icon = {"SUCCESS": "✅", "FAILED": "❌", "DEFERRED": "⏸️"}.get(j['status'], "🔄")
                     st.write(f"{icon} **{j['job_type']}** ({j['jurisdiction']})")
                     st.caption(f"Elapsed: {j['duration_sec'] or 0:.1f}s · Added: {j['new_items']} · Updated: {j['updated_items']}")
+                    if j.get('details'):
+                        st.caption(j['details'])
             else:
                 st.caption("No jobs logged yet.")
 
@@ -1239,9 +1273,11 @@ def run_unified_filters(work_df):
         if 'status_stage' in work_df.columns:
             work_df = work_df[work_df['status_stage'].astype(str).isin(st.session_state.global_status)]
             
-    # Sponsors & Committees
+    # Sponsors & Committees (sponsors column is a joined list of names)
     if st.session_state.global_sponsors and 'sponsors' in work_df.columns:
-        work_df = work_df[work_df['sponsors'].isin(st.session_state.global_sponsors)]
+        _sel_sp = set(st.session_state.global_sponsors)
+        work_df = work_df[work_df['sponsors'].astype(str).apply(
+            lambda v: any(n.strip() in _sel_sp for n in v.split(",")))]
     if st.session_state.global_committees and 'committees' in work_df.columns:
         work_df = work_df[work_df['committees'].isin(st.session_state.global_committees)]
         
@@ -1265,52 +1301,69 @@ if "All Bills" in app_mode:
     if not _CORPUS_AVAILABLE or not corpus:
         st.warning("Master Corpus SQLite not responding.")
     else:
-        # Perform DB level filtering for speed, then Pandas filtering for unified fields
+        # Every filter and the sort run in SQLite; each rerun fetches one page.
+        # Position/priority match this user's notes, mirrored into bills.db.
+        corpus.sync_bill_notes(_username, bill_notes)
+        _ab_dates = st.session_state.get("global_date_range") or []
+        _ab_filters = BillFilter(
+            query=st.session_state.global_search or "",
+            jurisdiction_filter=st.session_state.global_jur or None,
+            status_filter=st.session_state.get("global_status") or None,
+            keyword_filter=st.session_state.kw_filter or None,
+            sponsor_filter=st.session_state.global_sponsors or None,
+            committee_filter=st.session_state.global_committees or None,
+            date_from=_ab_dates[0].isoformat() if len(_ab_dates) == 2 else None,
+            date_to=_ab_dates[1].isoformat() if len(_ab_dates) == 2 else None,
+            notes_user=_username,
+            position_filter=st.session_state.tracked_pos or None,
+            priority_filter=st.session_state.tracked_prio or None,
+        )
+        _ab_order = _CORPUS_ORDERS.get(st.session_state.global_sort, "status_date")
+
+        # Keyset cursors for the pages visited so far; reset when the query changes.
+        _ab_sig = repr((_ab_filters, _ab_order))
+        if st.session_state.get("ab_page_sig") != _ab_sig:
+            st.session_state.ab_page_sig = _ab_sig
+            st.session_state.ab_cursors = [None]
+        _ab_cursors = st.session_state.ab_cursors
+        page_size = 50
         try:
-            db_df = corpus.search_bills(
-                query=st.session_state.global_search or None,
-                jurisdiction_filter=st.session_state.global_jur or None,
-                status_filter=st.session_state.get("global_status") or None,
-                limit=1000 # Safely bump up so pandas filtering has room
-            )
+            total_bills = corpus.count_bills(_ab_filters)
+            page_df = corpus.search_bills(filters=_ab_filters, order_by=_ab_order, after=_ab_cursors[-1], limit=page_size)
         except Exception as e:
             st.error(f"Search err: {e}")
-            db_df = pd.DataFrame()
-        
-        # Now apply the unified filters in Pandas space safely
-        # Note: global_search, jur, and status were ALREADY pushed down to SQLite!
-        if not db_df.empty:
-            if st.session_state.global_sponsors and 'sponsors' in db_df.columns:
-                db_df = db_df[db_df['sponsors'].isin(st.session_state.global_sponsors)]
-            if st.session_state.global_committees and 'committees' in db_df.columns:
-                db_df = db_df[db_df['committees'].isin(st.session_state.global_committees)]
-            if st.session_state.kw_filter and 'keyword' in db_df.columns:
-                db_df = db_df[db_df['keyword'].isin(st.session_state.kw_filter)]
-            if st.session_state.tracked_pos:
-                db_df = db_df[db_df['bill_id'].astype(str).apply(lambda x: bill_notes.get(x, {}).get('position', '') in st.session_state.tracked_pos)]
-            if st.session_state.tracked_prio:
-                db_df = db_df[db_df['bill_id'].astype(str).apply(lambda x: bill_notes.get(x, {}).get('priority', '') in st.session_state.tracked_prio)]
-                
-        db_df = apply_sort(db_df, st.session_state.global_sort)
-        run_smart_header(len(db_df), "All Bills", corpus, tracked_bills)
-        
-        total_bills = len(db_df)
-        st.caption(f"Showing {total_bills} bills from Master Archive")
+            total_bills, page_df = 0, pd.DataFrame()
+
+        run_smart_header(total_bills, "All Bills", corpus, tracked_bills)
+        st.caption(f"Showing {total_bills:,} bills from Master Archive")
         if total_bills > 0:
-            page_size = 50
+            page = len(_ab_cursors)
             total_pages = max(1, (total_bills + page_size - 1) // page_size)
-            page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1, key="all_bills_pg")
             start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            page_df = db_df.iloc[start_idx:end_idx]
-            if total_pages > 1: st.write(f"Page {page} of {total_pages} (Bills {start_idx+1}-{min(end_idx, total_bills)})")
-            
+            pc1, pc2, pc3 = st.columns([1, 4, 1])
+            with pc1:
+                if st.button("◀ Prev", key="ab_prev", disabled=page == 1, use_container_width=True):
+                    _ab_cursors.pop()
+                    st.rerun()
+            with pc2:
+                if total_pages > 1: st.write(f"Page {page} of {total_pages} (Bills {start_idx+1}-{start_idx+len(page_df)})")
+            with pc3:
+                if st.button("Next ▶", key="ab_next", disabled=page >= total_pages, use_container_width=True):
+                    _ab_cursors.append(corpus.next_cursor(page_df, _ab_order))
+                    st.rerun()
+
             for _, row in page_df.iterrows():
                 bid = str(row.get('bill_id', 'Unknown'))
                 _render_bill_card(row, bill_notes.get(bid, {}), bid, bill_notes, tracked_bills, key_prefix=f"ab_{bid}")
-            
-        if not db_df.empty:
-            st.download_button("📥 Export", build_export_df(db_df, bill_notes, tracked_bills).to_csv(index=False), "all_bills_search.csv", "text/csv")
+
+            # The full result set is only fetched when an export is asked for.
+            if st.session_state.get("ab_export_sig") == _ab_sig:
+                st.download_button("📥 Export", st.session_state.ab_export_csv, "all_bills_search.csv", "text/csv")
+            elif st.button("📥 Export", key="ab_export_prep", help=f"Build a CSV of all {total_bills:,} matching bills"):
+                full_df = corpus.search_bills(filters=_ab_filters, order_by=_ab_order, limit=total_bills)
+                st.session_state.ab_export_csv = build_export_df(full_df, bill_notes, tracked_bills).to_csv(index=False)
+                st.session_state.ab_export_sig = _ab_sig
+                st.rerun()
 
 
 # ────────── KEYWORD MATCHES ───────────────────────────────────────────────────
@@ -1666,9 +1719,8 @@ elif "Legislator Directory" in app_mode:
                 s_bills = pd.DataFrame()
                 if corpus and l_name:
                     try:
-                        s_bills = corpus.search_bills(query=l_last, limit=100)
-                        if not s_bills.empty:
-                            s_bills = s_bills[s_bills["sponsor_names"].str.contains(l_last, case=False, na=False)]
+                        _pids = corpus.get_sponsor_people_ids(l_id or "", l_last, l_first)
+                        s_bills = corpus.get_bills_by_sponsor(_pids, limit=100)
                     except:
                         s_bills = pd.DataFrame()
                 if s_bills.empty and not df.empty and l_norm and "sponsors" in df.columns:
@@ -15,14 +15,16 @@ import os
 import json
 import csv
 import logging
-import requests
-import time
 import argparse
 from datetime import datetime
-from config import API_KEY, DATA_DIR
+from config import API_KEY, DATA_DIR, LEGISCAN_BASE_URL
+import legiscan_client
+from response_cache import shared_cache
 
 # Constants
-BASE_URL = "https://api.legiscan.com/"
+if LEGISCAN_BASE_URL:
+    legiscan_client.set_base_url(LEGISCAN_BASE_URL)
+BASE_URL = legiscan_client.BASE_URL
 RELEVANCE_THRESHOLD = 55
 CHAMBER_MAP = {'A': 'Assembly', 'S': 'Senate', 'H': 'House'}
 US_STATES = {
@@ -45,6 +47,8 @@ FEDERAL_ALIAS = 'US'
 KEYWORDS_FILE = os.path.join(DATA_DIR, "keywords.json")
 CACHE_FILE    = os.path.join(DATA_DIR, "legiscan_cache.json")
 CSV_FILE      = os.path.join(DATA_DIR, "LegiScan_Enhanced_Full_Tracker.csv")
+# getBill payloads keyed by change_hash; same store the corpus manager uses.
+RESPONSE_CACHE_FILE = os.path.join(DATA_DIR, "response_cache.db")
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
@@ -73,10 +77,10 @@ def save_cache(cache, filepath=CACHE_FILE):
 
 
 def fetch_search_results(jurisdiction, keyword):
-    url = f"{BASE_URL}?key={API_KEY}&op=getSearchRaw&state={jurisdiction}&query={keyword}"
+    params = {'key': API_KEY, 'op': 'getSearchRaw', 'state': jurisdiction, 'query': keyword}
     logger.info(f"Searching {jurisdiction} for keyword '{keyword}'")
     try:
-        r = requests.get(url)
+        r = legiscan_client.get(params)
         r.raise_for_status()
         data = r.json()
     except Exception as e:
@@ -97,19 +101,25 @@ def fetch_search_results(jurisdiction, keyword):
     return filtered_results, total_found, filtered_count, True
 
 
-def get_bill_details(bill_id):
-    url = f"{BASE_URL}?key={API_KEY}&op=getBill&id={bill_id}"
-    try:
-        r = requests.get(url)
-        r.raise_for_status()
-        data = r.json()
-    except Exception as e:
-        logger.error(f"Error fetching bill {bill_id}: {e}")
-        return None
+def get_bill_details(bill_id, change_hash=None):
+    """getBill, served from the response cache when change_hash is known and cached."""
+    cache = shared_cache(RESPONSE_CACHE_FILE) if change_hash else None
+    data = cache.get('getBill', int(bill_id), change_hash) if cache else None
+    if data is None:
+        params = {'key': API_KEY, 'op': 'getBill', 'id': bill_id}
+        try:
+            r = legiscan_client.get(params)
+            r.raise_for_status()
+            data = r.json()
+        except Exception as e:
+            logger.error(f"Error fetching bill {bill_id}: {e}")
+            return None
 
-    if data.get('status') != 'OK':
-        logger.warning(f"getBill status not OK for {bill_id}: {data.get('status')}")
-        return None
+        if data.get('status') != 'OK':
+            logger.warning(f"getBill status not OK for {bill_id}: {data.get('status')}")
+            return None
+        if cache:
+            cache.put('getBill', int(bill_id), change_hash, data)
 
     return data.get('bill', {})
 
@@ -213,13 +223,12 @@ def run_scan(states=None, data_dir=None):
             stats["total_found"] += total_f
             stats["filtered"] += filtered_c
 
-            time.sleep(0.2)
             for item in searches:
                 bid      = str(item['bill_id'])
                 new_hash = item['change_hash']
                 old_hash = cache.get(bid, {}).get('change_hash')
                 if new_hash != old_hash:
-                    details = get_bill_details(bid)
+                    details = get_bill_details(bid, new_hash)
                     if not details:
                         continue
                     row = flatten_bill(details, jurisdiction, keyword)
@@ -231,7 +240,6 @@ def run_scan(states=None, data_dir=None):
                         
                     existing_bills[bid] = row
                     cache[bid] = {'change_hash': new_hash, 'last_checked': datetime.now().isoformat()}
-                    time.sleep(0.2)
 
     # Write CSV
     if existing_bills:
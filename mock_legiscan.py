@@ -0,0 +1,600 @@
+# mock_legiscan.py
+"""
+Local stand-in for the LegiScan API, for offline benchmarking and testing.
+
+Serves deterministic synthetic responses (seeded, so every run sees the same
+corpus) for getSessionList, getDatasetList, getDataset, getMasterListRaw,
+getBill, getRollCall, getBillText and getSearchRaw, or a recorded response
+from a fixtures directory when one matches.  Latency and error injection
+are configurable.
+
+Point the pipeline at it with LEGISCAN_BASE_URL (or "legiscan_base_url" in
+config.json):
+
+    python mock_legiscan.py --port 8765 --bills 2000 --latency-ms 80 --error-rate 0.01
+    LEGISCAN_BASE_URL=http://127.0.0.1:8765/ python cli.py --task bootstrap --jurisdiction CA
+
+Synthetic model
+---------------
+  One session per state (session_id 2000, 2001, …).  The dataset ZIP holds
+  every bill at its original change_hash; --churn of them have moved on
+  since, so the masterlist / getBill / getSearchRaw report a new hash and a
+  refresh after a bootstrap has real work to do.
+
+Fixtures
+--------
+  <fixtures>/<op>/<key>.json, where key is the id param (getBill,
+  getRollCall, getMasterListRaw, …), the state param (getSessionList,
+  getDatasetList) or "<state>_<query>" for getSearchRaw; <op>/default.json
+  matches any request for the op.  With --record URL, misses are forwarded
+  to the real API and OK responses saved as fixtures (the key is stripped
+  and never written to disk).
+
+GET /_stats returns per-op request counts and injected faults.
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+import urllib.parse
+import urllib.request
+import zipfile
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATES = ("CA", "US")
+FIRST_SESSION_ID = 2000
+# bill_id = session_id * BILL_ID_STRIDE + n, so a session can hold up to ~10M bills.
+BILL_ID_STRIDE = 10_000_000
+DATASET_DATE = "2025-06-01"
+
+_STATE_IDS = {"CA": 5, "NY": 32, "TX": 43, "US": 52}
+_STATE_NAMES = {"CA": "California", "NY": "New York", "TX": "Texas", "US": "US"}
+_BILL_PREFIX = {"CA": ("AB", "SB"), "US": ("HB", "S")}
+
+# Title vocabulary; includes the scanner's default keywords so getSearchRaw finds matches.
+_TOPICS = [
+    "water", "climate", "PFAS", "energy", "CEQA", "forest", "transportation",
+    "housing", "wildfire", "groundwater", "air quality", "public health",
+    "education", "broadband", "agriculture", "coastal protection",
+]
+_ACTIONS = [
+    "Introduced", "Read first time", "Referred to Committee", "From committee: Do pass",
+    "Read second time", "Read third time. Passed", "In Senate", "Enrolled",
+]
+_COMMITTEES = ["Natural Resources", "Appropriations", "Environmental Quality", "Transportation", "Energy"]
+
+
+def _hash(*parts) -> str:
+    return hashlib.md5(":".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+class SyntheticCorpus:
+    """Deterministic fake LegiScan data, generated on demand from a seed."""
+
+    def __init__(
+        self,
+        states: tuple[str, ...] = DEFAULT_STATES,
+        bills_per_session: int = 500,
+        rollcalls_per_bill: int = 2,
+        people_per_state: int = 120,
+        churn: float = 0.02,
+        seed: int = 1,
+    ):
+        self.states = tuple(s.upper() for s in states)
+        self.bills_per_session = bills_per_session
+        self.rollcalls_per_bill = rollcalls_per_bill
+        self.people_per_state = people_per_state
+        self.churn = churn
+        self.seed = seed
+        self._zip_lock = threading.Lock()
+        self._zips: dict[int, bytes] = {}
+
+    # ── Ids ───────────────────────────────────────────────────────────────────
+
+    def _rnd(self, *key) -> random.Random:
+        return random.Random(_hash(self.seed, *key))
+
+    def session_id(self, state: str) -> int:
+        return FIRST_SESSION_ID + self.states.index(state)
+
+    def _state_of_session(self, session_id: int) -> Optional[str]:
+        i = int(session_id) - FIRST_SESSION_ID
+        return self.states[i] if 0 <= i < len(self.states) else None
+
+    def bill_ids(self, session_id: int) -> range:
+        base = int(session_id) * BILL_ID_STRIDE
+        return range(base + 1, base + self.bills_per_session + 1)
+
+    def _locate_bill(self, bill_id: int) -> Optional[tuple[str, int, int]]:
+        session_id, n = divmod(int(bill_id), BILL_ID_STRIDE)
+        state = self._state_of_session(session_id)
+        if state is None or not 1 <= n <= self.bills_per_session:
+            return None
+        return state, session_id, n
+
+    def people_ids(self, state: str) -> range:
+        base = (self.states.index(state) + 1) * 10000
+        return range(base + 1, base + self.people_per_state + 1)
+
+    # ── Records ───────────────────────────────────────────────────────────────
+
+    def session(self, state: str) -> dict:
+        return {
+            "session_id": self.session_id(state),
+            "state_id": _STATE_IDS.get(state, 0),
+            "year_start": 2025,
+            "year_end": 2026,
+            "prefile": 0, "sine_die": 0, "prior": 0, "special": 0,
+            "session_tag": "Regular Session",
+            "session_title": "2025-2026 Regular Session",
+            "session_name": "2025-2026 Regular Session",
+        }
+
+    def dataset_hash(self, session_id: int) -> str:
+        return _hash(self.seed, "dataset", session_id, self.bills_per_session)
+
+    def change_hash(self, bill_id: int, current: bool = True) -> str:
+        moved = current and self._rnd("churn", bill_id).random() < self.churn
+        return _hash(self.seed, "bill", bill_id, 1 if moved else 0)
+
+    def person(self, people_id: int) -> dict:
+        rnd = self._rnd("person", people_id)
+        first, last = f"First{people_id % 997}", f"Last{people_id}"
+        senate = people_id % 3 == 0
+        return {
+            "people_id": people_id, "person_hash": _hash("p", people_id)[:8],
+            "party_id": 1, "party": rnd.choice("DDRI"),
+            "role_id": 2 if senate else 1, "role": "Sen" if senate else "Rep",
+            "name": f"{first} {last}", "first_name": first, "middle_name": "",
+            "last_name": last, "suffix": "", "nickname": "",
+            "district": f"{'SD' if senate else 'AD'}-{people_id % 80 + 1:03d}",
+            "committee_sponsor": 0, "committee_id": 0,
+        }
+
+    def bill(self, bill_id: int, current: bool = True) -> Optional[dict]:
+        loc = self._locate_bill(bill_id)
+        if loc is None:
+            return None
+        state, session_id, n = loc
+        rnd = self._rnd("bill", bill_id)
+        people = self.people_ids(state)
+        prefix = _BILL_PREFIX.get(state, ("HB", "SB"))[n % 2]
+        topics = rnd.sample(_TOPICS, 2)
+        n_actions = rnd.randint(1, len(_ACTIONS))
+        month = rnd.randint(1, 5)
+        history = [
+            {"date": f"2025-{month:02d}-{min(28, 1 + 3 * i):02d}", "action": a,
+             "chamber": "A" if i < 5 else "S", "chamber_id": 1, "importance": 1}
+            for i, a in enumerate(_ACTIONS[:n_actions])
+        ]
+        committee = {"committee_id": 100 + n % len(_COMMITTEES), "chamber": "A",
+                     "chamber_id": 1, "name": _COMMITTEES[n % len(_COMMITTEES)]}
+        sponsors = []
+        for order, pid in enumerate(rnd.sample(people, min(len(people), rnd.randint(1, 4))), 1):
+            p = self.person(pid)
+            sponsors.append({**p, "sponsor_type_id": 1 if order == 1 else 2, "sponsor_order": order})
+        return {
+            "bill_id": bill_id,
+            "change_hash": self.change_hash(bill_id, current),
+            "session_id": session_id,
+            "session": self.session(state),
+            "url": f"https://legiscan.com/{state}/bill/{prefix}{n}/2025",
+            "state_link": f"https://leginfo.example/{prefix}{n}",
+            "completed": 0,
+            "status": min(4, 1 + n_actions // 2),
+            "status_date": history[-1]["date"],
+            "state": state,
+            "state_id": _STATE_IDS.get(state, 0),
+            "bill_number": f"{prefix}{n}",
+            "bill_type": "B", "bill_type_id": "1",
+            "body": "A", "body_id": 1, "current_body": "A", "current_body_id": 1,
+            "title": f"An act relating to {topics[0]} and {topics[1]}",
+            "description": f"This bill would revise provisions governing {topics[0]} "
+                           f"and {topics[1]}. " * rnd.randint(1, 4),
+            "pending_committee_id": committee["committee_id"],
+            "committee": committee,
+            "referrals": [{"date": history[0]["date"], **committee}],
+            "history": history,
+            "sponsors": sponsors,
+            "sasts": [], "amendments": [], "supplements": [], "calendar": [],
+            "subjects": [{"subject_id": _TOPICS.index(t) + 1, "subject_name": t.title()} for t in topics],
+            "texts": [
+                {"doc_id": bill_id * 10 + k, "date": history[0]["date"], "type": "Introduced" if k == 1 else "Amended",
+                 "type_id": k, "mime": "text/html", "mime_id": 1,
+                 "url": f"https://legiscan.com/{state}/text/{prefix}{n}/id/{bill_id * 10 + k}",
+                 "state_link": "", "text_size": 4000}
+                for k in range(1, rnd.randint(1, 3) + 1)
+            ],
+            "votes": [self._vote_summary(bill_id, k) for k in range(1, self.rollcalls_per_bill + 1)],
+        }
+
+    def _vote_summary(self, bill_id: int, k: int) -> dict:
+        rnd = self._rnd("vote", bill_id, k)
+        yea = rnd.randint(20, 60)
+        nay = rnd.randint(0, 30)
+        return {
+            "roll_call_id": bill_id * 10 + k, "date": f"2025-0{rnd.randint(1, 6)}-15",
+            "desc": "Assembly Floor" if k % 2 else "Committee", "yea": yea, "nay": nay,
+            "nv": 0, "absent": 0, "total": yea + nay, "passed": int(yea > nay),
+            "chamber": "A", "chamber_id": 1,
+            "url": f"https://legiscan.com/rollcall/{bill_id * 10 + k}",
+        }
+
+    def roll_call(self, roll_call_id: int) -> Optional[dict]:
+        bill_id, k = divmod(int(roll_call_id), 10)
+        loc = self._locate_bill(bill_id)
+        if loc is None or not 1 <= k <= self.rollcalls_per_bill:
+            return None
+        summary = self._vote_summary(bill_id, k)
+        voters = list(self.people_ids(loc[0]))[: summary["total"]]
+        return {
+            **summary,
+            "bill_id": bill_id,
+            "votes": [
+                {"people_id": pid, "vote_id": 1 if i < summary["yea"] else 2,
+                 "vote_text": "Yea" if i < summary["yea"] else "Nay"}
+                for i, pid in enumerate(voters)
+            ],
+        }
+
+    def bill_text(self, doc_id: int) -> Optional[dict]:
+        bill_id, k = divmod(int(doc_id), 10)
+        bill = self.bill(bill_id)
+        if bill is None or not any(t["doc_id"] == doc_id for t in bill["texts"]):
+            return None
+        html = f"<html><body><h1>{bill['bill_number']}</h1><p>{bill['description']}</p></body></html>"
+        return {
+            "doc_id": doc_id, "bill_id": bill_id, "date": bill["texts"][0]["date"],
+            "type": "Introduced", "type_id": k, "mime": "text/html", "mime_id": 1,
+            "url": bill["texts"][0]["url"], "state_link": "", "text_size": len(html),
+            "text_hash": _hash(doc_id), "doc": base64.b64encode(html.encode("utf-8")).decode("ascii"),
+        }
+
+    def dataset_zip(self, session_id: int) -> Optional[bytes]:
+        """ZIP of every bill (at its dataset-time hash), roll call and person; built once per session."""
+        state = self._state_of_session(session_id)
+        if state is None:
+            return None
+        with self._zip_lock:
+            if session_id not in self._zips:
+                root = f"{state}/2025-2026_Regular_Session"
+                buf = io.BytesIO()
+                with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+                    for pid in self.people_ids(state):
+                        zf.writestr(f"{root}/people/{pid}.json", json.dumps({"person": self.person(pid)}))
+                    for bid in self.bill_ids(session_id):
+                        bill = self.bill(bid, current=False)
+                        zf.writestr(f"{root}/bill/{bill['bill_number']}.json", json.dumps({"bill": bill}))
+                        for v in bill["votes"]:
+                            rc = self.roll_call(v["roll_call_id"])
+                            zf.writestr(f"{root}/vote/{rc['roll_call_id']}.json", json.dumps({"roll_call": rc}))
+                self._zips[session_id] = buf.getvalue()
+            return self._zips[session_id]
+
+    # ── Op dispatch ───────────────────────────────────────────────────────────
+
+    def respond(self, params: dict) -> dict:
+        op = params.get("op", "")
+        handler = getattr(self, f"_op_{op}", None)
+        if handler is None:
+            return _error(f"Unknown op {op}")
+        try:
+            return handler(params)
+        except (KeyError, ValueError) as e:
+            return _error(f"Bad request: {e}")
+
+    def _op_getSessionList(self, params: dict) -> dict:
+        state = params["state"].upper()
+        sessions = [self.session(state)] if state in self.states else []
+        return {"status": "OK", "sessions": sessions}
+
+    def _op_getDatasetList(self, params: dict) -> dict:
+        state = params.get("state", "").upper()
+        datasets = []
+        for s in self.states:
+            if state and s != state:
+                continue
+            sid = self.session_id(s)
+            sess = self.session(s)
+            datasets.append({
+                "state_id": sess["state_id"], "session_id": sid, "special": 0,
+                "year_start": sess["year_start"], "year_end": sess["year_end"],
+                "session_name": sess["session_name"], "session_title": sess["session_title"],
+                "dataset_hash": self.dataset_hash(sid), "dataset_date": DATASET_DATE,
+                "dataset_size": 0, "access_key": _hash("access", sid)[:22],
+            })
+        return {"status": "OK", "datasetlist": datasets}
+
+    def _op_getDataset(self, params: dict) -> dict:
+        sid = int(params["id"])
+        if params.get("access_key") != _hash("access", sid)[:22]:
+            return _error("Invalid access key")
+        blob = self.dataset_zip(sid)
+        return {
+            "status": "OK",
+            "dataset": {
+                "state_id": _STATE_IDS.get(self._state_of_session(sid), 0), "session_id": sid,
+                "session_name": "2025-2026 Regular Session", "dataset_hash": self.dataset_hash(sid),
+                "dataset_date": DATASET_DATE, "dataset_size": len(blob), "mime": "application/zip",
+                "zip": base64.b64encode(blob).decode("ascii"),
+            },
+        }
+
+    def _op_getMasterListRaw(self, params: dict) -> dict:
+        sid = int(params["id"])
+        state = self._state_of_session(sid)
+        if state is None:
+            return _error("Unknown session id")
+        masterlist: dict = {"session": self.session(state)}
+        for i, bid in enumerate(self.bill_ids(sid)):
+            n = bid % BILL_ID_STRIDE
+            masterlist[str(i)] = {
+                "bill_id": bid,
+                "number": f"{_BILL_PREFIX.get(state, ('HB', 'SB'))[n % 2]}{n}",
+                "change_hash": self.change_hash(bid),
+            }
+        return {"status": "OK", "masterlist": masterlist}
+
+    def _op_getBill(self, params: dict) -> dict:
+        bill = self.bill(int(params["id"]))
+        return {"status": "OK", "bill": bill} if bill else _error("Unknown bill id")
+
+    def _op_getRollCall(self, params: dict) -> dict:
+        rc = self.roll_call(int(params["id"]))
+        return {"status": "OK", "roll_call": rc} if rc else _error("Unknown roll call id")
+
+    def _op_getBillText(self, params: dict) -> dict:
+        text = self.bill_text(int(params["id"]))
+        return {"status": "OK", "text": text} if text else _error("Unknown document id")
+
+    def _op_getSearchRaw(self, params: dict) -> dict:
+        query = params.get("query", "").strip().lower()
+        state = params.get("state", "").upper()
+        by_name = {v.upper(): k for k, v in _STATE_NAMES.items()}
+        state = by_name.get(state, state)
+        states = [state] if state in self.states else list(self.states)
+        results = []
+        for s in states:
+            for bid in self.bill_ids(self.session_id(s)):
+                bill = self.bill(bid)
+                if query and query not in bill["title"].lower():
+                    continue
+                results.append({
+                    "relevance": self._rnd("rel", bid, query).randint(50, 100),
+                    "state": s, "bill_number": bill["bill_number"], "bill_id": bid,
+                    "change_hash": bill["change_hash"], "url": bill["url"],
+                    "text_url": bill["texts"][0]["url"], "research_url": bill["url"],
+                    "last_action_date": bill["status_date"], "last_action": bill["history"][-1]["action"],
+                    "title": bill["title"],
+                })
+                if len(results) >= 2000:
+                    break
+        return {
+            "status": "OK",
+            "searchresult": {
+                "summary": {"page": "1", "range": f"1 - {len(results)}", "relevance": "100 - 50",
+                            "count": len(results), "page_current": 1, "page_total": 1, "query": query},
+                "results": results,
+            },
+        }
+
+
+def _error(message: str) -> dict:
+    return {"status": "ERROR", "alert": {"message": message}}
+
+
+# ── Fixtures ───────────────────────────────────────────────────────────────────
+
+def _fixture_key(params: dict) -> str:
+    if params.get("op") == "getSearchRaw":
+        return re.sub(r"[^A-Za-z0-9]+", "_", f"{params.get('state', 'ALL')}_{params.get('query', '')}").strip("_")
+    if params.get("id"):
+        return str(params["id"])
+    return params.get("state") or "default"
+
+
+class FixtureStore:
+    """Recorded responses on disk, optionally filled from the real API on a miss."""
+
+    def __init__(self, root: str, record_url: Optional[str] = None):
+        self.root = root
+        self.record_url = record_url
+
+    def _path(self, op: str, key: str) -> str:
+        return os.path.join(self.root, op, f"{key}.json")
+
+    def get(self, params: dict) -> Optional[dict]:
+        op = params.get("op", "")
+        for key in (_fixture_key(params), "default"):
+            path = self._path(op, key)
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+        if self.record_url:
+            return self._record(params)
+        return None
+
+    def _record(self, params: dict) -> Optional[dict]:
+        url = f"{self.record_url}?{urllib.parse.urlencode(params)}"
+        try:
+            with urllib.request.urlopen(url, timeout=180) as r:
+                data = json.loads(r.read())
+        except Exception as e:
+            logger.error(f"Recording {params.get('op')} failed: {e}")
+            return None
+        if data.get("status") == "OK":
+            path = self._path(params.get("op", ""), _fixture_key(params))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        return data
+
+
+# ── Server ─────────────────────────────────────────────────────────────────────
+
+class MockLegiScan:
+    """Request handling state shared by the server's threads: data, faults and counters."""
+
+    def __init__(
+        self,
+        corpus: Optional[SyntheticCorpus] = None,
+        fixtures: Optional[FixtureStore] = None,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        api_error_rate: float = 0.0,
+        seed: int = 1,
+    ):
+        self.corpus = corpus or SyntheticCorpus(seed=seed)
+        self.fixtures = fixtures
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.api_error_rate = api_error_rate
+        self._rnd = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests: Counter = Counter()
+        self.injected: Counter = Counter()
+
+    def handle(self, params: dict) -> tuple[int, dict, dict]:
+        """Return (http_status, extra_headers, json_body) for one API request."""
+        op = params.get("op", "")
+        with self._lock:
+            self.requests[op] += 1
+            roll = self._rnd.random()
+            delay = max(0.0, self.latency_ms + self._rnd.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+        if delay:
+            time.sleep(delay)
+
+        fault = None
+        if roll < self.throttle_rate:
+            fault = "429"
+        elif roll < self.throttle_rate + self.error_rate:
+            fault = "503"
+        elif roll < self.throttle_rate + self.error_rate + self.api_error_rate:
+            fault = "api_error"
+        if fault:
+            with self._lock:
+                self.injected[fault] += 1
+            if fault == "429":
+                return 429, {"Retry-After": "1"}, _error("Too many requests")
+            if fault == "503":
+                return 503, {}, _error("Service unavailable")
+            return 200, {}, _error("Injected API error")
+
+        data = self.fixtures.get(params) if self.fixtures else None
+        return 200, {}, data if data is not None else self.corpus.respond(params)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"requests": dict(self.requests), "injected": dict(self.injected)}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"    # keep-alive, like the real API
+
+    def do_GET(self) -> None:
+        mock: MockLegiScan = self.server.mock
+        parsed = urllib.parse.urlparse(self.path)
+        if parsed.path.rstrip("/") == "/_stats":
+            self._send(200, {}, mock.stats())
+            return
+        params = dict(urllib.parse.parse_qsl(parsed.query))
+        params.pop("key", None)
+        status, headers, body = mock.handle(params)
+        self._send(status, headers, body)
+
+    def _send(self, status: int, headers: dict, body: dict) -> None:
+        payload = json.dumps(body, separators=(",", ":")).encode("utf-8")
+        gzipped = "gzip" in self.headers.get("Accept-Encoding", "") and len(payload) > 1024
+        if gzipped:
+            payload = gzip.compress(payload, compresslevel=1)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, fmt: str, *args) -> None:
+        logger.debug(fmt % args)
+
+
+def make_server(host: str = "127.0.0.1", port: int = 0, mock: Optional[MockLegiScan] = None) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.mock = mock or MockLegiScan()
+    return server
+
+
+def start_in_thread(
+    host: str = "127.0.0.1", port: int = 0, mock: Optional[MockLegiScan] = None
+) -> tuple[ThreadingHTTPServer, str]:
+    """Serve in a daemon thread; returns (server, base_url).  Stop with server.shutdown()."""
+    server = make_server(host, port, mock)
+    threading.Thread(target=server.serve_forever, name="mock-legiscan", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local mock LegiScan API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--states", default=",".join(DEFAULT_STATES), help="Comma-separated state codes to synthesize")
+    parser.add_argument("--bills", type=int, default=500, help="Bills per session")
+    parser.add_argument("--rollcalls", type=int, default=2, help="Roll calls per bill")
+    parser.add_argument("--people", type=int, default=120, help="Legislators per state")
+    parser.add_argument("--churn", type=float, default=0.02, help="Fraction of bills changed since the dataset was built")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added delay per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +/- variation of the delay")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered HTTP 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered HTTP 429")
+    parser.add_argument("--api-error-rate", type=float, default=0.0, help="Fraction answered 200 with status ERROR")
+    parser.add_argument("--fixtures", help="Directory of recorded responses served in preference to synthetic ones")
+    parser.add_argument("--record", metavar="URL", help="With --fixtures: fetch misses from this API URL and save them")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    corpus = SyntheticCorpus(
+        states=tuple(s.strip().upper() for s in args.states.split(",") if s.strip()),
+        bills_per_session=args.bills, rollcalls_per_bill=args.rollcalls,
+        people_per_state=args.people, churn=args.churn, seed=args.seed,
+    )
+    fixtures = FixtureStore(args.fixtures, args.record) if args.fixtures else None
+    mock = MockLegiScan(
+        corpus, fixtures, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+        api_error_rate=args.api_error_rate, seed=args.seed,
+    )
+    server = make_server(args.host, args.port, mock)
+    logger.info(f"Mock LegiScan API on http://{args.host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
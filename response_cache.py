@@ -0,0 +1,149 @@
+# response_cache.py
+"""
+Persistent cache of LegiScan API responses.
+
+Payloads are stored zlib-compressed in a small SQLite file (by default
+DATA_DIR/response_cache.db, next to bills.db), keyed by op + id + version:
+
+  getBill      version = the bill's change_hash
+  getRollCall  version = ""   (a recorded roll call never changes)
+  getBillText  version = ""   (ids are doc_ids; a text document never changes)
+
+A caller that already knows the current change_hash (masterlist diff,
+getSearchRaw results, the corpus row) can therefore skip the network
+entirely.  Least-recently-used entries are evicted once the store grows past
+max_bytes.  Hit/miss counters are kept per process.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS responses (
+    key       TEXT PRIMARY KEY,
+    op        TEXT NOT NULL,
+    payload   BLOB NOT NULL,
+    size      INTEGER NOT NULL,
+    stored_at REAL,
+    last_used REAL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used);
+"""
+
+# Eviction trims down to this fraction of max_bytes so it doesn't run on every put.
+_EVICT_TARGET = 0.9
+
+_shared: dict[str, "ResponseCache"] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_cache(path: str, max_bytes: int = 512 * 1024 ** 2) -> "ResponseCache":
+    """One ResponseCache per file per process, shared by corpus and scanner."""
+    path = os.path.abspath(path)
+    with _shared_lock:
+        if path not in _shared:
+            _shared[path] = ResponseCache(path, max_bytes=max_bytes)
+        return _shared[path]
+
+
+class ResponseCache:
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 ** 2):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Used from getBill / getRollCall fetch threads; every access holds _lock.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_DDL)
+        self._conn.commit()
+        self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def _key(op: str, item_id, version: str = "") -> str:
+        return f"{op}:{item_id}:{version or ''}"
+
+    # ── Lookup / store ────────────────────────────────────────────────────────
+
+    def get(self, op: str, item_id, version: str = "") -> Optional[dict]:
+        """Cached response for (op, id, version), or None (counted as a miss)."""
+        key = self._key(op, item_id, version)
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload FROM responses WHERE key=?", (key,)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                self._conn.execute(
+                    "UPDATE responses SET last_used=? WHERE key=?", (time.time(), key)
+                )
+                self._conn.commit()
+                self.hits += 1
+            return json.loads(zlib.decompress(row[0]))
+        except Exception as e:
+            logger.error(f"Response cache read failed for {key}: {e}")
+            return None
+
+    def put(self, op: str, item_id, version: str, payload: dict) -> None:
+        """Store a successful response, evicting old entries if over budget."""
+        key = self._key(op, item_id, version)
+        try:
+            blob = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), 6)
+            now = time.time()
+            with self._lock:
+                old = self._conn.execute(
+                    "SELECT size FROM responses WHERE key=?", (key,)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, op, payload, size, stored_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, op, blob, len(blob), now, now),
+                )
+                self._total += len(blob) - (old[0] if old else 0)
+                if self._total > self.max_bytes:
+                    self._evict()
+                self._conn.commit()
+        except Exception as e:
+            logger.error(f"Response cache write failed for {key}: {e}")
+
+    def discard(self, op: str, item_id, version: str = "") -> None:
+        key = self._key(op, item_id, version)
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM responses WHERE key=?", (key,)).fetchone()
+            if row:
+                self._conn.execute("DELETE FROM responses WHERE key=?", (key,))
+                self._conn.commit()
+                self._total -= row[0]
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": self._total}
+
+    # ── Eviction ──────────────────────────────────────────────────────────────
+
+    def _evict(self) -> None:
+        target = self.max_bytes * _EVICT_TARGET
+        doomed: list[tuple[str]] = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_used"):
+            if self._total <= target:
+                break
+            doomed.append((key,))
+            self._total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key=?", doomed)
+        if doomed:
+            logger.info(f"Response cache: evicted {len(doomed)} entries")
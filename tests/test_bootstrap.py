@@ -0,0 +1,36 @@
+"""Multi-session bootstrap against the mock LegiScan server."""
+import pytest
+
+import legiscan_client
+import mock_legiscan
+from corpus_manager import CorpusManager
+
+STATES = tuple(f"S{i:02d}" for i in range(8))
+
+
+@pytest.fixture
+def mock_api():
+    synth = mock_legiscan.SyntheticCorpus(states=STATES, bills_per_session=200, rollcalls_per_bill=1)
+    server, url = mock_legiscan.start_in_thread(mock=mock_legiscan.MockLegiScan(synth, latency_ms=5))
+    previous = legiscan_client.BASE_URL
+    legiscan_client.set_base_url(url)
+    yield synth
+    legiscan_client.set_base_url(previous)
+    server.shutdown()
+    server.server_close()
+
+
+def test_downloads_waiting_to_be_ingested_survive_eviction(mock_api, tmp_path):
+    # A zero-byte cache evicts on every put(); only pinning keeps pending ZIPs.
+    corpus = CorpusManager(
+        str(tmp_path / "bills.db"), "test", rate_limit_s=0,
+        dataset_cache_dir=str(tmp_path / "dataset_cache"), dataset_cache_max_mb=0,
+        response_cache_path=str(tmp_path / "response_cache.db"),
+    )
+    try:
+        totals = corpus.bootstrap_many([(s, mock_api.session_id(s)) for s in STATES], max_downloads=4)
+    finally:
+        corpus.close()
+    assert totals["errors"] == 0
+    assert totals["fallback"] == 0
+    assert totals["new"] == len(STATES) * 200
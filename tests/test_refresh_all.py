@@ -0,0 +1,57 @@
+"""Refresh-all API call accounting, checked against the mock LegiScan server."""
+
+import pytest
+
+import legiscan_client
+import mock_legiscan
+from corpus_manager import CorpusManager
+from job_manager import JobManager
+from job_runner import run_refresh_all_job
+
+STATES = tuple(f"S{i:02d}" for i in range(40))
+
+
+def _serve(tmp_path, **mock_kwargs):
+    synth = mock_legiscan.SyntheticCorpus(states=STATES, bills_per_session=5, rollcalls_per_bill=1)
+    mock = mock_legiscan.MockLegiScan(synth, latency_ms=5, **mock_kwargs)
+    server, url = mock_legiscan.start_in_thread(mock=mock)
+    corpus = CorpusManager(
+        str(tmp_path / "bills.db"), "test", rate_limit_s=0, fetch_workers=4,
+        dataset_cache_dir=str(tmp_path / "dataset_cache"),
+        response_cache_path=str(tmp_path / "response_cache.db"),
+    )
+    conn = corpus._get_conn()
+    conn.executemany(
+        "INSERT INTO sessions (session_id, jurisdiction, session_name, year_start, year_end, is_active) "
+        "VALUES (?, ?, ?, 2025, 2026, 1)",
+        [(synth.session_id(s), s, "2025-2026 Regular Session") for s in STATES],
+    )
+    conn.commit()
+    return server, url, mock, corpus
+
+
+@pytest.fixture
+def mock_api(request, tmp_path):
+    server, url, mock, corpus = _serve(tmp_path, **getattr(request, "param", {}))
+    previous = legiscan_client.BASE_URL
+    legiscan_client.set_base_url(url)
+    yield mock, corpus, JobManager(str(tmp_path / "jobs.db"))
+    legiscan_client.set_base_url(previous)
+    corpus.close()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("mock_api", [{}, {"api_error_rate": 0.1}], indirect=True)
+def test_child_jobs_record_the_calls_the_server_received(mock_api):
+    mock, corpus, jobs = mock_api
+    totals = run_refresh_all_job(corpus, jobs)
+
+    parent = jobs.get_recent_jobs(1)[0]
+    children = jobs.get_child_jobs(parent["job_id"])
+    received = sum(mock.stats()["requests"].values())
+
+    assert len(children) == len(STATES)
+    assert sum(c["api_calls"] for c in children) == received
+    assert totals["api_calls"] == received
+    assert parent["api_calls"] == 0
@@ -0,0 +1,65 @@
+"""Full-text search: query parsing and bill-number ranking."""
+import pytest
+
+from corpus_manager import CorpusManager, _fts_query
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("AB 12", '"AB12" OR "AB12"*'),
+    ("A.B. 12", '"AB12" OR "AB12"*'),
+    ("H. B. 12", '"HB12" OR "HB12"*'),
+    ("SB-5", '"SB5" OR "SB5"*'),
+    ("HJR 1", '"HJR1" OR "HJR1"*'),
+    ("AB123", '"AB123" OR "AB123"*'),
+])
+def test_bill_numbers_are_joined(query, expected):
+    assert _fts_query(query) == expected
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("covid 19", '"covid"* "19"*'),
+    ("budget 2024", '"budget"* "2024"*'),
+    ("Title 42", '"Title"* "42"*'),
+    ("water rights", '"water"* "rights"*'),
+])
+def test_word_and_number_stay_separate_terms(query, expected):
+    assert _fts_query(query) == expected
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    corpus = CorpusManager(
+        str(tmp_path / "bills.db"), "test",
+        dataset_cache_dir=str(tmp_path / "dataset_cache"),
+        response_cache_path=str(tmp_path / "response_cache.db"),
+    )
+    conn = corpus._get_conn()
+    conn.execute(
+        "INSERT INTO sessions (session_id, jurisdiction, session_name, is_active) "
+        "VALUES (1, 'CA', '2025-2026 Regular Session', 1)"
+    )
+    conn.executemany(
+        "INSERT INTO bills (bill_id, session_id, jurisdiction, bill_number, title, status_date) "
+        "VALUES (?, 1, 'CA', ?, ?, ?)",
+        [
+            (1, "AB126", "An act relating to water", "2025-03-01"),
+            (2, "AB124", "An act relating to housing", "2025-02-01"),
+            (3, "AB12", "An act relating to energy", "2025-01-01"),
+            (4, "SB12", "An act relating to covid 19 relief", "2025-01-15"),
+        ],
+    )
+    corpus._commit(conn)
+    yield corpus
+    corpus.close()
+
+
+@pytest.mark.parametrize("query", ["AB 12", "A.B. 12", "AB-12", "AB12"])
+def test_exact_bill_number_ranks_first(corpus, query):
+    page = corpus.search_bills(query=query)
+    assert page["bill_number"].iloc[0] == "AB12"
+    assert set(page["bill_number"]) == {"AB12", "AB124", "AB126"}
+
+
+def test_word_and_number_query_finds_text(corpus):
+    page = corpus.search_bills(query="covid 19")
+    assert list(page["bill_number"]) == ["SB12"]